@@ -1,5 +1,4 @@
 from PyQt6.QtSvgWidgets import QGraphicsSvgItem
-from PyQt6.QtSvg import QSvgRenderer
 
 from typing import TYPE_CHECKING
 
@@ -46,7 +45,9 @@ class ElementalGlyph(QGraphicsSvgItem):
         svg_path: str = SVG_PATHS.get(vtg_mode, "")
         if not svg_path:
             return
-        self.renderer = QSvgRenderer(svg_path)
+        self.renderer = (
+            self.pictograph.main_widget.svg_manager.cache_manager.get_renderer(svg_path)
+        )
         if self.renderer.isValid():
             self.setSharedRenderer(self.renderer)
             if not self.scene():
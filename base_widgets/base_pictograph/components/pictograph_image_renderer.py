@@ -1,109 +1,98 @@
 from typing import TYPE_CHECKING
 from PyQt6.QtGui import QImage, QPainter, QPixmap
-from PyQt6.QtCore import QByteArray, QBuffer
-import os
+from PyQt6.QtCore import QRectF, Qt
+from PyQt6.QtWidgets import QGraphicsPixmapItem, QGraphicsScene
 
 if TYPE_CHECKING:
     from base_widgets.base_pictograph.base_pictograph import BasePictograph
 
-from PyQt6.QtWidgets import QGraphicsPixmapItem
-
 
 class PictographImageRenderer:
-    def __init__(self, pictograph: "BasePictograph") -> None:
-        self.pictograph = pictograph
+    """
+    Renders the pictograph to an image, and lets read-only views show a
+    cached raster of it instead of the live scene.
 
-    def render_and_cache_image(self) -> None:
-        image_path = self.pictograph.main_widget.generate_image_path(self.pictograph)
-        if os.path.isfile(image_path):
-            pixmap = self.pictograph.main_widget.get_cached_pixmap(image_path)
-            if pixmap is None:
-                pixmap = QPixmap(image_path)
-                self.pictograph.main_widget.cache_image(image_path, pixmap)
-            print(f"Using cached image for {image_path}")
-        else:
-            pixmap = self._render_scene_to_pixmap()
-            self.pictograph.main_widget.cache_image(image_path, pixmap)
-            if not os.path.exists(image_path):
-                pixmap.save(image_path, "PNG")
-        self._update_thumbnail(pixmap)
+    With the raster enabled, the view is pointed at a scene holding a single
+    pixmap while the live scene keeps its items, so the view can be switched
+    back for editing at any time. Until the raster for the pictograph's
+    current state is ready the live scene is shown.
+    """
 
-    def _update_thumbnail(self, pixmap: QPixmap) -> None:
-        if not self.pictograph.pixmap:
-            self.pictograph.pixmap = QGraphicsPixmapItem(pixmap)
-            self.pictograph.addItem(self.pictograph.pixmap)
+    def __init__(self, pictograph: "BasePictograph") -> None:
+        self.pictograph = pictograph
+        self.raster_enabled = False
+        self.raster_key: str = None
+        self.raster_scene: QGraphicsScene = None
+        self.pixmap_item: QGraphicsPixmapItem = None
+        self.pictograph.image_loaded = False
+
+    def enable_raster(self) -> None:
+        self.raster_enabled = True
+        self.refresh()
+
+    def disable_raster(self) -> None:
+        self.raster_enabled = False
+        self.raster_key = None
+        self._set_view_scene(self.pictograph)
+
+    def refresh(self) -> None:
+        """Show the raster matching the pictograph's current state."""
+        if not self.raster_enabled or not getattr(
+            self.pictograph, "pictograph_dict", None
+        ):
+            return
+        raster_cache = self.pictograph.main_widget.pictograph_raster_cache
+        self.raster_key = raster_cache.get_cache_key(self.pictograph)
+        pixmap = raster_cache.request(self.pictograph, self.raster_key)
+        if pixmap is None:
+            self._set_view_scene(self.pictograph)
         else:
-            self.pictograph.pixmap.setPixmap(pixmap)
-        self.pictograph.image_loaded = True
-
-    def _render_scene_to_pixmap(self) -> QPixmap:
-        self.pictograph.updater.update_pictograph(self.pictograph.pictograph_dict)
-
-        prop_type = self.pictograph.main_widget.prop_type
-        letter = self.pictograph.letter
-        letter_type = self.pictograph.get.letter_type(letter)
-
-        basic_turns_string = (
-            f"{self.pictograph.blue_motion.turns},"
-            f"{self.pictograph.red_motion.turns}"
-        )
-        start_to_end_string = f"{self.pictograph.start_pos}→{self.pictograph.end_pos}"
-        image_dir = os.path.join(
-            "images",
-            "pictographs",
-            prop_type,
-            basic_turns_string,
-            letter_type,
-            letter,
-            start_to_end_string,
-        )
-        os.makedirs(image_dir, exist_ok=True)
-
-        blue_turns = self.pictograph.blue_motion.turns
-        red_turns = self.pictograph.red_motion.turns
-        blue_end_ori = self.pictograph.blue_motion.end_ori
-        red_end_ori = self.pictograph.red_motion.end_ori
-
-        image_name = (
-            f"{letter}_"
-            f"({start_to_end_string})_"
-            f"({self.pictograph.blue_motion.motion_type}_{self.pictograph.blue_motion.start_loc}"
-            f"→{self.pictograph.blue_motion.end_loc}_{blue_turns}_"
-            f"{self.pictograph.blue_motion.start_ori}→{blue_end_ori})_"
-            f"({self.pictograph.red_motion.motion_type}_{self.pictograph.red_motion.start_loc}"
-            f"→{self.pictograph.red_motion.end_loc}_{red_turns}_"
-            f"{self.pictograph.red_motion.start_ori}→{red_end_ori})_"
-            f"{prop_type}.png"
-        )
-
-        image_path = os.path.join(image_dir, image_name).replace("\\", "/")
-        image = QImage(
-            int(self.pictograph.width()),
-            int(self.pictograph.height()),
-            QImage.Format.Format_ARGB32,
-        )
+            self.show_raster(pixmap)
+
+    def show_raster(self, pixmap: QPixmap) -> None:
+        if self.raster_scene is None:
+            self.raster_scene = QGraphicsScene(self.pictograph.sceneRect())
+            self.raster_scene.setBackgroundBrush(self.pictograph.backgroundBrush())
+            self.pixmap_item = QGraphicsPixmapItem()
+            self.pixmap_item.setTransformationMode(
+                Qt.TransformationMode.SmoothTransformation
+            )
+            self.raster_scene.addItem(self.pixmap_item)
+        self.pixmap_item.setPixmap(pixmap)
+        self.pixmap_item.setScale(self.pictograph.width() / pixmap.width())
+        self._set_view_scene(self.raster_scene)
+
+    def render_image(self, size: int) -> QImage:
+        """Paint the live scene, without view overlays, into a size x size image."""
+        overlays = [
+            overlay
+            for overlay in self.pictograph.view.overlay_items
+            if overlay.scene() is self.pictograph and overlay.isVisible()
+        ]
+        for overlay in overlays:
+            overlay.hide()
+
+        image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(Qt.GlobalColor.transparent)
         painter = QPainter(image)
-        self.pictograph.render(painter)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform)
+        self.pictograph.render(
+            painter, QRectF(0, 0, size, size), self.pictograph.sceneRect()
+        )
         painter.end()
 
-        if not image.isNull():
-            buffer = QByteArray()
-            buf = QBuffer(buffer)
-            buf.open(QBuffer.OpenModeFlag.WriteOnly)
-            success = image.save(buf, "PNG")
-            buf.close()
-
-            if success:
-                with open(image_path, "w", encoding="utf-8") as file:
-                    file.write(buffer.decode("utf-8"))
-                print(f"Image saved successfully to {image_path}")
-            else:
-                print(f"Failed to save the image to {image_path}")
-        else:
-            print("QImage is null. Nothing to save.")
-
-        return QPixmap.fromImage(image)
-
-    def load_image_if_needed(self) -> None:
-        if not self.pictograph.image_loaded:
-            self.render_and_cache_image()
+        for overlay in overlays:
+            overlay.show()
+        return image
+
+    def _set_view_scene(self, scene: QGraphicsScene) -> None:
+        view = self.pictograph.view
+        self.pictograph.image_loaded = scene is self.raster_scene
+        if view.scene() is scene:
+            return
+        for overlay in view.overlay_items:
+            if overlay.scene() is not None:
+                overlay.scene().removeItem(overlay)
+            scene.addItem(overlay)
+        view.setScene(scene)
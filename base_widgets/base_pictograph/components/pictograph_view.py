@@ -18,6 +18,7 @@ class PictographView(QGraphicsView):
         super().__init__(pictograph)
         self.pictograph = pictograph
         self.original_style = ""
+        self.overlay_items: list[QGraphicsRectItem] = []
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
@@ -76,6 +77,13 @@ class PictographView(QGraphicsView):
         overlay.setBrush(QBrush(QColor(color)))
         overlay.setOpacity(0.5)
         self.scene().addItem(overlay)
+        self.overlay_items.append(overlay)
+
+    def clear_overlays(self) -> None:
+        for overlay in self.overlay_items:
+            if overlay.scene() is not None:
+                overlay.scene().removeItem(overlay)
+        self.overlay_items.clear()
 
     def set_enabled(self, enabled: bool) -> None:
         self._ignoreMouseEvents = not enabled
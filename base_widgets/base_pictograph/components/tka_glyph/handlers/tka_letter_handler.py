@@ -1,5 +1,4 @@
 from PyQt6.QtSvgWidgets import QGraphicsSvgItem
-from PyQt6.QtSvg import QSvgRenderer
 from PyQt6.QtWidgets import QGraphicsTextItem
 from PyQt6.QtGui import QFont
 from Enums.Enums import LetterType
@@ -40,7 +39,8 @@ class TKALetterHandler:
         self.glyph.pictograph.letter_type = letter_type
         svg_path: str = SVG_PATHS.get(letter_type, "")
         svg_path = svg_path.format(letter=self.glyph.pictograph.letter.value)
-        self.renderer = QSvgRenderer(svg_path)
+        cache_manager = self.glyph.pictograph.main_widget.svg_manager.cache_manager
+        self.renderer = cache_manager.get_renderer(svg_path)
         if self.renderer.isValid():
             self.letter_item.setSharedRenderer(self.renderer)
             self.position_letter()
@@ -63,7 +63,9 @@ class VTG_Glyph(QGraphicsSvgItem):
         vtg_mode = self.determine_vtg_mode()
         self.pictograph.vtg_mode = vtg_mode
         svg_path: str = SVG_PATHS.get(vtg_mode, "")
-        self.renderer: QSvgRenderer = QSvgRenderer(svg_path)
+        self.renderer: QSvgRenderer = (
+            self.pictograph.main_widget.svg_manager.cache_manager.get_renderer(svg_path)
+        )
         if self.renderer.isValid():
             self.setSharedRenderer(self.renderer)
             # if self isn't already in self.pictograph, then add it
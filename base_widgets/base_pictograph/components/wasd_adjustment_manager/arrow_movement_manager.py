@@ -1,15 +1,11 @@
 from typing import TYPE_CHECKING
 from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QApplication
 
 
 if TYPE_CHECKING:
     from base_widgets.base_pictograph.base_pictograph import BasePictograph
 
 
-from PyQt6.QtCore import Qt
-
-
 class ArrowMovementManager:
     def __init__(self, pictograph: "BasePictograph") -> None:
         self.pictograph = pictograph
@@ -31,25 +27,16 @@ class ArrowMovementManager:
 
         adjustment = self.get_adjustment(key, adjustment_increment)
 
-        self.data_updater.update_arrow_adjustments_in_json(
-            adjustment, self.pictograph.selected_arrow
-        )
+        selected_arrow = pictograph.selected_arrow
+        self.data_updater.update_arrow_adjustments_in_json(adjustment, selected_arrow)
         self.data_updater.mirrored_entry_manager.update_mirrored_entry_in_json(
-            self.pictograph.selected_arrow
+            selected_arrow
         )
         pictograph.arrow_placement_manager.update_arrow_placements()
-        QApplication.processEvents()
-        visible_pictographs = self.get_visible_pictographs()
-        for pictograph in visible_pictographs:
-            pictograph.arrow_placement_manager.update_arrow_placements()
-
-    def get_visible_pictographs(self) -> list["BasePictograph"]:
-        visible_pictographs = []
-        for pictograph_list in self.pictograph.main_widget.pictograph_cache.values():
-            for pictograph in pictograph_list.values():
-                if pictograph.view.isVisible():
-                    visible_pictographs.append(pictograph)
-        return visible_pictographs
+        editing_session = self.data_updater.editing_session
+        editing_session.update_matching_pictographs(
+            pictograph.letter, editing_session.get_affected_turns_tuples(selected_arrow)
+        )
 
     def get_adjustment(self, key, increment) -> tuple[int, int]:
         direction_map = {
@@ -0,0 +1,128 @@
+"""
+Re-export every dictionary sequence as a sequence card image.
+
+Rendering is spread over a process pool; each worker starts its own offscreen
+QApplication and main window once and then renders cards until the queue is
+empty. The parent process encodes the PNGs on the writer stage, skips cards
+whose source metadata hash is unchanged and reports throughput.
+
+    python export_sequence_cards.py --workers 6
+    python export_sequence_cards.py --force
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+
+from main_window.main_widget.dictionary_index.dictionary_metadata_index import (
+    DictionaryMetadataIndex,
+)
+from main_window.main_widget.sequence_card_tab.sequence_card_export_manifest import (
+    SequenceCardExportManifest,
+)
+from main_window.main_widget.sequence_card_tab.sequence_card_image_exporter import (
+    SequenceCardImageExporter,
+)
+from main_window.main_widget.sequence_card_tab.sequence_card_image_writer import (
+    SequenceCardImageWriter,
+)
+from utilities.path_helpers import (
+    get_dictionary_path,
+    get_sequence_card_image_exporter_path,
+)
+
+_worker_app = None
+_worker_exporter: SequenceCardImageExporter = None
+
+
+def _init_worker() -> None:
+    """Build one offscreen application per worker process."""
+    global _worker_app, _worker_exporter
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+    from PyQt6.QtWidgets import QApplication
+    from main_window.main_window import MainWindow
+    from main_window.settings_manager.settings_manager import SettingsManager
+    from profiler import Profiler
+    from splash_screen import SplashScreen
+
+    _worker_app = QApplication([])
+    splash_screen = SplashScreen(_worker_app.primaryScreen(), SettingsManager(None))
+    main_window = MainWindow(Profiler(), splash_screen)
+    splash_screen.close()
+    _worker_exporter = SequenceCardImageExporter(
+        main_window.main_widget.dictionary_widget
+    )
+
+
+def _render_card(task: tuple[str, dict, str]) -> tuple:
+    image_filename, metadata, source_hash = task
+    rgba_data, width, height = _worker_exporter.render_card(metadata["sequence"])
+    return image_filename, rgba_data, width, height, metadata, source_hash
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--workers", type=int, default=max(1, (os.cpu_count() or 2) - 1)
+    )
+    parser.add_argument(
+        "--writer-threads", type=int, default=None, help="PNG encoder threads"
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="Re-export cards even if unchanged"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    export_path = get_sequence_card_image_exporter_path()
+    manifest = SequenceCardExportManifest(export_path)
+    if args.force:
+        manifest.clear()
+
+    start_time = time.perf_counter()
+    metadata_index = DictionaryMetadataIndex()
+    tasks, skipped = SequenceCardImageExporter.collect_export_tasks(
+        SequenceCardImageExporter.get_all_images(get_dictionary_path()),
+        metadata_index,
+        manifest,
+    )
+    metadata_index.save()
+
+    writer = SequenceCardImageWriter(export_path, manifest, args.writer_threads)
+    try:
+        if tasks:
+            context = multiprocessing.get_context("spawn")
+            workers = max(1, min(args.workers, len(tasks)))
+            with context.Pool(workers, initializer=_init_worker) as pool:
+                results = pool.imap_unordered(_render_card, tasks)
+                for (
+                    image_filename,
+                    rgba_data,
+                    width,
+                    height,
+                    metadata,
+                    source_hash,
+                ) in results:
+                    writer.submit(
+                        image_filename,
+                        rgba_data,
+                        width,
+                        height,
+                        SequenceCardImageExporter.stamp_export_date(metadata),
+                        source_hash,
+                    )
+    finally:
+        writer.finish()
+
+    print(writer.summary(skipped, time.perf_counter() - start_time))
+    return 1 if writer.failed else 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+List dictionary variations that duplicate each other.
+
+Variations are grouped by the structural fingerprint kept in the dictionary
+metadata index (same motions, ignoring turns and orientations), or by the
+turn pattern fingerprint with --turn-pattern. Only images that changed since
+the index was last written are decoded.
+
+    python find_duplicate_variations.py
+    python find_duplicate_variations.py --turn-pattern
+"""
+
+import argparse
+import os
+import sys
+from collections import defaultdict
+
+from main_window.main_widget.dictionary_index.dictionary_metadata_index import (
+    DictionaryMetadataIndex,
+)
+from utilities.path_helpers import get_images_and_data_path
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--turn-pattern",
+        action="store_true",
+        help="Group by turns and orientations instead of by structure",
+    )
+    parser.add_argument("--dictionary", default=get_images_and_data_path("dictionary"))
+    return parser.parse_args(argv)
+
+
+def find_duplicate_groups(
+    index: DictionaryMetadataIndex, dictionary_dir: str, fingerprint_type: str
+) -> list[list[str]]:
+    groups: dict[str, list[str]] = defaultdict(list)
+    for root, _, files in os.walk(dictionary_dir):
+        if "__pycache__" in root:
+            continue
+        for file in files:
+            if not file.endswith((".png", ".jpg", ".jpeg")):
+                continue
+            file_path = os.path.join(root, file)
+            try:
+                fingerprints = index.get_fingerprints(file_path)
+            except Exception as e:
+                print(f"Skipping {file_path}: {e}", file=sys.stderr)
+                continue
+            if fingerprints:
+                groups[fingerprints[fingerprint_type]].append(file_path)
+    return sorted(sorted(group) for group in groups.values() if len(group) > 1)
+
+
+def main(argv: list[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    fingerprint_type = "turn_pattern" if args.turn_pattern else "structural"
+
+    index = DictionaryMetadataIndex()
+    groups = find_duplicate_groups(index, args.dictionary, fingerprint_type)
+    index.save()
+
+    for number, group in enumerate(groups, start=1):
+        print(f"Group {number}:")
+        for file_path in group:
+            print(f"    {os.path.relpath(file_path, args.dictionary)}")
+    print(f"Found {len(groups)} duplicate groups", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+Generate sequences without starting the GUI and write them as JSON lines.
+
+Each line is a sequence in the same format as current_sequence.json.
+
+    python generate_sequences.py --count 1000 --length 16 --level 2 --seed 7
+    python generate_sequences.py --mode circular --permutation-type rotated \
+        --rotation-type quartered --length 16 --output sequences.jsonl
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+
+from Enums.letters import LetterType
+from data.constants import BOX, DIAMOND
+from main_window.main_widget.pcitograph_dict_loader import PictographDictLoader
+from main_window.main_widget.top_builder_widget.sequence_builder.auto_builder.sequence_generator import (
+    SequenceGenerator,
+)
+
+MAX_ATTEMPTS_PER_SEQUENCE = 20
+
+
+def parse_args(argv: list[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--length", type=int, default=8)
+    parser.add_argument("--level", type=int, choices=[1, 2, 3], default=1)
+    parser.add_argument("--turn-intensity", type=float, default=1)
+    parser.add_argument("--mode", choices=["freeform", "circular"], default="freeform")
+    parser.add_argument(
+        "--permutation-type", choices=["rotated", "mirrored"], default="rotated"
+    )
+    parser.add_argument(
+        "--rotation-type", choices=["quartered", "halved"], default="halved"
+    )
+    parser.add_argument("--grid-mode", choices=[DIAMOND, BOX], default=DIAMOND)
+    parser.add_argument(
+        "--letter-types",
+        default=",".join(letter_type.name for letter_type in LetterType),
+        help="Comma-separated letter types for freeform mode, e.g. Type1,Type2",
+    )
+    parser.add_argument("--continuous-rot-dir", action="store_true")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--output", default="-", help="File path, or - for stdout")
+    return parser.parse_args(argv)
+
+
+def generate_sequence(generator: SequenceGenerator, args: argparse.Namespace):
+    """Build one sequence, retrying when a random choice runs out of options."""
+    letter_types = [LetterType[name.strip()] for name in args.letter_types.split(",")]
+    for _ in range(MAX_ATTEMPTS_PER_SEQUENCE):
+        try:
+            if args.mode == "freeform":
+                return generator.generate_freeform_sequence(
+                    args.length,
+                    args.level,
+                    args.turn_intensity,
+                    args.continuous_rot_dir,
+                    letter_types,
+                    args.grid_mode,
+                )
+            return generator.generate_circular_sequence(
+                args.length,
+                args.level,
+                args.turn_intensity,
+                args.rotation_type,
+                args.permutation_type,
+                args.continuous_rot_dir,
+                args.grid_mode,
+            )
+        except (IndexError, ValueError):
+            continue
+    return None
+
+
+def main(argv: list[str] = None) -> int:
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+    if args.seed is not None:
+        random.seed(args.seed)
+
+    dataset = PictographDictLoader(None).load_pictograph_dataset()
+    generator = SequenceGenerator(dataset)
+
+    output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    generated = 0
+    start_time = time.perf_counter()
+    try:
+        for _ in range(args.count):
+            sequence = generate_sequence(generator, args)
+            if sequence is None:
+                continue
+            output.write(json.dumps(sequence, ensure_ascii=False) + "\n")
+            generated += 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    elapsed = time.perf_counter() - start_time
+    rate = generated / elapsed if elapsed else 0
+    print(
+        f"Generated {generated}/{args.count} sequences in {elapsed:.2f}s "
+        f"({rate:.0f} per second)",
+        file=sys.stderr,
+    )
+    return 0 if generated == args.count else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
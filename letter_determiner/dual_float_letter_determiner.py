@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 from Enums.letters import Letter
-from data.constants import COUNTER_CLOCKWISE, CLOCKWISE
+from data.constants import COUNTER_CLOCKWISE, CLOCKWISE, END_LOC, PROP_ROT_DIR, START_LOC
 
 if TYPE_CHECKING:
     from .letter_determiner import LetterDeterminer
@@ -12,12 +12,16 @@ class DualFloatLetterDeterminer:
     def __init__(self, letter_engine: "LetterDeterminer"):
         self.main_widget = letter_engine.main_widget
         self.letters = letter_engine.letters
+        self.signature_index = letter_engine.signature_index
 
     def determine_letter(self, motion: "Motion") -> Letter:
         """Handle the motion attributes for dual float motions."""
         other_motion = motion.pictograph.get.other_motion(motion)
         self._update_prefloat_attributes(motion, other_motion)
-        return self._find_matching_letter(motion)
+        other_prefloat_prop_rot_dir = self._get_prefloat_prop_rot_dir(
+            self._get_json_index_for_current_beat(), other_motion
+        )
+        return self._find_matching_letter(motion, other_prefloat_prop_rot_dir)
 
     def _update_prefloat_attributes(
         self, motion: "Motion", other_motion: "Motion"
@@ -55,26 +59,20 @@ class DualFloatLetterDeterminer:
     def _get_opposite_rotation_direction(self, rotation_direction: str) -> str:
         return COUNTER_CLOCKWISE if rotation_direction == CLOCKWISE else CLOCKWISE
 
-    def _find_matching_letter(self, motion: "Motion") -> Letter:
-        for letter, examples in self.letters.items():
-            for example in examples:
-                if self._compare_motion_attributes(motion, example):
-                    return letter
-        return None
-
-    def _compare_motion_attributes(self, motion: "Motion", example) -> bool:
+    def _find_matching_letter(
+        self, motion: "Motion", other_prefloat_prop_rot_dir: str
+    ) -> Letter:
         other_motion = motion.pictograph.get.other_motion(motion)
-        return (
-            example[f"{motion.color}_attributes"]["start_loc"] == motion.start_loc
-            and example[f"{motion.color}_attributes"]["end_loc"] == motion.end_loc
-            and example[f"{motion.color}_attributes"]["prop_rot_dir"]
-            == motion.prefloat_prop_rot_dir
-            and example[f"{other_motion.color}_attributes"]["start_loc"]
-            == other_motion.start_loc
-            and example[f"{other_motion.color}_attributes"]["end_loc"]
-            == other_motion.end_loc
-            and example[f"{other_motion.color}_attributes"]["prop_rot_dir"]
-            == self.main_widget.json_manager.loader_saver.get_prefloat_prop_rot_dir_from_json(
-                self._get_json_index_for_current_beat(), other_motion.color
-            )
-        )
+        criteria = {
+            motion.color: {
+                START_LOC: [motion.start_loc],
+                END_LOC: [motion.end_loc],
+                PROP_ROT_DIR: [motion.prefloat_prop_rot_dir],
+            },
+            other_motion.color: {
+                START_LOC: [other_motion.start_loc],
+                END_LOC: [other_motion.end_loc],
+                PROP_ROT_DIR: [other_prefloat_prop_rot_dir],
+            },
+        }
+        return self.signature_index.find_letter(criteria)
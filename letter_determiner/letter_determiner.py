@@ -1,7 +1,20 @@
 from typing import TYPE_CHECKING
-from Enums.letters import Letter, LetterConditions, LetterType
-from data.constants import ANTI, COUNTER_CLOCKWISE, DASH, FLOAT, PRO, CLOCKWISE, STATIC
+from Enums.letters import Letter, LetterType
+from data.constants import (
+    ANTI,
+    BLUE,
+    DASH,
+    END_LOC,
+    FLOAT,
+    MOTION_TYPE,
+    PRO,
+    PROP_ROT_DIR,
+    RED,
+    START_LOC,
+    STATIC,
+)
 from .dual_float_letter_determiner import DualFloatLetterDeterminer
+from .motion_signature_index import MotionSignatureIndex
 from .non_hybrid_letter_determiner import NonHybridShiftLetterDeterminer
 from objects.motion.managers.motion_ori_calculator import MotionOriCalculator
 from objects.motion.motion import Motion
@@ -14,6 +27,7 @@ class LetterDeterminer:
     def __init__(self, main_widget: "MainWidget") -> None:
         self.main_widget = main_widget
         self.letters = self.main_widget.pictograph_dicts
+        self.signature_index = MotionSignatureIndex(self.letters)
         self.non_hybrid_shift_letter_determiner = NonHybridShiftLetterDeterminer(self)
         self.dual_float_letter_determiner = DualFloatLetterDeterminer(self)
         self.beat_frame = None
@@ -67,134 +81,54 @@ class LetterDeterminer:
             )
         motion.end_ori = MotionOriCalculator(motion).get_end_ori()
 
-        new_letter = self.find_letter_based_on_attributes(motion)
-        return new_letter
-
-    def find_letter_based_on_attributes(self, motion: "Motion") -> str:
-        """Find the letter in the dictionary that matches the given attributes for both blue and red motions."""
-        # Get the other motion (opposite color)
-        other_motion = motion.pictograph.get.other_motion(motion)
-        letter_type = motion.pictograph.letter.get_letter_type()
-        original_letter = motion.pictograph.letter
-        for letter, examples in self.letters.items():
-
-            if letter_type == LetterType.Type1:
-                for example in examples:
-                    if self.compare_motion_attributes_for_type1(
-                        motion, other_motion, example
-                    ):
-                        return letter
-            elif letter_type in [LetterType.Type2, LetterType.Type3]:
-                for example in examples:
-                    if self.compare_motion_attributes_for_type2_3(motion, example):
-                        return letter
-            else:
-                return original_letter
-        return None
-
-    def compare_motion_attributes_for_type1(
-        self, motion: "Motion", other_motion: "Motion", example
-    ):
-        motion_attributes_match_example = (
-            self.is_shift_motion_type_matching(motion, example)
-            and example[f"{motion.color}_attributes"]["start_loc"] == motion.start_loc
-            and example[f"{motion.color}_attributes"]["end_loc"] == motion.end_loc
-            and self._is_shift_prop_rot_dir_matching(motion, example)
-            and self.is_shift_motion_type_matching(other_motion, example)
-            and example[f"{other_motion.color}_attributes"]["start_loc"]
-            == other_motion.start_loc
-            and example[f"{other_motion.color}_attributes"]["end_loc"]
-            == other_motion.end_loc
-            and self._is_shift_prop_rot_dir_matching(other_motion, example)
-        )
-
-        return motion_attributes_match_example
-
-    def _is_shift_prop_rot_dir_matching(self, motion: "Motion", example):
-        is_rot_dir_matching = (
-            example[f"{motion.color}_attributes"]["prop_rot_dir"]
-            == self.main_widget.json_manager.loader_saver.get_prefloat_prop_rot_dir_from_json(
-                self.beat_frame.get.index_of_currently_selected_beat() + 2,
-                motion.color,
-            )
-            or example[f"{motion.color}_attributes"]["prop_rot_dir"] == motion.prop_rot_dir
-        )
-
-        return is_rot_dir_matching
-
-    def compare_motion_attributes_for_type1_hybrids_with_one_float(
-        self, motion: "Motion", example
-    ):
-        float_motion = motion.pictograph.get.float_motion()
-        non_float_motion = float_motion.pictograph.get.other_motion(float_motion)
-        motion_attributes_match_example = (
-            self.is_shift_motion_type_matching(float_motion, example)
-            and example[f"{float_motion.color}_attributes"]["start_loc"]
-            == float_motion.start_loc
-            and example[f"{float_motion.color}_attributes"]["end_loc"]
-            == float_motion.end_loc
-            and example[f"{float_motion.color}_attributes"]["prop_rot_dir"]
-            == self.main_widget.json_manager.loader_saver.get_prefloat_prop_rot_dir_from_json(
-                self.beat_frame.get.index_of_currently_selected_beat() + 2,
-                float_motion.color,
+        json_index = self.beat_frame.get.index_of_currently_selected_beat() + 2
+        prefloat_prop_rot_dirs = {
+            color: self.main_widget.json_manager.loader_saver.get_prefloat_prop_rot_dir_from_json(
+                json_index, color
             )
-            and self.is_shift_motion_type_matching(non_float_motion, example)
-            and example[f"{non_float_motion.color}_attributes"]["start_loc"]
-            == non_float_motion.start_loc
-            and example[f"{non_float_motion.color}_attributes"]["end_loc"]
-            == non_float_motion.end_loc
-            and example[f"{non_float_motion.color}_attributes"]["prop_rot_dir"]
-            == non_float_motion.prop_rot_dir
-        )
-
-        return motion_attributes_match_example
-
-    def compare_motion_attributes_for_type1_nonhybrids_with_one_float(
-        self, float_motion: "Motion", example
-    ):
-        non_float_motion = float_motion.pictograph.get.other_motion(float_motion)
-        motion_attributes_match_example = (
-            self.is_shift_motion_type_matching(float_motion, example)
-            and example[f"{float_motion.color}_attributes"]["start_loc"]
-            == float_motion.start_loc
-            and example[f"{float_motion.color}_attributes"]["end_loc"]
-            == float_motion.end_loc
-            and example[f"{float_motion.color}_attributes"]["prop_rot_dir"]
-            == self.main_widget.json_manager.loader_saver.get_prefloat_prop_rot_dir_from_json(
-                self.beat_frame.get.index_of_currently_selected_beat() + 2,
-                float_motion.color,
-            )
-            and self.is_shift_motion_type_matching(non_float_motion, example)
-            and example[f"{non_float_motion.color}_attributes"]["start_loc"]
-            == non_float_motion.start_loc
-            and example[f"{non_float_motion.color}_attributes"]["end_loc"]
-            == non_float_motion.end_loc
-            and example[f"{non_float_motion.color}_attributes"]["prop_rot_dir"]
-            == non_float_motion.prop_rot_dir
-        )
-
-        return motion_attributes_match_example
-
-    def compare_motion_attributes_for_type2_3(self, motion: "Motion", example):
-        shift = motion.pictograph.get.shift()
-        non_shift = motion.pictograph.get.other_motion(shift)
-        motion_attributes_match_example = (
-            self.is_shift_motion_type_matching(shift, example)
-            and example[f"{shift.color}_attributes"]["start_loc"] == shift.start_loc
-            and example[f"{shift.color}_attributes"]["end_loc"] == shift.end_loc
-            and self._is_shift_prop_rot_dir_matching(shift, example)
-            and example[f"{non_shift.color}_attributes"]["motion_type"] == non_shift.motion_type
-            and example[f"{non_shift.color}_attributes"]["start_loc"] == non_shift.start_loc
-            and example[f"{non_shift.color}_attributes"]["end_loc"] == non_shift.end_loc
-        )
-
-        return motion_attributes_match_example
-
-    def is_shift_motion_type_matching(self, motion: "Motion", example):
-        is_matching_motion_type = (
-            example[f"{motion.color}_attributes"]["motion_type"] == motion.motion_type
-            or example[f"{motion.color}_attributes"]["motion_type"]
-            == motion.prefloat_motion_type
+            for color in [BLUE, RED]
+        }
+        new_letter = self.find_letter_based_on_attributes(
+            motion, prefloat_prop_rot_dirs
         )
+        return new_letter
 
-        return is_matching_motion_type
+    def find_letter_based_on_attributes(
+        self, motion: "Motion", prefloat_prop_rot_dirs: dict[str, str]
+    ) -> Letter:
+        """Find the letter whose example matches the attributes of both motions."""
+        letter_type = motion.pictograph.letter.get_letter_type()
+        if letter_type == LetterType.Type1:
+            other_motion = motion.pictograph.get.other_motion(motion)
+            criteria = {
+                m.color: self.get_shift_criteria(m, prefloat_prop_rot_dirs[m.color])
+                for m in [motion, other_motion]
+            }
+        elif letter_type in [LetterType.Type2, LetterType.Type3]:
+            shift = motion.pictograph.get.shift()
+            non_shift = motion.pictograph.get.other_motion(shift)
+            criteria = {
+                shift.color: self.get_shift_criteria(
+                    shift, prefloat_prop_rot_dirs[shift.color]
+                ),
+                non_shift.color: {
+                    MOTION_TYPE: [non_shift.motion_type],
+                    START_LOC: [non_shift.start_loc],
+                    END_LOC: [non_shift.end_loc],
+                },
+            }
+        else:
+            return motion.pictograph.letter
+        return self.signature_index.find_letter(criteria)
+
+    @staticmethod
+    def get_shift_criteria(
+        motion: "Motion", prefloat_prop_rot_dir: str
+    ) -> dict[str, list[str]]:
+        """A shift matches on either its current or its prefloat motion type and rotation."""
+        return {
+            MOTION_TYPE: [motion.motion_type, motion.prefloat_motion_type],
+            START_LOC: [motion.start_loc],
+            END_LOC: [motion.end_loc],
+            PROP_ROT_DIR: [prefloat_prop_rot_dir, motion.prop_rot_dir],
+        }
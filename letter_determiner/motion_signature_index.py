@@ -0,0 +1,55 @@
+from itertools import product
+from typing import Iterable, Optional
+from Enums.letters import Letter
+from data.constants import BLUE, END_LOC, MOTION_TYPE, PROP_ROT_DIR, RED, START_LOC
+
+SIGNATURE_ATTRIBUTES = [MOTION_TYPE, START_LOC, END_LOC, PROP_ROT_DIR]
+
+
+class MotionSignatureIndex:
+    """
+    Maps the motion signature of both colors to the letter that produces it.
+
+    A lookup passes the accepted values for each attribute, e.g. both the
+    motion type and the prefloat motion type. Attributes left out of the
+    criteria match anything. A table is built the first time each set of
+    attributes is used. When several letters match, the one that comes first
+    in `pictograph_dicts` wins, as it did with the old linear scan.
+    """
+
+    def __init__(self, pictograph_dicts: dict[Letter, list[dict]]) -> None:
+        self.pictograph_dicts = pictograph_dicts
+        self.tables: dict[tuple, dict[tuple, tuple[int, Letter]]] = {}
+
+    def find_letter(
+        self, criteria: dict[str, dict[str, Iterable[str]]]
+    ) -> Optional[Letter]:
+        """Criteria map color -> attribute -> accepted values."""
+        fields = tuple(
+            (color, attribute)
+            for color in [BLUE, RED]
+            for attribute in SIGNATURE_ATTRIBUTES
+            if attribute in criteria.get(color, {})
+        )
+        table = self._get_table(fields)
+        accepted_values = [set(criteria[color][attribute]) for color, attribute in fields]
+
+        best_match: Optional[tuple[int, Letter]] = None
+        for signature in product(*accepted_values):
+            match = table.get(signature)
+            if match and (best_match is None or match[0] < best_match[0]):
+                best_match = match
+        return best_match[1] if best_match else None
+
+    def _get_table(self, fields: tuple) -> dict[tuple, tuple[int, Letter]]:
+        if fields not in self.tables:
+            table: dict[tuple, tuple[int, Letter]] = {}
+            for order, (letter, examples) in enumerate(self.pictograph_dicts.items()):
+                for example in examples:
+                    signature = tuple(
+                        example[f"{color}_attributes"][attribute]
+                        for color, attribute in fields
+                    )
+                    table.setdefault(signature, (order, letter))
+            self.tables[fields] = table
+        return self.tables[fields]
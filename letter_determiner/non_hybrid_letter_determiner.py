@@ -1,6 +1,19 @@
 from typing import TYPE_CHECKING
 from Enums.letters import Letter
-from data.constants import ANTI, COUNTER_CLOCKWISE, CLOCKWISE, FLOAT, OPP, PRO
+from data.constants import (
+    ANTI,
+    BLUE,
+    COUNTER_CLOCKWISE,
+    CLOCKWISE,
+    END_LOC,
+    FLOAT,
+    MOTION_TYPE,
+    OPP,
+    PRO,
+    PROP_ROT_DIR,
+    RED,
+    START_LOC,
+)
 
 if TYPE_CHECKING:
     from main_window.main_widget.main_widget import MainWidget
@@ -18,6 +31,7 @@ class NonHybridShiftLetterDeterminer:
     def __init__(self, letter_engine: "LetterDeterminer"):
         self.main_widget = letter_engine.main_widget
         self.letters = letter_engine.letters
+        self.signature_index = letter_engine.signature_index
 
     def determine_letter(
         self, motion: "Motion", new_motion_type: str, swap_prop_rot_dir: bool
@@ -28,7 +42,9 @@ class NonHybridShiftLetterDeterminer:
             self._update_motion_attributes(motion, new_motion_type, other_motion)
             if swap_prop_rot_dir:
                 self._update_motion_attributes(other_motion, new_motion_type, motion)
-        return self._find_matching_letter(motion)
+        json_index = self._get_json_index_for_current_beat()
+        prop_rot_dir_candidates = self._get_prop_rot_dir_candidates(json_index)
+        return self._find_matching_letter(motion, prop_rot_dir_candidates)
 
     def _update_motion_attributes(
         self, motion: "Motion", new_motion_type: str, other_motion: "Motion"
@@ -92,59 +108,30 @@ class NonHybridShiftLetterDeterminer:
         """Return the opposite prop rotation direction."""
         return COUNTER_CLOCKWISE if rotation_direction == CLOCKWISE else CLOCKWISE
 
-    def _find_matching_letter(self, motion: "Motion") -> Letter:
+    def _get_prop_rot_dir_candidates(self, json_index: int) -> dict[str, list[str]]:
+        """Both the prefloat and the current prop rot dir of each color are accepted."""
+        loader_saver = self.main_widget.json_manager.loader_saver
+        return {
+            color: [
+                loader_saver.get_prefloat_prop_rot_dir_from_json(json_index, color),
+                loader_saver.get_prop_rot_dir_from_json(json_index, color),
+            ]
+            for color in [BLUE, RED]
+        }
+
+    def _find_matching_letter(
+        self, motion: "Motion", prop_rot_dir_candidates: dict[str, list[str]]
+    ) -> Letter:
         """Find and return the letter that matches the motion attributes."""
-        for letter, examples in self.letters.items():
-            for example in examples:
-                if self._compare_motion_attributes(motion, example):
-                    return letter
-        return None
-
-    def _compare_motion_attributes(self, motion: "Motion", example) -> bool:
-        """Compare the motion attributes with the example to find a match."""
         float_motion = motion.pictograph.get.float_motion()
         non_float_motion = float_motion.pictograph.get.other_motion(float_motion)
-
-        does_example_match = (
-            self._is_shift_motion_type_matching(float_motion, example)
-            and example[f"{float_motion.color}_attributes"]["start_loc"]
-            == float_motion.start_loc
-            and example[f"{float_motion.color}_attributes"]["end_loc"]
-            == float_motion.end_loc
-            and self._is_shift_prop_rot_dir_matching(float_motion, example)
-            and self._is_shift_motion_type_matching(non_float_motion, example)
-            and example[f"{non_float_motion.color}_attributes"]["start_loc"]
-            == non_float_motion.start_loc
-            and example[f"{non_float_motion.color}_attributes"]["end_loc"]
-            == non_float_motion.end_loc
-            and self._is_shift_prop_rot_dir_matching(non_float_motion, example)
-        )
-
-        return does_example_match
-
-    def _is_shift_prop_rot_dir_matching(self, motion: "Motion", example):
-        is_rot_dir_matching = example[f"{motion.color}_attributes"][
-            "prop_rot_dir"
-        ] == self.main_widget.json_manager.loader_saver.get_prefloat_prop_rot_dir_from_json(
-            self.main_widget.top_builder_widget.sequence_widget.beat_frame.get.index_of_currently_selected_beat()
-            + 2,
-            motion.color,
-        ) or example[
-            f"{motion.color}_attributes"
-        ][
-            "prop_rot_dir"
-        ] == self.main_widget.json_manager.loader_saver.get_prop_rot_dir_from_json(
-            self.main_widget.top_builder_widget.sequence_widget.beat_frame.get.index_of_currently_selected_beat()
-            + 2,
-            motion.color,
-        )
-
-        return is_rot_dir_matching
-
-    def _is_shift_motion_type_matching(self, motion: "Motion", example) -> bool:
-        """Check if the motion type matches."""
-        return (
-            example[f"{motion.color}_attributes"]["motion_type"] == motion.motion_type
-            or example[f"{motion.color}_attributes"]["motion_type"]
-            == motion.prefloat_motion_type
-        )
+        criteria = {
+            m.color: {
+                MOTION_TYPE: [m.motion_type, m.prefloat_motion_type],
+                START_LOC: [m.start_loc],
+                END_LOC: [m.end_loc],
+                PROP_ROT_DIR: prop_rot_dir_candidates[m.color],
+            }
+            for m in [float_motion, non_float_motion]
+        }
+        return self.signature_index.find_letter(criteria)
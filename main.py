@@ -1,4 +1,9 @@
 import sys
+from startup_profiler import StartupProfiler
+
+startup_profiler = StartupProfiler.from_argv(sys.argv)
+startup_profiler.start()
+
 import logging
 logging.basicConfig(level=logging.WARNING)
 logging.getLogger("matplotlib").setLevel(logging.WARNING)
@@ -33,23 +38,25 @@ def main() -> None:
     screens = app.screens()
     target_screen = screens[1] if dev_environment and len(screens) > 1 else screens[0]
 
-    from main_window.settings_manager.settings_manager import SettingsManager
-
-    settings_manager = SettingsManager(None)
-
-    from splash_screen import SplashScreen
+    with startup_profiler.phase("settings"):
+        from main_window.settings_manager.settings_manager import SettingsManager
 
-    splash_screen = SplashScreen(target_screen, settings_manager)
-    splash_screen.show()
-    app.processEvents()
+        settings_manager = SettingsManager(None)
 
-    from profiler import Profiler
+    with startup_profiler.phase("splash_screen"):
+        from splash_screen import SplashScreen
 
-    profiler = Profiler()
+        splash_screen = SplashScreen(target_screen, settings_manager)
+        splash_screen.show()
+        app.processEvents()
+    startup_profiler.splash_screen = splash_screen
 
-    from main_window.main_window import MainWindow
+    with startup_profiler.phase("imports", "Importing modules..."):
+        from main_window.main_window import MainWindow
 
-    main_window = MainWindow(profiler, splash_screen)
+    main_window = MainWindow(startup_profiler.profiler, splash_screen, startup_profiler)
+    splash_screen.update_progress(100, "Initialization complete!")
+    startup_profiler.watch_first_paint(main_window)
     main_window.show()
 
     QTimer.singleShot(0, lambda: splash_screen.close())
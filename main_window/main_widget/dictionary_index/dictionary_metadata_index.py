@@ -0,0 +1,125 @@
+import json
+import os
+from typing import Optional
+from PIL import Image
+
+from utilities.path_helpers import get_user_editable_resource_path
+from .sequence_fingerprint import get_fingerprints
+
+
+class DictionaryMetadataIndex:
+    """
+    On-disk cache of the sequence metadata embedded in dictionary thumbnails.
+
+    Entries are keyed by the normalized file path and remember the file's
+    mtime and size, so a thumbnail is only decoded again after it changes.
+    The structural and turn pattern fingerprints of the sequence are stored
+    next to the metadata the first time they are asked for.
+    """
+
+    INDEX_VERSION = 1
+
+    def __init__(self, index_path: str = None) -> None:
+        self.index_path = index_path or get_user_editable_resource_path(
+            "dictionary_metadata_index.json"
+        )
+        self.entries: dict[str, dict] = {}
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.load()
+
+    def load(self) -> None:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if data.get("version") == self.INDEX_VERSION:
+            self.entries = data.get("entries", {})
+
+    def save(self) -> None:
+        """Write the index to disk if anything changed since the last save."""
+        if not self.dirty:
+            return
+        temp_path = f"{self.index_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {"version": self.INDEX_VERSION, "entries": self.entries},
+                file,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+        os.replace(temp_path, self.index_path)
+        self.dirty = False
+
+    def get_metadata(self, file_path: str) -> Optional[dict]:
+        """Return the cached metadata for a thumbnail, decoding it only on a miss."""
+        key = self._make_key(file_path)
+        stat = os.stat(file_path)
+        entry = self.entries.get(key)
+        if entry and self._is_entry_current(entry, stat):
+            self.hits += 1
+            return entry["metadata"]
+
+        self.misses += 1
+        metadata = self.read_metadata_from_png(file_path)
+        self._store(key, stat, metadata)
+        return metadata
+
+    def get_fingerprints(self, file_path: str) -> Optional[dict[str, str]]:
+        metadata = self.get_metadata(file_path)
+        if not metadata or "sequence" not in metadata:
+            return None
+        entry = self.entries[self._make_key(file_path)]
+        if "fingerprints" not in entry:
+            entry["fingerprints"] = get_fingerprints(metadata["sequence"])
+            self.dirty = True
+        return entry["fingerprints"]
+
+    def update(self, file_path: str, metadata: Optional[dict]) -> None:
+        """Record metadata that was just written to a file without re-reading it."""
+        self._store(self._make_key(file_path), os.stat(file_path), metadata)
+
+    def invalidate(self, file_path: str) -> None:
+        if self.entries.pop(self._make_key(file_path), None) is not None:
+            self.dirty = True
+
+    def invalidate_directory(self, directory: str) -> None:
+        prefix = self._make_key(directory) + os.sep
+        stale_keys = [key for key in self.entries if key.startswith(prefix)]
+        for key in stale_keys:
+            del self.entries[key]
+        if stale_keys:
+            self.dirty = True
+
+    def prune(self) -> list[str]:
+        """Drop entries whose files were removed or renamed outside the index."""
+        stale_keys = [key for key in self.entries if not os.path.exists(key)]
+        for key in stale_keys:
+            del self.entries[key]
+        if stale_keys:
+            self.dirty = True
+        return stale_keys
+
+    @staticmethod
+    def read_metadata_from_png(file_path: str) -> Optional[dict]:
+        with Image.open(file_path) as img:
+            metadata = img.info.get("metadata")
+        return json.loads(metadata) if metadata else None
+
+    def _store(self, key: str, stat: os.stat_result, metadata: Optional[dict]) -> None:
+        self.entries[key] = {
+            "mtime": stat.st_mtime,
+            "size": stat.st_size,
+            "metadata": metadata,
+        }
+        self.dirty = True
+
+    @staticmethod
+    def _is_entry_current(entry: dict, stat: os.stat_result) -> bool:
+        return entry["mtime"] == stat.st_mtime and entry["size"] == stat.st_size
+
+    @staticmethod
+    def _make_key(file_path: str) -> str:
+        return os.path.normcase(os.path.abspath(file_path))
@@ -0,0 +1,360 @@
+import os
+from bisect import bisect_left, insort
+from collections import defaultdict
+from datetime import datetime
+from typing import TYPE_CHECKING, Iterable, NamedTuple, Optional
+
+from .sequence_fingerprint import (
+    get_structural_fingerprint,
+    get_turn_pattern_fingerprint,
+)
+
+if TYPE_CHECKING:
+    from main_window.main_widget.main_widget import MainWidget
+
+
+class DictionaryRecord(NamedTuple):
+    word: str
+    thumbnails: list[str]
+    sequence_length: Optional[int]
+    level: Optional[int]
+    author: Optional[str]
+    starting_position: Optional[str]
+    grid_mode: Optional[str]
+    is_favorite: bool
+    date_added: datetime
+    letters: frozenset[str]
+    fingerprints: dict[str, dict[str, str]]
+
+
+class DictionarySearchEngine:
+    """
+    Inverted indexes over the dictionary words.
+
+    Every word gets an id and each indexed field maps its values to sets of
+    ids, so a query is a few set intersections (match all) or unions (match
+    any) and the facet count for a value is the size of its set. A list of
+    values for one field always matches any of them. The structural and turn
+    pattern fingerprints of every variation are indexed the same way, which
+    makes duplicate checks a lookup. The metadata extractor reports every
+    file the app changes; the words those files belong to are re-indexed on
+    the next query, and everything else is left alone.
+    """
+
+    INDEXED_FIELDS = (
+        "starting_letter",
+        "contains_letters",
+        "sequence_length",
+        "level",
+        "author",
+        "starting_position",
+        "grid_mode",
+        "favorites",
+        "structural_fingerprint",
+        "turn_pattern_fingerprint",
+    )
+    FINGERPRINT_FUNCTIONS = {
+        "structural": get_structural_fingerprint,
+        "turn_pattern": get_turn_pattern_fingerprint,
+    }
+
+    def __init__(self, main_widget: "MainWidget") -> None:
+        self.main_widget = main_widget
+        self.metadata_extractor = main_widget.metadata_extractor
+        self.thumbnail_finder = main_widget.thumbnail_finder
+        self.dictionary_key = self._make_key(self.thumbnail_finder.dictionary_dir)
+        self.records: list[Optional[DictionaryRecord]] = []
+        self.record_ids: dict[str, int] = {}
+        self.indexes: dict[str, dict[object, set[int]]] = {}
+        self.dates_added: list[tuple[datetime, int]] = []
+        self.is_built = False
+        self.changed_words: set[str] = set()
+        self.metadata_extractor.add_change_listener(self.note_change)
+
+    def search(self, criteria: dict, match_all: bool = True) -> list[int]:
+        """
+        Return the ids of the words matching `criteria`, sorted by word.
+
+        Keys are the browser filter keys: the indexed fields, "most_recent"
+        (words added on or after a datetime) and "show_all".
+        """
+        matches = self._search(criteria, match_all)
+        return sorted(matches, key=lambda record_id: self.records[record_id].word)
+
+    def count(self, criteria: dict, match_all: bool = True) -> int:
+        return len(self._search(criteria, match_all))
+
+    def get_facet_counts(
+        self, field: str, criteria: Optional[dict] = None, match_all: bool = True
+    ) -> dict:
+        """
+        Number of words for every value of `field`.
+
+        With `criteria`, only the words matching them are counted, which
+        gives the tallies for narrowing down an existing selection.
+        """
+        self.ensure_built()
+        index = self.indexes.get(field, {})
+        if criteria is None:
+            return {value: len(record_ids) for value, record_ids in index.items()}
+        matches = self._search(criteria, match_all)
+        counts = {value: len(record_ids & matches) for value, record_ids in index.items()}
+        return {value: count for value, count in counts.items() if count}
+
+    def get_sequences(self, record_ids: Iterable[int]) -> list[tuple[str, list[str], int]]:
+        """The (word, thumbnails, sequence length) tuples the browser displays."""
+        return [
+            (record.word, record.thumbnails, record.sequence_length)
+            for record in map(self.records.__getitem__, record_ids)
+        ]
+
+    def find_sequences(
+        self, criteria: dict, match_all: bool = True
+    ) -> list[tuple[str, list[str], int]]:
+        return self.get_sequences(self.search(criteria, match_all))
+
+    def find_variations(
+        self, word: str, sequence: list[dict], fingerprint_type: str = "structural"
+    ) -> list[str]:
+        """Thumbnails of `word` whose sequence has the same fingerprint as `sequence`."""
+        self.ensure_built()
+        fingerprint = self.FINGERPRINT_FUNCTIONS[fingerprint_type](sequence)
+        record_id = self.record_ids.get(word)
+        record_ids = self.indexes[f"{fingerprint_type}_fingerprint"].get(fingerprint, ())
+        if record_id not in record_ids:
+            return []
+        return [
+            thumbnail
+            for thumbnail, fingerprints in self.records[record_id].fingerprints.items()
+            if fingerprints[fingerprint_type] == fingerprint
+        ]
+
+    def get_duplicate_groups(self, fingerprint_type: str = "structural") -> list[list[str]]:
+        """Every group of two or more thumbnails that share a fingerprint."""
+        self.ensure_built()
+        groups: dict[str, list[str]] = defaultdict(list)
+        for _, record_id in sorted(self.record_ids.items()):
+            for thumbnail, fingerprints in self.records[record_id].fingerprints.items():
+                groups[fingerprints[fingerprint_type]].append(thumbnail)
+        return [sorted(group) for group in groups.values() if len(group) > 1]
+
+    def note_change(self, path: Optional[str]) -> None:
+        """Metadata extractor callback; only records what to re-index."""
+        if path is None:
+            self.is_built = False
+            return
+        relative_path = os.path.relpath(self._make_key(path), self.dictionary_key)
+        word_key = relative_path.split(os.sep)[0]
+        if word_key not in (os.curdir, os.pardir):
+            self.changed_words.add(word_key)
+
+    def ensure_built(self) -> None:
+        if not self.is_built:
+            self.rebuild()
+        elif self.changed_words:
+            self._refresh_changed_words()
+
+    def rebuild(self) -> None:
+        self.is_built = True
+        self.changed_words.clear()
+        self.records = []
+        self.record_ids = {}
+        self.indexes = {field: defaultdict(set) for field in self.INDEXED_FIELDS}
+        self.dates_added = []
+        for word in sorted(self._list_words()):
+            self._add_record(word)
+
+    @staticmethod
+    def split_letters(word: str) -> list[str]:
+        """Split a word into its letters; a trailing dash belongs to the letter."""
+        letters = []
+        for char in word:
+            if char == "-" and letters:
+                letters[-1] += "-"
+            else:
+                letters.append(char)
+        return letters
+
+    ### QUERIES ###
+
+    def _search(self, criteria: dict, match_all: bool) -> set[int]:
+        self.ensure_built()
+        result: Optional[set[int]] = None
+        for key, value in criteria.items():
+            matches = self._match(key, value)
+            if result is None:
+                result = matches
+            elif match_all:
+                result &= matches
+            else:
+                result |= matches
+        return result or set()
+
+    def _match(self, key: str, value) -> set[int]:
+        if key == "show_all" or (key == "starting_letter" and value == "show_all"):
+            return set(self.record_ids.values())
+        if key == "most_recent":
+            start = bisect_left(self.dates_added, (value, -1))
+            return {record_id for _, record_id in self.dates_added[start:]}
+        if key not in self.indexes:
+            return set()
+
+        index = self.indexes[key]
+        values = value if isinstance(value, (list, tuple, set, frozenset)) else [value]
+        matches = set()
+        for item in values:
+            matches |= index.get(self._normalize(key, item), set())
+        return matches
+
+    @staticmethod
+    def _normalize(key: str, value):
+        if key in ("starting_position", "grid_mode") and isinstance(value, str):
+            return value.lower()
+        if key == "favorites":
+            return bool(value)
+        return value
+
+    ### INCREMENTAL UPDATES ###
+
+    def _refresh_changed_words(self) -> None:
+        words_by_key = {self._make_word_key(word): word for word in self.record_ids}
+        new_word_keys = self.changed_words - words_by_key.keys()
+        if new_word_keys:
+            for word in self._list_words():
+                if self._make_word_key(word) in new_word_keys:
+                    words_by_key[self._make_word_key(word)] = word
+
+        for word_key in self.changed_words:
+            word = words_by_key.get(word_key)
+            if word is None:
+                continue
+            if word in self.record_ids:
+                self._remove_record(word)
+            if os.path.isdir(os.path.join(self.thumbnail_finder.dictionary_dir, word)):
+                self._add_record(word)
+        self.changed_words.clear()
+
+    def _add_record(self, word: str) -> None:
+        word_dir = os.path.join(self.thumbnail_finder.dictionary_dir, word)
+        thumbnails = self.thumbnail_finder.find_thumbnails(word_dir)
+        if not thumbnails:
+            return
+        record = self._make_record(word, thumbnails)
+        record_id = len(self.records)
+        self.records.append(record)
+        self.record_ids[word] = record_id
+        for field, values in self._get_index_values(record).items():
+            for value in values:
+                self.indexes[field][value].add(record_id)
+        insort(self.dates_added, (record.date_added, record_id))
+
+    def _remove_record(self, word: str) -> None:
+        record_id = self.record_ids.pop(word)
+        record = self.records[record_id]
+        self.records[record_id] = None
+        for field, values in self._get_index_values(record).items():
+            for value in values:
+                record_ids = self.indexes[field][value]
+                record_ids.discard(record_id)
+                if not record_ids:
+                    del self.indexes[field][value]
+        position = bisect_left(self.dates_added, (record.date_added, record_id))
+        del self.dates_added[position]
+
+    def _list_words(self) -> list[str]:
+        dictionary_dir = self.thumbnail_finder.dictionary_dir
+        return [
+            word
+            for word in os.listdir(dictionary_dir)
+            if os.path.isdir(os.path.join(dictionary_dir, word))
+            and "__pycache__" not in word
+        ]
+
+    @staticmethod
+    def _make_key(path: str) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+    @staticmethod
+    def _make_word_key(word: str) -> str:
+        return os.path.normcase(word)
+
+    ### RECORDS ###
+
+    def _make_record(self, word: str, thumbnails: list[str]) -> DictionaryRecord:
+        metadata_list = [
+            self.metadata_extractor.get_metadata_quietly(thumbnail)
+            for thumbnail in thumbnails
+        ]
+        sequences = [
+            metadata["sequence"]
+            for metadata in metadata_list
+            if metadata and len(metadata.get("sequence", [])) >= 2
+        ]
+
+        def first(get_value):
+            for sequence in sequences:
+                value = get_value(sequence)
+                if value is not None:
+                    return value
+            return None
+
+        starting_position = first(lambda seq: seq[1].get("sequence_start_position"))
+        grid_mode = first(lambda seq: seq[0].get("grid_mode"))
+        return DictionaryRecord(
+            word=word,
+            thumbnails=thumbnails,
+            sequence_length=first(lambda seq: len(seq) - 2 or None),
+            level=first(lambda seq: seq[0].get("level")),
+            author=first(lambda seq: seq[0].get("author")),
+            starting_position=starting_position.lower() if starting_position else None,
+            grid_mode=grid_mode.lower() if grid_mode else None,
+            is_favorite=any(
+                metadata.get("is_favorite", False)
+                for metadata in metadata_list
+                if metadata
+            ),
+            date_added=self._get_date_added(metadata_list),
+            letters=frozenset(self.split_letters(word)),
+            fingerprints=self._get_fingerprints(thumbnails),
+        )
+
+    def _get_fingerprints(self, thumbnails: list[str]) -> dict[str, dict[str, str]]:
+        fingerprints_by_thumbnail = {}
+        for thumbnail in thumbnails:
+            fingerprints = self.metadata_extractor.get_fingerprints_quietly(thumbnail)
+            if fingerprints:
+                fingerprints_by_thumbnail[thumbnail] = fingerprints
+        return fingerprints_by_thumbnail
+
+    @staticmethod
+    def _get_date_added(metadata_list: list[Optional[dict]]) -> datetime:
+        dates = []
+        for metadata in metadata_list:
+            date_added = metadata.get("date_added") if metadata else None
+            if date_added:
+                try:
+                    dates.append(datetime.fromisoformat(date_added))
+                except ValueError:
+                    pass
+        return max(dates, default=datetime.min)
+
+    def _get_index_values(self, record: DictionaryRecord) -> dict[str, Iterable]:
+        optional_values = {
+            "sequence_length": record.sequence_length,
+            "level": record.level,
+            "author": record.author,
+            "starting_position": record.starting_position,
+            "grid_mode": record.grid_mode,
+        }
+        index_values = {
+            field: [value] for field, value in optional_values.items() if value is not None
+        }
+        index_values["starting_letter"] = self.split_letters(record.word)[:1]
+        index_values["contains_letters"] = record.letters
+        index_values["favorites"] = [record.is_favorite]
+        for fingerprint_type in self.FINGERPRINT_FUNCTIONS:
+            index_values[f"{fingerprint_type}_fingerprint"] = {
+                fingerprints[fingerprint_type]
+                for fingerprints in record.fingerprints.values()
+            }
+        return index_values
@@ -0,0 +1,61 @@
+import hashlib
+import json
+
+MOTION_COLORS = ("blue_attributes", "red_attributes")
+TURN_PATTERN_KEYS = ("turns", "start_ori", "end_ori")
+
+
+def get_structural_fingerprint(sequence: list[dict]) -> str:
+    """
+    Hash of everything that defines a structural variation.
+
+    Two sequences get the same fingerprint exactly when their motions match
+    beat for beat once turns and orientations are ignored.
+    """
+    return _hash(
+        [
+            [
+                {
+                    key: _normalize(value)
+                    for key, value in entry.get(color, {}).items()
+                    if key not in TURN_PATTERN_KEYS
+                }
+                for color in MOTION_COLORS
+            ]
+            for entry in sequence[1:]
+        ]
+    )
+
+
+def get_turn_pattern_fingerprint(sequence: list[dict]) -> str:
+    """Hash of the turns and orientations of every beat, ignoring the motions."""
+    return _hash(
+        [
+            [
+                [_normalize(entry.get(color, {}).get(key)) for key in TURN_PATTERN_KEYS]
+                for color in MOTION_COLORS
+            ]
+            for entry in sequence[1:]
+        ]
+    )
+
+
+def get_fingerprints(sequence: list[dict]) -> dict[str, str]:
+    return {
+        "structural": get_structural_fingerprint(sequence),
+        "turn_pattern": get_turn_pattern_fingerprint(sequence),
+    }
+
+
+def _normalize(value):
+    # 1 and 1.0 turns are the same turns
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _hash(canonical_form: list) -> str:
+    data = json.dumps(
+        canonical_form, sort_keys=True, ensure_ascii=False, separators=(",", ":")
+    )
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()
@@ -1,14 +1,11 @@
 from datetime import datetime
-import os
 from typing import TYPE_CHECKING
-from PyQt6.QtCore import QTimer
 from main_window.main_widget.dictionary_widget.dictionary_browser.initial_filter_selection_widget.dictionary_initial_selections_widget import (
     DictionaryInitialSelectionsWidget,
 )
 from main_window.main_widget.dictionary_widget.dictionary_browser.rainbow_progress_bar import (
     RainbowProgressBar,
 )
-from utilities.path_helpers import get_images_and_data_path
 from .currently_displaying_indicator_label import CurrentlyDisplayingIndicatorLabel
 from .dictionary_browser_nav_sidebar import DictionaryBrowserNavSidebar
 from PyQt6.QtCore import Qt
@@ -76,17 +73,6 @@ class DictionaryBrowser(QWidget):
         self.currently_displaying_label.show_message(description)
         self.number_of_sequences_label.setText("")
         self.scroll_widget.clear_layout()
-        self.scroll_widget.grid_layout.addWidget(
-            self.progress_bar,
-            0,
-            0,
-            1,
-            self.thumbnail_box_sorter.num_columns,
-            Qt.AlignmentFlag.AlignCenter,
-        )
-        self._style_progress_bar()
-        self.progress_bar.setVisible(True)
-        QApplication.processEvents()
 
     def _initialize_progress_bar(self):
         self.progress_bar = RainbowProgressBar(self.scroll_widget.scroll_content)
@@ -211,143 +197,34 @@ class DictionaryBrowser(QWidget):
         """Show only favorite sequences."""
 
         self.prepare_ui_for_filtering(f"favorite sequences")
-        dictionary_dir = get_images_and_data_path("dictionary")
-        base_words = [
-            (
-                word,
-                self.main_widget.thumbnail_finder.find_thumbnails(
-                    os.path.join(dictionary_dir, word)
-                ),
-            )
-            for word in os.listdir(dictionary_dir)
-            if os.path.isdir(os.path.join(dictionary_dir, word))
-            and "__pycache__" not in word
-        ]
-
-        favorites = []
-        for word, thumbnails in base_words:
-            for thumbnail in thumbnails:
-                if self.main_widget.metadata_extractor.get_favorite_status(thumbnail):
-                    sequence_length = (
-                        self.main_widget.metadata_extractor.get_sequence_length(
-                            thumbnail
-                        )
-                    )
-                    favorites.append((word, thumbnails, sequence_length))
-                    break
-
+        favorites = self.main_widget.dictionary_search_engine.find_sequences(
+            {"favorites": True}
+        )
         self.currently_displayed_sequences = favorites
         self.update_and_display_ui(len(favorites), "favorite sequences")
 
     def show_all_sequences(self):
         """Show all sequences."""
         self.prepare_ui_for_filtering(f"all sequences")
-
-        dictionary_dir = get_images_and_data_path("dictionary")
-        base_words = [
-            (
-                word,
-                self.main_widget.thumbnail_finder.find_thumbnails(
-                    os.path.join(dictionary_dir, word)
-                ),
-            )
-            for word in os.listdir(dictionary_dir)
-            if os.path.isdir(os.path.join(dictionary_dir, word))
-            and "__pycache__" not in word
-        ]
-        sequences = []
-        for word, thumbnails in base_words:
-            for thumbnail in thumbnails:
-                sequence_length = (
-                    self.main_widget.metadata_extractor.get_sequence_length(thumbnail)
-                )
-                sequences.append((word, thumbnails, sequence_length))
+        sequences = self.main_widget.dictionary_search_engine.find_sequences(
+            {"show_all": True}
+        )
         self.currently_displayed_sequences = sequences
 
         self.update_and_display_ui(len(sequences), "all sequences")
 
     def show_most_recent_sequences(self, date: datetime):
         self.prepare_ui_for_filtering(f"most recent sequences")
-        dictionary_dir = get_images_and_data_path("dictionary")
-        base_words = [
-            (
-                word,
-                self.main_widget.thumbnail_finder.find_thumbnails(
-                    os.path.join(dictionary_dir, word)
-                ),
-            )
-            for word in os.listdir(dictionary_dir)
-            if os.path.isdir(os.path.join(dictionary_dir, word))
-            and "__pycache__" not in word
-        ]
-        most_recent = []
-        for word, thumbnails in base_words:
-            date_added = self.section_manager.get_date_added(thumbnails)
-            if date_added and date_added >= date:
-                sequence_length = (
-                    self.main_widget.metadata_extractor.get_sequence_length(
-                        thumbnails[0]
-                    )
-                )
-                most_recent.append((word, thumbnails, sequence_length))
-                # break
-
+        most_recent = self.main_widget.dictionary_search_engine.find_sequences(
+            {"most_recent": date}
+        )
         self.currently_displayed_sequences = most_recent
         self.update_and_display_ui(len(most_recent), "most recent sequences")
 
     def update_and_display_ui(self, total_sequences: int, filter_description: str):
-        if total_sequences == 0:
-            total_sequences = 1  # Prevent division by zero
-
-        self.number_of_sequences_label.setText(
-            f"Number of words to be displayed: {total_sequences}"
+        """Lay out the filtered words; the grid only builds the boxes in view."""
+        self.progress_bar.setVisible(False)
+        self.thumbnail_box_sorter.sort_and_display_currently_filtered_sequences_by_method(
+            self.main_widget.main_window.settings_manager.dictionary_settings.get_sort_method()
         )
 
-        def update_ui():
-            num_words = 0
-            nonlocal filter_description
-            for index, (word, thumbnails, _) in enumerate(
-                self.currently_displayed_sequences
-            ):
-                row_index = index // self.thumbnail_box_sorter.num_columns
-                column_index = index % self.thumbnail_box_sorter.num_columns
-                self.thumbnail_box_sorter.add_thumbnail_box(
-                    row_index=row_index,
-                    column_index=column_index,
-                    word=word,
-                    thumbnails=thumbnails,
-                    hidden=True,
-                )
-                num_words += 1
-
-                percentage = int((num_words / total_sequences) * 100)
-                self.progress_bar.setValue(percentage)
-                self.number_of_sequences_label.setText(f"Number of words: {num_words}")
-                QApplication.processEvents()
-
-            self.progress_bar.setVisible(False)
-            self.thumbnail_box_sorter.sort_and_display_currently_filtered_sequences_by_method(
-                self.main_widget.main_window.settings_manager.dictionary_settings.get_sort_method()
-            )
-            font_color = self.main_widget.main_window.settings_manager.global_settings.font_color_updater.get_font_color(
-                self.main_widget.main_window.settings_manager.global_settings.get_background_type()
-            )
-            for thumbnail_box in self.scroll_widget.thumbnail_boxes.values():
-                thumbnail_box.word_label.setStyleSheet(f"color: {font_color};")
-                if font_color == "white":
-                    thumbnail_box.word_label.star_icon_empty_path = (
-                        "star_empty_white.png"
-                    )
-                elif font_color == "black":
-                    thumbnail_box.word_label.star_icon_empty_path = (
-                        "star_empty_black.png"
-                    )
-                # reload the QIcons with the path
-                thumbnail_box.word_label.reload_favorite_icon()
-                thumbnail_box.variation_number_label.setStyleSheet(
-                    f"color: {font_color};"
-                )
-            QApplication.restoreOverrideCursor()
-
-        QTimer.singleShot(0, update_ui)
-
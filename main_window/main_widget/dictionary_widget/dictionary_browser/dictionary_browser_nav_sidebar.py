@@ -1,6 +1,6 @@
 from PyQt6.QtWidgets import QVBoxLayout, QPushButton, QWidget, QScrollArea, QLabel
 from PyQt6.QtGui import QCursor
-from PyQt6.QtCore import Qt, QPoint
+from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QApplication
 from typing import TYPE_CHECKING
 
@@ -275,13 +275,7 @@ class DictionaryBrowserNavSidebar(QWidget):
                 + "-"
                 + section.split("-")[1].lstrip("0")
             )
-        header = self.browser.scroll_widget.section_headers.get(section)
-        if header:
-            scroll_area = self.browser.scroll_widget.scroll_area
-            header_global_pos = header.mapToGlobal(QPoint(0, 0))
-            content_widget_pos = scroll_area.widget().mapFromGlobal(header_global_pos)
-            vertical_pos = content_widget_pos.y()
-            scroll_area.verticalScrollBar().setValue(vertical_pos)
+        self.browser.scroll_widget.scroll_to_section(section)
 
     def set_styles(self):
         for button in self.buttons:
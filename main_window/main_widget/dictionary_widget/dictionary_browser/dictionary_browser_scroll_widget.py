@@ -1,6 +1,11 @@
-from typing import TYPE_CHECKING
-from PyQt6.QtCore import Qt
+from bisect import bisect_right
+from itertools import accumulate
+from typing import TYPE_CHECKING, Optional, Union
+from PyQt6.QtCore import Qt, QTimer
 
+from main_window.main_widget.dictionary_widget.dictionary_browser.dictionary_browser_section_header import (
+    DictionaryBrowserSectionHeader,
+)
 from main_window.main_widget.dictionary_widget.dictionary_browser.thumbnail_box.thumbnail_box import (
     ThumbnailBox,
 )
@@ -9,35 +14,64 @@ from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QScrollArea,
-    QGridLayout,
 )
 
 if TYPE_CHECKING:
     from main_window.main_widget.dictionary_widget.dictionary_browser.dictionary_browser import (
         DictionaryBrowser,
     )
-    from main_window.main_widget.dictionary_widget.dictionary_browser.dictionary_browser_section_header import (
-        DictionaryBrowserSectionHeader,
-    )
+
+HEADER_ROW = "header"
+THUMBNAIL_ROW = "thumbnails"
 
 
 class DictionaryBrowserScrollWidget(QWidget):
+    """
+    Virtualized grid of thumbnail boxes.
+
+    The sorter hands over a flat list of rows (section headers and rows of up
+    to num_columns words). Only the rows inside the viewport, plus OVERSCAN
+    viewports above and below, get widgets; rows that scroll away give their
+    thumbnail boxes and headers back to a pool, and the pooled widgets are
+    rebound to the next words that come into view. Rows that were never shown
+    use an estimated height, which is corrected once the row is measured.
+    Images load asynchronously, rows inside the viewport first; rows whose
+    images change height are re-measured together on the next event loop pass.
+    """
+
+    OVERSCAN = 1.0
+    VIEWPORT_LOAD_PRIORITY = 1
+    OVERSCAN_LOAD_PRIORITY = 0
+    DEFAULT_HEADER_HEIGHT = 50
+    THUMBNAIL_BOX_CHROME_HEIGHT = 140
+
     def __init__(self, browser: "DictionaryBrowser"):
         super().__init__(browser)
         self.is_initialized = False
         self.browser = browser
+        self.num_columns = browser.num_columns
         self.thumbnail_boxes: dict[str, ThumbnailBox] = {}
         self.scroll_content = QWidget()
         self.setStyleSheet("background: transparent;")
-        self.is_initialized = True
-        self.section_headers: dict[int, "DictionaryBrowserSectionHeader"] = {}
+        self.rows: list[tuple[str, Union[str, list[tuple[str, list[str]]]]]] = []
+        self.row_heights: list[Optional[int]] = []
+        self.row_offsets: list[int] = [0]
+        self.section_rows: dict[str, int] = {}
+        self.materialized_rows: dict[int, list[QWidget]] = {}
+        self.free_thumbnail_boxes: list[ThumbnailBox] = []
+        self.free_section_headers: list[DictionaryBrowserSectionHeader] = []
+        self.header_height_estimate = self.DEFAULT_HEADER_HEIGHT
+        self.row_height_estimate: Optional[int] = None
+        self.column_width = 0
+        self.is_updating = False
+        self.remeasure_timer = QTimer(self)
+        self.remeasure_timer.setSingleShot(True)
+        self.remeasure_timer.timeout.connect(self._remeasure_rows)
         self._setup_scroll_area()
         self._setup_layout()
+        self.is_initialized = True
 
     def _setup_layout(self):
-        self.grid_layout = QGridLayout(self.scroll_content)
-        self.grid_layout.setSpacing(0)
-        self.grid_layout.setContentsMargins(0, 0, 0, 0)
         self.layout: QVBoxLayout = QVBoxLayout(self)
         self.layout.addWidget(self.scroll_area)
         self.layout.setSpacing(0)
@@ -50,15 +84,260 @@ class DictionaryBrowserScrollWidget(QWidget):
             Qt.ScrollBarPolicy.ScrollBarAlwaysOff
         )
         self.scroll_area.setWidget(self.scroll_content)
+        self.scroll_area.verticalScrollBar().valueChanged.connect(
+            self.update_visible_rows
+        )
+
+    def set_rows(
+        self, rows: list[tuple[str, Union[str, list[tuple[str, list[str]]]]]]
+    ) -> None:
+        """Replace the displayed rows; no widget is built for rows out of view."""
+        self.clear_layout()
+        self.rows = rows
+        self.row_heights = [None] * len(rows)
+        self.section_rows = {
+            title: index
+            for index, (row_type, title) in enumerate(rows)
+            if row_type == HEADER_ROW
+        }
+        self._update_column_width()
+        self._update_row_offsets()
+        self.scroll_area.verticalScrollBar().setValue(0)
+        self.update_visible_rows()
 
     def clear_layout(self):
-        while self.grid_layout.count():
-            item = self.grid_layout.takeAt(0)
-            if item.widget():
-                item.widget().setParent(None)
+        self.browser.main_widget.thumbnail_cache.cancel_prefetch()
+        for row_index in list(self.materialized_rows):
+            self._release_row(row_index)
+        self.rows = []
+        self.row_heights = []
+        self.section_rows = {}
+        self._update_row_offsets()
+
+    def scroll_to_section(self, section: str) -> bool:
+        row_index = self.section_rows.get(section)
+        if row_index is None:
+            return False
+        self.scroll_area.verticalScrollBar().setValue(self.row_offsets[row_index])
+        return True
+
+    def update_visible_rows(self) -> None:
+        if self.is_updating or not self.rows:
+            return
+        self.is_updating = True
+        try:
+            # Measuring new rows can change the offsets, which can bring more
+            # rows into view; a few passes are enough for it to settle.
+            for _ in range(3):
+                if not self._materialize_visible_rows():
+                    break
+        finally:
+            self.is_updating = False
 
     def resize_dictionary_browser_scroll_widget(self):
-        if self.is_initialized:
-            thumbnail_boxes: list[ThumbnailBox] = self.thumbnail_boxes.values()
-            for box in thumbnail_boxes:
-                box.resize_thumbnail_box()
+        if not self.is_initialized or not self.rows:
+            return
+        if not self._update_column_width():
+            return
+        for row_index in list(self.materialized_rows):
+            self._release_row(row_index)
+        self.row_heights = [None] * len(self.rows)
+        self.row_height_estimate = None
+        self._update_row_offsets()
+        self.update_visible_rows()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.resize_dictionary_browser_scroll_widget()
+        self.update_visible_rows()
+
+    def remeasure_thumbnail_box(self, thumbnail_box: ThumbnailBox) -> None:
+        """Called when a box's image arrived with a different height."""
+        if self.thumbnail_boxes.get(thumbnail_box.word) is thumbnail_box:
+            self.remeasure_timer.start(0)
+
+    ### ROW MANAGEMENT ###
+
+    def _materialize_visible_rows(self) -> bool:
+        """Build the rows in range and release the rest; True if any height changed."""
+        scroll_bar = self.scroll_area.verticalScrollBar()
+        viewport_height = max(1, self.scroll_area.viewport().height())
+        overscan = int(viewport_height * self.OVERSCAN)
+        top = max(0, scroll_bar.value() - overscan)
+        bottom = scroll_bar.value() + viewport_height + overscan
+
+        first_row = max(0, bisect_right(self.row_offsets, top) - 1)
+        last_row = min(len(self.rows), bisect_right(self.row_offsets, bottom))
+        visible_rows = range(first_row, last_row)
+        viewport_rows = range(
+            max(0, bisect_right(self.row_offsets, scroll_bar.value()) - 1),
+            bisect_right(self.row_offsets, scroll_bar.value() + viewport_height),
+        )
+
+        for row_index in list(self.materialized_rows):
+            if row_index not in visible_rows:
+                self._release_row(row_index)
+
+        heights_changed = False
+        for row_index in visible_rows:
+            if row_index in self.materialized_rows:
+                continue
+            load_priority = (
+                self.VIEWPORT_LOAD_PRIORITY
+                if row_index in viewport_rows
+                else self.OVERSCAN_LOAD_PRIORITY
+            )
+            self.materialized_rows[row_index] = self._build_row(
+                row_index, load_priority
+            )
+            if self._store_row_height(row_index):
+                heights_changed = True
+
+        self._relayout_rows(heights_changed)
+        return heights_changed
+
+    def _remeasure_rows(self) -> None:
+        heights_changed = False
+        for row_index in self.materialized_rows:
+            if self._store_row_height(row_index):
+                heights_changed = True
+        if heights_changed:
+            self._relayout_rows(True)
+            self.update_visible_rows()
+
+    def _store_row_height(self, row_index: int) -> bool:
+        height = self._measure_row(row_index)
+        if height == self.row_heights[row_index]:
+            return False
+        self.row_heights[row_index] = height
+        return True
+
+    def _relayout_rows(self, heights_changed: bool) -> None:
+        """Recompute the offsets, keeping the row at the top of the viewport still."""
+        if heights_changed:
+            scroll_bar = self.scroll_area.verticalScrollBar()
+            self._update_estimates()
+            anchor_row = max(0, bisect_right(self.row_offsets, scroll_bar.value()) - 1)
+            anchor_delta = scroll_bar.value() - self.row_offsets[anchor_row]
+            self._update_row_offsets()
+            scroll_bar.setValue(self.row_offsets[anchor_row] + anchor_delta)
+
+        for row_index, widgets in self.materialized_rows.items():
+            self._position_row(row_index, widgets)
+
+    def _build_row(self, row_index: int, load_priority: int) -> list[QWidget]:
+        row_type, content = self.rows[row_index]
+        if row_type == HEADER_ROW:
+            header = self._acquire_section_header(content)
+            return [header]
+        return [
+            self._acquire_thumbnail_box(word, thumbnails, load_priority)
+            for word, thumbnails in content
+        ]
+
+    def _release_row(self, row_index: int) -> None:
+        for widget in self.materialized_rows.pop(row_index, []):
+            widget.hide()
+            if isinstance(widget, ThumbnailBox):
+                widget.image_label.cancel_pending_load()
+                if self.thumbnail_boxes.get(widget.word) is widget:
+                    del self.thumbnail_boxes[widget.word]
+                self.free_thumbnail_boxes.append(widget)
+            else:
+                self.free_section_headers.append(widget)
+
+    def _measure_row(self, row_index: int) -> int:
+        widgets = self.materialized_rows[row_index]
+        return max((widget.sizeHint().height() for widget in widgets), default=0)
+
+    def _position_row(self, row_index: int, widgets: list[QWidget]) -> None:
+        top = self.row_offsets[row_index]
+        height = self.row_offsets[row_index + 1] - top
+        if self.rows[row_index][0] == HEADER_ROW:
+            widgets[0].setGeometry(0, top, self.scroll_content.width(), height)
+            return
+        for column_index, thumbnail_box in enumerate(widgets):
+            left = column_index * self.column_width
+            left += (self.column_width - thumbnail_box.width()) // 2
+            thumbnail_box.setGeometry(left, top, thumbnail_box.width(), height)
+
+    def _update_estimates(self) -> None:
+        header_heights = []
+        thumbnail_row_heights = []
+        for (row_type, _), height in zip(self.rows, self.row_heights):
+            if height is None:
+                continue
+            if row_type == HEADER_ROW:
+                header_heights.append(height)
+            else:
+                thumbnail_row_heights.append(height)
+        if header_heights:
+            self.header_height_estimate = max(header_heights)
+        if thumbnail_row_heights:
+            self.row_height_estimate = sum(thumbnail_row_heights) // len(
+                thumbnail_row_heights
+            )
+
+    def _update_row_offsets(self) -> None:
+        row_height_estimate = (
+            self.row_height_estimate
+            or self.column_width + self.THUMBNAIL_BOX_CHROME_HEIGHT
+        )
+        heights = (
+            height
+            if height is not None
+            else (
+                self.header_height_estimate
+                if row_type == HEADER_ROW
+                else row_height_estimate
+            )
+            for (row_type, _), height in zip(self.rows, self.row_heights)
+        )
+        self.row_offsets = [0, *accumulate(heights)]
+        self.scroll_content.setFixedHeight(self.row_offsets[-1])
+
+    def _update_column_width(self) -> bool:
+        scrollbar_width = self.scroll_area.verticalScrollBar().width()
+        column_width = max(1, (self.width() - scrollbar_width) // self.num_columns)
+        if column_width == self.column_width:
+            return False
+        self.column_width = column_width
+        return True
+
+    ### WIDGET POOLS ###
+
+    def _acquire_thumbnail_box(
+        self, word: str, thumbnails: list[str], load_priority: int
+    ) -> ThumbnailBox:
+        if self.free_thumbnail_boxes:
+            thumbnail_box = self.free_thumbnail_boxes.pop()
+            thumbnail_box.bind(word, thumbnails)
+        else:
+            thumbnail_box = ThumbnailBox(self.browser, word, thumbnails)
+            thumbnail_box.setParent(self.scroll_content)
+        thumbnail_box.image_label.load_priority = load_priority
+        thumbnail_box.apply_font_color(self._get_font_color())
+        thumbnail_box.resize_thumbnail_box()
+        self.thumbnail_boxes[word] = thumbnail_box
+        self._restore_selection(thumbnail_box)
+        thumbnail_box.show()
+        return thumbnail_box
+
+    def _acquire_section_header(self, title: str) -> DictionaryBrowserSectionHeader:
+        if self.free_section_headers:
+            header = self.free_section_headers.pop()
+            header.set_title(title)
+        else:
+            header = DictionaryBrowserSectionHeader(title)
+            header.setParent(self.scroll_content)
+        header.show()
+        return header
+
+    def _restore_selection(self, thumbnail_box: ThumbnailBox) -> None:
+        selection_handler = self.browser.dictionary_widget.selection_handler
+        if selection_handler.selected_word == thumbnail_box.word:
+            selection_handler.update_selection(thumbnail_box.image_label)
+
+    def _get_font_color(self) -> str:
+        global_settings = self.browser.main_widget.main_window.settings_manager.global_settings
+        return global_settings.get_current_font_color()
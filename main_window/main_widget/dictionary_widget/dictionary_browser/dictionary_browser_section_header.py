@@ -17,6 +17,9 @@ class DictionaryBrowserSectionHeader(QWidget):
 
         self.setStyleSheet("background-color: rgba(255, 255, 255, 0.5);")
 
+    def set_title(self, title: str) -> None:
+        self.title_label.setText(title)
+
     def resizeEvent(self, event):
         font_size = int(self.width() // 35)
         self.title_label.setStyleSheet(
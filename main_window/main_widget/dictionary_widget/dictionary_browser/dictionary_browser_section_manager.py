@@ -1,12 +1,7 @@
 from datetime import datetime
-import json
 from typing import TYPE_CHECKING
 
-from main_window.main_widget.dictionary_widget.dictionary_browser.dictionary_browser_section_header import (
-    DictionaryBrowserSectionHeader,
-)
 from ..sorting_order import sorting_order, lowercase_letters
-from PIL import Image
 
 
 if TYPE_CHECKING:
@@ -18,14 +13,7 @@ if TYPE_CHECKING:
 class SectionManager:
     def __init__(self, browser: "DictionaryBrowser"):
         self.browser = browser
-
-    def add_header(self, row_index, num_columns, section):
-        header_title = f"{section}"
-        header = DictionaryBrowserSectionHeader(header_title)
-        self.browser.scroll_widget.section_headers[section] = header
-        self.browser.scroll_widget.grid_layout.addWidget(
-            header, row_index, 0, 1, num_columns
-        )
+        self.metadata_extractor = browser.main_widget.metadata_extractor
 
     def get_sorted_sections(self, sort_method, sections) -> list[str]:
         if sort_method == "sequence_length":
@@ -73,16 +61,11 @@ class SectionManager:
     def get_date_added(self, thumbnails):
         dates = []
         for thumbnail in thumbnails:
-            image = Image.open(thumbnail)
-            info = image.info
-            metadata = info.get("metadata")
-            if metadata:
-                metadata_dict = json.loads(metadata)
-                date_added = metadata_dict.get("date_added")
-                if date_added:
-                    try:
-                        dates.append(datetime.fromisoformat(date_added))
-                    except ValueError:
-                        pass
+            date_added = self.metadata_extractor.get_date_added(thumbnail)
+            if date_added:
+                try:
+                    dates.append(datetime.fromisoformat(date_added))
+                except ValueError:
+                    pass
 
         return max(dates, default=datetime.min)
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Dict, List, Tuple
+from typing import TYPE_CHECKING
 from PyQt6.QtWidgets import (
     QVBoxLayout,
     QPushButton,
@@ -9,7 +9,6 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QPixmap
-import os
 from functools import partial
 
 from utilities.path_helpers import get_images_and_data_path
@@ -101,57 +100,17 @@ class AuthorSection(FilterSectionBase):
         """Handle clicks on author buttons."""
         self.initial_selection_widget.on_author_button_clicked(author)
 
-    def _get_all_sequences_with_authors(self) -> List[Tuple[str, list[str], str]]:
-        """Retrieve and cache all sequences along with their authors."""
-        if hasattr(self, "_all_sequences_with_authors"):
-            return self._all_sequences_with_authors
-
-        dictionary_dir = get_images_and_data_path("dictionary")
-        base_words = [
-            (
-                word,
-                self.main_widget.thumbnail_finder.find_thumbnails(
-                    os.path.join(dictionary_dir, word)
-                ),
-            )
-            for word in os.listdir(dictionary_dir)
-            if os.path.isdir(os.path.join(dictionary_dir, word))
-            and "__pycache__" not in word
-        ]
-
-        sequences_with_authors = []
-        for word, thumbnails in base_words:
-            author = self.get_sequence_author(thumbnails)
-            if author is not None:
-                sequences_with_authors.append((word, thumbnails, author))
-
-        self._all_sequences_with_authors = sequences_with_authors
-        return sequences_with_authors
-
     def _get_sequence_counts_per_author(self) -> dict[str, int]:
         """Compute the number of sequences available for each author."""
-        author_counts: dict[str, int] = {}
-        sequences_with_authors = self._get_all_sequences_with_authors()
-        for _, _, author in sequences_with_authors:
-            author_counts[author] = author_counts.get(author, 0) + 1
-        return author_counts
-
-    def get_sequences_by_author(self, author: str) -> List[Tuple[str, list[str]]]:
-        """Retrieve sequences that correspond to a specific author."""
-        sequences_with_authors = self._get_all_sequences_with_authors()
-        return [
-            (word, thumbnails)
-            for word, thumbnails, seq_author in sequences_with_authors
-            if seq_author == author
-        ]
-
-    def get_sequence_author(self, thumbnails: list[str]) -> str:
-        """Extract the author from the metadata of the thumbnails."""
-        for thumbnail in thumbnails:
-            author = self.main_widget.metadata_extractor.get_sequence_author(thumbnail)
-            if author:
-                return author
-        return None
+        return self.main_widget.dictionary_search_engine.get_facet_counts("author")
+
+    def update_sequence_counts(self):
+        """Refresh the tallies; the search engine keeps the counts current."""
+        self.sequence_counts = self._get_sequence_counts_per_author()
+        for author, label in self.sequence_count_labels.items():
+            count = self.sequence_counts.get(author, 0)
+            sequence_text = "sequence" if count == 1 else "sequences"
+            label.setText(f"{count} {sequence_text}")
 
     def display_only_thumbnails_by_author(self, author: str):
         """Display only the thumbnails that match the selected author."""
@@ -160,24 +119,14 @@ class AuthorSection(FilterSectionBase):
         )
         self.browser.prepare_ui_for_filtering(f"sequences by {author}")
 
-        sequences = self.get_sequences_by_author(author)
+        sequences = self.main_widget.dictionary_search_engine.find_sequences(
+            {"author": author}
+        )
         total_sequences = len(sequences)
-
-        self.browser.currently_displayed_sequences = [
-            (word, thumbnails, self.get_sequence_length_from_thumbnails(thumbnails))
-            for word, thumbnails in sequences
-        ]
+        self.browser.currently_displayed_sequences = sequences
 
         self.browser.update_and_display_ui(total_sequences, author)
 
-    def get_sequence_length_from_thumbnails(self, thumbnails: list[str]) -> int:
-        """Extract the sequence length from the thumbnails' metadata."""
-        for thumbnail in thumbnails:
-            length = self.metadata_extractor.get_sequence_length(thumbnail)
-            if length is not None:
-                return length
-        return 0
-
     def resize_author_section(self):
         """Handle resizing of the author section."""
         self.resize_buttons()
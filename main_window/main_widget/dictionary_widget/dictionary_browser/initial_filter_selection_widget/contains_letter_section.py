@@ -4,10 +4,9 @@ from PyQt6.QtWidgets import (
     QHBoxLayout,
     QPushButton,
     QLabel,
-    QApplication,
     QWidget,
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt
 from .filter_section_base import FilterSectionBase
 
 if TYPE_CHECKING:
@@ -102,12 +101,13 @@ class ContainsLettersSection(FilterSectionBase):
         if not self.selected_letters:
             return 0
 
-        base_words = self.thumbnail_box_sorter.get_sorted_base_words("sequence_length")
-        return sum(
-            any(letter in word for letter in self.selected_letters)
-            for word, _, _ in base_words
+        return self.main_widget.dictionary_search_engine.count(
+            {"contains_letters": list(self.selected_letters)}
         )
 
+    def update_sequence_counts(self):
+        self.update_letter_selection()
+
     def apply_filter(self):
         """Apply the filter based on the selected letters."""
         self.initial_selection_widget.apply_contains_letter_filter(
@@ -123,49 +123,13 @@ class ContainsLettersSection(FilterSectionBase):
             f"sequences containing\n{display_letters}"
         )
 
-        sort_method = (
-            self.main_widget.main_window.settings_manager.dictionary_settings.get_sort_method()
+        matching_sequences = self.main_widget.dictionary_search_engine.find_sequences(
+            {"contains_letters": letters}
         )
-        base_words = self.thumbnail_box_sorter.get_sorted_base_words("sequence_length")
-
-        matching_sequences = [
-            (word, thumbnails, seq_length)
-            for word, thumbnails, seq_length in base_words
-            if any(
-                self._is_valid_letter_match(word, letter, letters) for letter in letters
-            )
-        ]
 
         total_sequences = len(matching_sequences) or 1
         self.browser.currently_displayed_sequences = matching_sequences
-        self.browser.number_of_sequences_label.setText(
-            f"Number of words to be displayed: {len(matching_sequences)}"
-        )
-
-        def update_ui():
-            for index, (word, thumbnails, _) in enumerate(matching_sequences):
-                row_index = index // self.thumbnail_box_sorter.num_columns
-                column_index = index % self.thumbnail_box_sorter.num_columns
-                self.thumbnail_box_sorter.add_thumbnail_box(
-                    row_index=row_index,
-                    column_index=column_index,
-                    word=word,
-                    thumbnails=thumbnails,
-                    hidden=True,
-                )
-                percentage = int(((index + 1) / total_sequences) * 100)
-                self.browser.progress_bar.setValue(percentage)
-                self.browser.number_of_sequences_label.setText(
-                    f"Number of words: {index + 1}"
-                )
-                QApplication.processEvents()
-
-            self.browser.progress_bar.setVisible(False)
-            self.browser.update_and_display_ui(total_sequences, display_letters)
-
-            QApplication.restoreOverrideCursor()
-
-        QTimer.singleShot(0, update_ui)
+        self.browser.update_and_display_ui(total_sequences, display_letters)
         self.initial_selection_widget.browser.dictionary_widget.dictionary_settings.set_current_filter(
             {"contains_letters": letters}
         )
@@ -184,28 +148,6 @@ class ContainsLettersSection(FilterSectionBase):
         else:
             return ", ".join(letters[:-1]) + ", or " + letters[-1]
 
-    def _is_valid_letter_match(
-        self, word: str, letter: str, letters: list[str]
-    ) -> bool:
-        """Check if a letter is a valid match in the word."""
-        if letter not in word:
-            return False
-
-        letter_with_dash = f"{letter}-"
-        if len(letter) == 1:
-            if letter_with_dash in word and letter_with_dash not in letters:
-                return False
-            if word.endswith(letter_with_dash) and letter_with_dash not in letters:
-                return False
-            index = word.find(letter)
-            if index != -1 and index < len(word) - 1 and word[index + 1] == "-":
-                return False
-        else:
-            if letter_with_dash in word and letter_with_dash not in letters:
-                return False
-
-        return True
-
     def resize_contains_letters_section(self):
         self.resize_widget_font(self.header_label)
         self.resize_widget_font(self.sequence_tally_label)
@@ -78,6 +78,7 @@ class DictionaryInitialSelectionsWidget(QWidget):
             if section_name != "filter_choice" and isinstance(
                 section, FilterSectionBase
             ):
+                section.update_sequence_counts()
                 resize_method = getattr(section, f"resize_{section_name}_section", None)
                 if callable(resize_method):
                     resize_method()
@@ -61,6 +61,10 @@ class FilterSectionBase(QWidget):
         # placeholder method, implemented in subclasses
         pass
 
+    def update_sequence_counts(self):
+        # called whenever the section is shown; sections with tallies override it
+        pass
+
     def resize_go_back_button(self):
         self.back_button.setFixedWidth(self.main_widget.width() // 20)
         self.back_button.setFixedHeight(self.main_widget.height() // 20)
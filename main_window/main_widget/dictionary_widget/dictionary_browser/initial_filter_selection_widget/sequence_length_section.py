@@ -99,13 +99,17 @@ class SequenceLengthSection(FilterSectionBase):
 
     def _get_sequence_length_counts(self) -> dict[int, int]:
         """Tally up how many sequences are available for each length."""
-        length_counts = {}
-        base_words = self.thumbnail_box_sorter.get_sorted_base_words("sequence_length")
-
-        for _, _, seq_length in base_words:
-            length_counts[seq_length] = length_counts.get(seq_length, 0) + 1
+        return self.main_widget.dictionary_search_engine.get_facet_counts(
+            "sequence_length"
+        )
 
-        return length_counts
+    def update_sequence_counts(self):
+        """Refresh the tallies; the search engine keeps the counts current."""
+        sequence_counts = self._get_sequence_length_counts()
+        for length, label in self.sequence_tally_labels.items():
+            count = sequence_counts.get(length, 0)
+            sequence_text = "sequence" if count == 1 else "sequences"
+            label.setText(f"{count} {sequence_text}")
 
     def display_only_thumbnails_with_sequence_length(self, length: int):
         """Display sequences of a specific length."""
@@ -114,12 +118,9 @@ class SequenceLengthSection(FilterSectionBase):
         )
         self.browser.prepare_ui_for_filtering(f"sequences of length {length}")
 
-        base_words = self.thumbnail_box_sorter.get_sorted_base_words("sequence_length")
-        matching_sequences = [
-            (word, thumbnails, seq_length)
-            for word, thumbnails, seq_length in base_words
-            if seq_length == length
-        ]
+        matching_sequences = self.main_widget.dictionary_search_engine.find_sequences(
+            {"sequence_length": length}
+        )
 
         total_sequences = len(matching_sequences) or 1  # Prevent division by zero
         self.browser.currently_displayed_sequences = matching_sequences
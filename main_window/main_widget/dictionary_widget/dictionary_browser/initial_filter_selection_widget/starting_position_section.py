@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Dict, List, Tuple
+from typing import TYPE_CHECKING
 from PyQt6.QtWidgets import (
     QVBoxLayout,
     QPushButton,
@@ -143,61 +143,17 @@ class StartingPositionSection(FilterSectionBase):
         """Handle clicks on position images."""
         self.handle_position_click(position)
 
-    def _get_all_sequences_with_positions(self) -> List[Tuple[str, list[str], str]]:
-        """Retrieve and cache all sequences along with their starting positions."""
-        if hasattr(self, "_all_sequences_with_positions"):
-            return self._all_sequences_with_positions
-
-        dictionary_dir = get_images_and_data_path("dictionary")
-        base_words = [
-            (
-                word,
-                self.main_widget.thumbnail_finder.find_thumbnails(
-                    os.path.join(dictionary_dir, word)
-                ),
-            )
-            for word in os.listdir(dictionary_dir)
-            if os.path.isdir(os.path.join(dictionary_dir, word))
-            and "__pycache__" not in word
-        ]
-
-        sequences_with_positions = []
-        for word, thumbnails in base_words:
-            position = self.get_sequence_starting_position(thumbnails)
-            if position is not None:
-                sequences_with_positions.append((word, thumbnails, position))
-
-        self._all_sequences_with_positions = sequences_with_positions
-        return sequences_with_positions
-
     def _get_sequence_counts_per_position(self) -> dict[str, int]:
         """Compute the number of sequences available for each starting position."""
-        position_counts: dict[str, int] = {}
-        sequences_with_positions = self._get_all_sequences_with_positions()
-        for _, _, position in sequences_with_positions:
-            position_counts[position] = position_counts.get(position, 0) + 1
-        return position_counts
-
-    def get_sequences_that_are_a_specific_position(
-        self, position: str
-    ) -> List[Tuple[str, list[str]]]:
-        """Retrieve sequences that correspond to a specific starting position."""
-        sequences_with_positions = self._get_all_sequences_with_positions()
-        return [
-            (word, thumbnails)
-            for word, thumbnails, seq_position in sequences_with_positions
-            if seq_position == position.lower()
-        ]
-
-    def get_sequence_starting_position(self, thumbnails: list[str]) -> str:
-        """Extract the starting position from the metadata of the thumbnails."""
-        for thumbnail in thumbnails:
-            start_position = self.metadata_extractor.get_sequence_start_position(
-                thumbnail
-            )
-            if start_position:
-                return start_position
-        return None
+        return self.main_widget.dictionary_search_engine.get_facet_counts("starting_position")
+
+    def update_sequence_counts(self):
+        """Refresh the tallies; the search engine keeps the counts current."""
+        self.sequence_counts = self._get_sequence_counts_per_position()
+        for position, label in self.sequence_count_labels.items():
+            count = self.sequence_counts.get(position.lower(), 0)
+            sequence_text = "sequence" if count == 1 else "sequences"
+            label.setText(f"{count} {sequence_text}")
 
     def display_only_thumbnails_with_starting_position(self, position: str):
         """Display only the thumbnails that match the selected starting position."""
@@ -206,24 +162,14 @@ class StartingPositionSection(FilterSectionBase):
         )
         self.browser.prepare_ui_for_filtering(f"sequences starting at {position}")
 
-        sequences = self.get_sequences_that_are_a_specific_position(position)
+        sequences = self.main_widget.dictionary_search_engine.find_sequences(
+            {"starting_position": position}
+        )
         total_sequences = len(sequences)
-
-        self.browser.currently_displayed_sequences = [
-            (word, thumbnails, self.get_sequence_length_from_thumbnails(thumbnails))
-            for word, thumbnails in sequences
-        ]
+        self.browser.currently_displayed_sequences = sequences
 
         self.browser.update_and_display_ui(total_sequences, position)
 
-    def get_sequence_length_from_thumbnails(self, thumbnails: list[str]) -> int:
-        """Extract the sequence length from the thumbnails' metadata."""
-        for thumbnail in thumbnails:
-            length = self.metadata_extractor.get_sequence_length(thumbnail)
-            if length is not None:
-                return length
-        return 0
-
     def eventFilter(self, source: QObject, event: QEvent) -> bool:
         """Handle hover events to add or remove borders on images."""
         if isinstance(source, QLabel):
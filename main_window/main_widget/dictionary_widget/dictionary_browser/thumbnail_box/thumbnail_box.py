@@ -1,8 +1,6 @@
 from typing import TYPE_CHECKING
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPixmap
 from PyQt6.QtWidgets import QVBoxLayout, QWidget, QApplication
-from main_window.main_widget.metadata_extractor import MetaDataExtractor
 from main_window.main_widget.dictionary_widget.dictionary_browser.thumbnail_box.thumbnail_box_nav_btns import (
     ThumbnailBoxNavButtonsWidget,
 )
@@ -29,6 +27,7 @@ class ThumbnailBox(QWidget):
         self.browser = browser
         self.setContentsMargins(0, 0, 0, 0)
         self.favorite_status = False  # Default favorite status
+        self.font_color: str = None
         self._setup_components()
         self._setup_layout()
         self.layout.setSpacing(0)
@@ -36,7 +35,7 @@ class ThumbnailBox(QWidget):
         self.word_label.update_favorite_icon(self.favorite_status)
 
     def _setup_components(self):
-        self.metadata_extractor = MetaDataExtractor(self.main_widget)
+        self.metadata_extractor = self.main_widget.metadata_extractor
         self.word_label = WordLabel(self)
         self.image_label = ThumbnailImageLabel(self)
         self.variation_number_label = VariationNumberLabel(self)
@@ -58,6 +57,31 @@ class ThumbnailBox(QWidget):
         )
         # self.setStyleSheet("background-color: rgba(255, 255, 255, 0.5);")
 
+    def bind(self, word: str, thumbnails: list[str]) -> None:
+        """Reuse this box for another word when the browser grid recycles it."""
+        self.word = word
+        self.thumbnails = thumbnails
+        self.current_index = 0
+        self.word_label.word_label.setText(word)
+        self.image_label.thumbnails = thumbnails
+        self.image_label.sequence_lengths.clear()
+        if self.image_label.is_selected:
+            self.image_label.set_selected(False)
+        self.nav_buttons_widget.thumbnails = thumbnails
+        self.nav_buttons_widget.setVisible(len(thumbnails) > 1)
+        self.variation_number_label.setVisible(len(thumbnails) > 1)
+        self.variation_number_label.update_index(self.current_index)
+        self.load_favorite_status()
+        self.word_label.update_favorite_icon(self.favorite_status)
+
+    def apply_font_color(self, font_color: str) -> None:
+        if font_color == self.font_color:
+            return
+        self.font_color = font_color
+        self.word_label.setStyleSheet(f"color: {font_color};")
+        self.word_label.reload_favorite_icon()
+        self.variation_number_label.setStyleSheet(f"color: {font_color};")
+
     def is_favorite(self) -> bool:
         return self.favorite_status
 
@@ -110,7 +134,7 @@ class ThumbnailBox(QWidget):
                 self.thumbnails
             )
         self.image_label.thumbnails = thumbnails
-        self.image_label.set_pixmap_to_fit(QPixmap(self.thumbnails[self.current_index]))
+        self.image_label.update_thumbnail(self.current_index)
         if len(self.thumbnails) == 1:
             self.variation_number_label.hide()
         else:
@@ -1,5 +1,5 @@
 from PyQt6.QtCore import Qt, QEvent
-from PyQt6.QtGui import QPixmap, QCursor, QMouseEvent
+from PyQt6.QtGui import QImage, QPixmap, QCursor, QMouseEvent
 from PyQt6.QtWidgets import QLabel, QApplication
 from typing import TYPE_CHECKING
 
@@ -17,33 +17,68 @@ class ThumbnailImageLabel(QLabel):
         self.mousePressEvent = self.thumbnail_clicked
         self.thumbnails = thumbnail_box.thumbnails
         self.metadata_extractor = thumbnail_box.main_widget.metadata_extractor
+        self.thumbnail_cache = thumbnail_box.main_widget.thumbnail_cache
+        self.thumbnail_loader = thumbnail_box.main_widget.thumbnail_loader
+        self.request_id: int = None
+        self.load_priority = 0
         self.browser = thumbnail_box.browser
         self.is_selected = False
+        self.sequence_lengths: dict[str, int] = {}
 
         self.setScaledContents(False)
 
     def update_thumbnail(self, index):
+        """Show a placeholder and load the image on the thumbnail loader."""
+        self.cancel_pending_load()
         if self.thumbnails and 0 <= index < len(self.thumbnails):
-            pixmap = QPixmap(self.thumbnails[index])
-            self.set_pixmap_to_fit(pixmap)
+            target_width = self.get_target_width()
+            self.show_placeholder(self.thumbnails[index], target_width)
+            self.request_id = self.thumbnail_loader.request(
+                self.thumbnails[index],
+                target_width,
+                self._on_image_loaded,
+                self.load_priority,
+            )
         else:
             self.setText("No image available")
 
-    def set_pixmap_to_fit(self, pixmap: QPixmap):
-        sequence_length = self.metadata_extractor.get_sequence_length(
-            self.thumbnail_box.thumbnails[self.thumbnail_box.current_index]
-        )
-        if sequence_length == 1:
-            target_width = int(self.thumbnail_box.width() * 0.6) - int(
-                self.thumbnail_box.margin * 2
+    def cancel_pending_load(self) -> None:
+        if self.request_id is not None:
+            self.thumbnail_loader.cancel(self.request_id)
+            self.request_id = None
+
+    def show_placeholder(self, thumbnail: str, width: int) -> None:
+        """Reserve the image's size so the grid does not jump when it arrives."""
+        image_size = self.thumbnail_cache.get_image_size(thumbnail)
+        height = round(width * image_size[1] / image_size[0]) if image_size else width
+        placeholder = QPixmap(max(1, width), max(1, height))
+        placeholder.fill(Qt.GlobalColor.transparent)
+        self.setPixmap(placeholder)
+        self.adjustSize()
+
+    def _on_image_loaded(self, image: QImage) -> None:
+        self.request_id = None
+        previous_height = self.pixmap().height()
+        self.setPixmap(QPixmap.fromImage(image))
+        self.adjustSize()
+        if image.height() != previous_height:
+            self.browser.scroll_widget.remeasure_thumbnail_box(self.thumbnail_box)
+
+    def get_target_width(self) -> int:
+        thumbnail = self.thumbnail_box.thumbnails[self.thumbnail_box.current_index]
+        if thumbnail not in self.sequence_lengths:
+            self.sequence_lengths[thumbnail] = (
+                self.metadata_extractor.get_sequence_length(thumbnail)
             )
-        else:
-            target_width = self.thumbnail_box.width() - int(
+        if self.sequence_lengths[thumbnail] == 1:
+            return int(self.thumbnail_box.width() * 0.6) - int(
                 self.thumbnail_box.margin * 2
             )
+        return self.thumbnail_box.width() - int(self.thumbnail_box.margin * 2)
 
+    def set_pixmap_to_fit(self, pixmap: QPixmap):
         scaled_pixmap = pixmap.scaledToWidth(
-            target_width, Qt.TransformationMode.SmoothTransformation
+            self.get_target_width(), Qt.TransformationMode.SmoothTransformation
         )
         self.setPixmap(scaled_pixmap)
         self.adjustSize()
@@ -53,9 +88,15 @@ class ThumbnailImageLabel(QLabel):
             metadata = self.metadata_extractor.extract_metadata_from_file(
                 self.thumbnails[0]
             )
+            preview_width = int(self.browser.dictionary_widget.preview_area.width() * 0.9)
             self.browser.dictionary_widget.selection_handler.thumbnail_clicked(
                 self,
-                QPixmap(self.thumbnails[self.thumbnail_box.current_index]),
+                QPixmap(
+                    self.thumbnail_cache.get_path(
+                        self.thumbnails[self.thumbnail_box.current_index],
+                        preview_width,
+                    )
+                ),
                 metadata,
                 self.thumbnails,
                 self.thumbnail_box.current_index,
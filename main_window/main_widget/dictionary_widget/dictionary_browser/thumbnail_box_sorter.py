@@ -1,10 +1,9 @@
-import os
 from datetime import datetime
 from typing import TYPE_CHECKING
-from main_window.main_widget.dictionary_widget.dictionary_browser.thumbnail_box.thumbnail_box import (
-    ThumbnailBox,
+from main_window.main_widget.dictionary_widget.dictionary_browser.dictionary_browser_scroll_widget import (
+    HEADER_ROW,
+    THUMBNAIL_ROW,
 )
-from utilities.path_helpers import get_images_and_data_path
 from PyQt6.QtWidgets import QApplication
 
 if TYPE_CHECKING:
@@ -33,7 +32,6 @@ class ThumbnailBoxSorter:
     def sort_and_display_currently_filtered_sequences_by_method(
         self, sort_method: str
     ) -> None:
-        self.browser.scroll_widget.clear_layout()
         self.browser.sections = {}
         if sort_method == "sequence_length":
             self.browser.currently_displayed_sequences.sort(
@@ -47,7 +45,6 @@ class ThumbnailBoxSorter:
         else:
             self.browser.currently_displayed_sequences.sort(key=lambda x: x[0])
 
-        row_index = 0
         for word, thumbnails, seq_length in self.browser.currently_displayed_sequences:
             section = self.section_manager.get_section_from_word(
                 word, sort_method, seq_length, thumbnails
@@ -69,6 +66,7 @@ class ThumbnailBoxSorter:
             sort_method
         )
 
+        rows = []
         for section in sorted_sections:
             if sort_method == "date_added":
                 if section == "Unknown":
@@ -78,30 +76,23 @@ class ThumbnailBoxSorter:
                 formatted_day = f"{int(day)}-{int(month)}"
 
                 if year != current_section:
-                    row_index += 1
-                    self.section_manager.add_header(row_index, self.num_columns, year)
-                    row_index += 1
+                    rows.append((HEADER_ROW, year))
                     current_section = year
 
-                row_index += 1
-                self.section_manager.add_header(
-                    row_index, self.num_columns, formatted_day
-                )
-                row_index += 1
+                rows.append((HEADER_ROW, formatted_day))
             else:
-                row_index += 1
-                self.section_manager.add_header(row_index, self.num_columns, section)
-                row_index += 1
+                rows.append((HEADER_ROW, section))
 
-            column_index = 0  # Reset column index at the start of each section
-
-            for word, thumbnails in self.browser.sections[section]:
-                self.add_thumbnail_box(row_index, column_index, word, thumbnails)
-                column_index += 1
-                if column_index == self.num_columns:
-                    column_index = 0
-                    row_index += 1
+            words = self.browser.sections[section]
+            for start in range(0, len(words), self.num_columns):
+                rows.append((THUMBNAIL_ROW, words[start : start + self.num_columns]))
 
+        self.browser.scroll_widget.set_rows(rows)
+        self.main_widget.thumbnail_cache.prefetch(
+            thumbnail
+            for _, thumbnails, _ in self.browser.currently_displayed_sequences
+            for thumbnail in thumbnails
+        )
         self.browser.number_of_sequences_label.setText(
             f"Number of words: {len(self.browser.currently_displayed_sequences)}"
         )
@@ -131,71 +122,44 @@ class ThumbnailBoxSorter:
             "grid_mode": grid_mode_section.display_only_thumbnails_with_grid_mode,
             "show_all": self.browser.show_all_sequences,
         }
-        if initial_selection:
-            for key, value in initial_selection.items():
-                if key in display_functions:
-                    if key in ["favorites", "show_all"]:
-                        display_functions[key]()
-                    else:
-                        display_functions[key](value)
-
-    ### HELPER FUNCTIONS ###
-
-    def add_thumbnail_box(
-        self, row_index, column_index, word, thumbnails, hidden: bool = False
-    ):
-        if word not in self.browser.scroll_widget.thumbnail_boxes:
-            thumbnail_box = ThumbnailBox(self.browser, word, thumbnails)
-            thumbnail_box.resize_thumbnail_box()
-            thumbnail_box.image_label.update_thumbnail(thumbnail_box.current_index)
-            self.browser.scroll_widget.thumbnail_boxes[word] = thumbnail_box
-        else:
-            thumbnail_box = self.browser.scroll_widget.thumbnail_boxes[word]
-
-        if hidden:
-            thumbnail_box.hide()
-
-        self.browser.scroll_widget.grid_layout.addWidget(
-            thumbnail_box, row_index, column_index
+        if not initial_selection:
+            return
+        if len(initial_selection) > 1:
+            self.display_sequences_matching(initial_selection)
+            return
+        for key, value in initial_selection.items():
+            if key in display_functions:
+                if key in ["favorites", "show_all"]:
+                    display_functions[key]()
+                else:
+                    display_functions[key](value)
+
+    def display_sequences_matching(self, criteria: dict, match_all: bool = True):
+        """Display the words matching every criterion, or any with match_all=False."""
+        description = self.describe_criteria(criteria, match_all)
+        self.browser.prepare_ui_for_filtering(description)
+        sequences = self.main_widget.dictionary_search_engine.find_sequences(
+            criteria, match_all
         )
-
-        if not hidden:
-            thumbnail_box.show()
-
-    def get_sorted_base_words(self, sort_order):
-        dictionary_dir = get_images_and_data_path("dictionary")
-        base_words = [
-            (
-                d,
-                self.main_widget.thumbnail_finder.find_thumbnails(
-                    os.path.join(dictionary_dir, d)
-                ),
-                None,
-            )
-            for d in os.listdir(dictionary_dir)
-            if os.path.isdir(os.path.join(dictionary_dir, d)) and "__pycache__" not in d
+        self.browser.currently_displayed_sequences = sequences
+        self.browser.update_and_display_ui(len(sequences), description)
+
+    def describe_criteria(self, criteria: dict, match_all: bool) -> str:
+        descriptions = {
+            "starting_letter": lambda value: f"starting with {value}",
+            "contains_letters": lambda value: f"containing {', '.join(value)}",
+            "sequence_length": lambda value: f"of length {value}",
+            "level": lambda value: f"of level {value}",
+            "author": lambda value: f"by {value}",
+            "starting_position": lambda value: f"starting at {value}",
+            "grid_mode": lambda value: f"in {value} mode",
+            "favorites": lambda value: "marked as favorite",
+            "most_recent": lambda value: "added recently",
+        }
+        parts = [
+            descriptions[key](value)
+            for key, value in criteria.items()
+            if key in descriptions
         ]
-
-        for i, (word, thumbnails, _) in enumerate(base_words):
-            sequence_length = self.get_sequence_length_from_thumbnails(thumbnails)
-
-            base_words[i] = (word, thumbnails, sequence_length)
-
-        if sort_order == "sequence_length":
-            base_words.sort(key=lambda x: x[2] if x[2] is not None else float("inf"))
-        elif sort_order == "date_added":
-            base_words.sort(
-                key=lambda x: self.section_manager.get_date_added(x[1]) or datetime.min,
-                reverse=True,
-            )
-        else:
-            base_words.sort(key=lambda x: x[0])
-        return base_words
-
-    def get_sequence_length_from_thumbnails(self, thumbnails):
-        """Extract the sequence length from the first available thumbnail metadata."""
-        for thumbnail in thumbnails:
-            length = self.metadata_extractor.get_sequence_length(thumbnail)
-            if length:
-                return length
-        return None
+        joiner = " and " if match_all else " or "
+        return f"sequences {joiner.join(parts)}" if parts else "all sequences"
@@ -97,7 +97,12 @@ class DictionaryButtonPanel(QWidget):
         """Display the current image in full screen mode."""
         current_thumbnail = self.preview_area.get_thumbnail_at_current_index()
         if current_thumbnail:
-            pixmap = QPixmap(current_thumbnail)
+            main_widget = self.preview_area.main_widget
+            pixmap = QPixmap(
+                main_widget.thumbnail_cache.get_path(
+                    current_thumbnail, main_widget.main_window.width()
+                )
+            )
             if self.full_screen_overlay:
                 self.full_screen_overlay.close()  # Close any existing overlay
             self.full_screen_overlay = FullScreenImageOverlay(
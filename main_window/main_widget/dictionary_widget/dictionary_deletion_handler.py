@@ -38,12 +38,12 @@ class DictionaryDeletionHandler:
             )
             file_path = thumbnail_box.thumbnails.pop(index)
             os.remove(file_path)
+            self.dictionary_widget.main_widget.metadata_extractor.invalidate_file(
+                file_path
+            )
             if len(thumbnail_box.thumbnails) == 0:
                 self.delete_word(thumbnail_box.word)
                 self.dictionary_widget.preview_area.update_thumbnails()
-                self.dictionary_widget.browser.scroll_widget.thumbnail_boxes.pop(
-                    thumbnail_box.word
-                )
             else:
                 self.delete_empty_folders(get_images_and_data_path("dictionary"))
                 thumbnail_box.current_index = 0
@@ -76,8 +76,11 @@ class DictionaryDeletionHandler:
                 os.chmod(dir_path, 0o777)
         os.chmod(base_path, 0o777)
         shutil.rmtree(base_path)
+        metadata_extractor = self.dictionary_widget.main_widget.metadata_extractor
+        metadata_extractor.invalidate_directory(base_path)
         self.delete_empty_folders(get_images_and_data_path("dictionary"))
         self.variation_number_fixer.ensure_sequential_versions()
+        metadata_extractor.prune_index()
         self.dictionary_widget.browser.thumbnail_box_sorter.reload_currently_displayed_filtered_sequences()
 
     def delete_empty_folders(self, root_folder):
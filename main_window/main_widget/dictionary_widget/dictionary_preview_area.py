@@ -112,7 +112,11 @@ class DictionaryPreviewArea(QWidget):
             return
 
         if self.thumbnails and index is not None:
-            pixmap = QPixmap(self.thumbnails[index])
+            pixmap = QPixmap(
+                self.main_widget.thumbnail_cache.get_path(
+                    self.thumbnails[index], int(self.width() * 0.9)
+                )
+            )
             if pixmap.height() != 0:
                 self.image_label.scale_pixmap_to_label(pixmap)
 
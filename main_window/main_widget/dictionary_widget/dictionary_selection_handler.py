@@ -13,6 +13,7 @@ class DictionarySelectionHandler:
     def __init__(self, dictionary_widget: "DictionaryWidget") -> None:
         self.dictionary_widget = dictionary_widget
         self.currently_selected_thumbnail: ThumbnailImageLabel = None
+        self.selected_word: str = None
 
     def update_selection(self, thumbnail_image_label: "ThumbnailImageLabel") -> None:
         if self.currently_selected_thumbnail:
@@ -20,6 +21,7 @@ class DictionarySelectionHandler:
         self.currently_selected_thumbnail: ThumbnailImageLabel = thumbnail_image_label
         self.currently_selected_thumbnail.set_selected(True)
         self.currently_selected_thumbnail.is_selected = True
+        self.selected_word = thumbnail_image_label.thumbnail_box.word
 
     def thumbnail_clicked(
         self,
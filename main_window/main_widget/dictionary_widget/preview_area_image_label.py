@@ -17,6 +17,7 @@ class PreviewAreaImageLabel(QLabel):
         self.thumbnails = preview_area.thumbnails
         self.current_index = preview_area.current_index
         self.metadata_extractor = preview_area.main_widget.metadata_extractor
+        self.thumbnail_cache = preview_area.main_widget.thumbnail_cache
         self.browser = preview_area.dictionary_widget.browser
         self.is_selected = False
         self.setStyleSheet("border: 3px solid black;")
@@ -27,7 +28,12 @@ class PreviewAreaImageLabel(QLabel):
     def update_thumbnail(self):
         self.thumbnails = self.preview_area.thumbnails
         if self.thumbnails:
-            pixmap = QPixmap(self.thumbnails[self.preview_area.current_index])
+            pixmap = QPixmap(
+                self.thumbnail_cache.get_path(
+                    self.thumbnails[self.preview_area.current_index],
+                    int(self.preview_area.width() * 0.9),
+                )
+            )
             self.set_pixmap_to_fit(pixmap)
         else:
             self.setText("No image available")
@@ -0,0 +1,253 @@
+import hashlib
+import json
+import os
+from typing import TYPE_CHECKING, Any, Optional
+from PyQt6.QtCore import QTimer
+
+from utilities.path_helpers import get_user_editable_resource_path
+
+if TYPE_CHECKING:
+    from main_window.main_widget.json_manager.json_manager import JsonManager
+
+
+class CurrentSequenceDocument:
+    """
+    The authoritative in-memory copy of current_sequence.json.
+
+    Every edit is applied in memory and appended as one line to
+    current_sequence.journal, so an edit costs a single small write. The
+    journal is compacted into current_sequence.json after a quiet period or
+    when flush() is called. The journal starts with the hash of the snapshot
+    it applies to; after a crash it is replayed on load, and a journal left
+    behind by an interrupted compaction no longer matches and is dropped.
+    """
+
+    FLUSH_DELAY_MS = 5000
+
+    def __init__(self, json_manager: "JsonManager") -> None:
+        self.json_manager = json_manager
+        self.file_path = get_user_editable_resource_path("current_sequence.json")
+        self.journal_path = get_user_editable_resource_path(
+            "current_sequence.journal"
+        )
+        self._sequence: Optional[list[dict]] = None
+        self._snapshot_hash: Optional[str] = None
+        self._journal_started = False
+        self.dirty = False
+        self.flush_timer = QTimer()
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.timeout.connect(self.flush)
+
+    @property
+    def sequence(self) -> list[dict]:
+        """
+        The live sequence.
+
+        Callers that mutate it in place must call mark_modified(), passing the
+        indices they changed when they know them.
+        """
+        self._ensure_loaded()
+        return self._sequence
+
+    def set_sequence(self, sequence: list[dict]) -> None:
+        self._ensure_loaded()  # the journal must know which snapshot it follows
+        self._sequence = sequence
+        self._record({"op": "set_sequence", "sequence": sequence})
+        self.json_manager.history.note_change(None)
+
+    def mark_modified(self, *indices: int) -> None:
+        if not indices:
+            self._record({"op": "set_sequence", "sequence": self.sequence})
+            self.json_manager.history.note_change(None)
+            return
+        sequence = self.sequence
+        indices = sorted({index % len(sequence) for index in indices})
+        for index in indices:
+            self._record({"op": "set_entry", "index": index, "entry": sequence[index]})
+        self.json_manager.history.note_change(indices)
+
+    def flush(self) -> None:
+        """Compact the journal into current_sequence.json."""
+        self.flush_timer.stop()
+        if not self.dirty or self._sequence is None:
+            return
+        data = json.dumps(self._sequence, indent=4, ensure_ascii=False).encode(
+            "utf-8"
+        )
+        temp_path = f"{self.file_path}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, self.file_path)
+        self._snapshot_hash = self._hash_bytes(data)
+        self._remove_journal()
+        self.dirty = False
+
+    def reload(self) -> None:
+        """Discard the in-memory copy and re-read the file on next access."""
+        self.flush_timer.stop()
+        self._sequence = None
+        self.dirty = False
+
+    ### TYPED ACCESSORS ###
+
+    def beat_count(self) -> int:
+        return len(self.sequence)
+
+    def get_entry(self, index: int) -> dict:
+        return self.sequence[index]
+
+    def get_attributes(self, index: int, color: str) -> dict:
+        return self.sequence[index][f"{color}_attributes"]
+
+    def get_attribute(self, index: int, color: str, key: str, default: Any = None):
+        return self.get_attributes(index, color).get(key, default)
+
+    def set_attribute(self, index: int, color: str, key: str, value: Any) -> None:
+        self.get_attributes(index, color)[key] = value
+        index %= len(self.sequence)
+        self._record(
+            {
+                "op": "set_attribute",
+                "index": index,
+                "color": color,
+                "key": key,
+                "value": value,
+            }
+        )
+        self.json_manager.history.note_change([index])
+
+    def remove_attribute(self, index: int, color: str, key: str) -> None:
+        attributes = self.get_attributes(index, color)
+        if key in attributes:
+            del attributes[key]
+            index %= len(self.sequence)
+            self._record(
+                {
+                    "op": "remove_attribute",
+                    "index": index,
+                    "color": color,
+                    "key": key,
+                }
+            )
+            self.json_manager.history.note_change([index])
+
+    def append_entries(self, entries: list[dict]) -> None:
+        start = len(self.sequence)
+        self.sequence.extend(entries)
+        self._record({"op": "append", "entries": entries})
+        self.json_manager.history.note_change(range(start, len(self.sequence)))
+
+    def delete_from(self, index: int) -> None:
+        """Remove the entry at index and every entry after it."""
+        del self.sequence[index:]
+        self._record({"op": "delete_from", "index": index})
+        self.json_manager.history.note_change([])
+
+    ### JOURNAL ###
+
+    def _ensure_loaded(self) -> None:
+        if self._sequence is None:
+            self._sequence = self._read_from_disk()
+            self._replay_journal()
+            self.json_manager.history.reset()
+
+    def _record(self, operation: dict) -> None:
+        line = json.dumps(operation, ensure_ascii=False)
+        with open(self.journal_path, "a", encoding="utf-8") as journal:
+            if not self._journal_started:
+                journal.seek(0)
+                journal.truncate()
+                journal.write(json.dumps({"base": self._snapshot_hash}) + "\n")
+                self._journal_started = True
+            journal.write(line + "\n")
+        self.dirty = True
+        if not self.flush_timer.isActive():
+            self.flush_timer.start(self.FLUSH_DELAY_MS)
+
+    def _replay_journal(self) -> None:
+        try:
+            with open(self.journal_path, "r", encoding="utf-8") as journal:
+                lines = journal.read().splitlines()
+        except FileNotFoundError:
+            return
+
+        if not lines or self._parse_line(lines[0]) != {"base": self._snapshot_hash}:
+            self._remove_journal()
+            return
+
+        replayed = 0
+        for line in lines[1:]:
+            operation = self._parse_line(line)
+            if operation is None:
+                break  # torn write from a crash; later lines are unreliable
+            self._apply(operation)
+            replayed += 1
+
+        if replayed:
+            self.json_manager.logger.info(
+                f"Recovered {replayed} unsaved edits to the current sequence."
+            )
+            self.dirty = True
+            self.flush()
+        else:
+            self._remove_journal()
+
+    def _apply(self, operation: dict) -> None:
+        op = operation["op"]
+        if op == "set_sequence":
+            self._sequence = operation["sequence"]
+        elif op == "set_entry":
+            self._sequence[operation["index"]] = operation["entry"]
+        elif op == "append":
+            self._sequence.extend(operation["entries"])
+        elif op == "delete_from":
+            del self._sequence[operation["index"] :]
+        elif op == "set_attribute":
+            attributes = self._sequence[operation["index"]]
+            attributes[f"{operation['color']}_attributes"][operation["key"]] = (
+                operation["value"]
+            )
+        elif op == "remove_attribute":
+            attributes = self._sequence[operation["index"]]
+            attributes[f"{operation['color']}_attributes"].pop(operation["key"], None)
+
+    def _remove_journal(self) -> None:
+        try:
+            os.remove(self.journal_path)
+        except FileNotFoundError:
+            pass
+        self._journal_started = False
+
+    @staticmethod
+    def _parse_line(line: str) -> Optional[dict]:
+        try:
+            return json.loads(line)
+        except json.JSONDecodeError:
+            return None
+
+    @staticmethod
+    def _hash_bytes(data: bytes) -> str:
+        return hashlib.sha256(data).hexdigest()
+
+    def _read_from_disk(self) -> list[dict]:
+        try:
+            with open(self.file_path, "rb") as file:
+                data = file.read()
+        except FileNotFoundError:
+            self._snapshot_hash = None
+            return self.json_manager.loader_saver.get_default_sequence()
+
+        self._snapshot_hash = self._hash_bytes(data)
+        try:
+            content = data.decode("utf-8").strip()
+            if not content:
+                return self.json_manager.loader_saver.get_default_sequence()
+
+            sequence = json.loads(content)
+            if not sequence or not isinstance(sequence, list):
+                return self.json_manager.loader_saver.get_default_sequence()
+
+            return sequence
+
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            return self.json_manager.loader_saver.get_default_sequence()
@@ -4,6 +4,8 @@ from typing import TYPE_CHECKING
 from main_window.main_widget.json_manager.json_sequence_updater.json_sequence_updater import (
     JsonSequenceUpdater,
 )
+from .current_sequence_document import CurrentSequenceDocument
+from .sequence_history import SequenceHistory
 from .json_ori_calculator import JsonOriCalculator
 
 from .json_sequence_validation_engine import JsonSequenceValidationEngine
@@ -24,6 +26,8 @@ class JsonManager:
         self.special_placement_handler = JsonSpecialPlacementHandler(self)
 
         # current sequence
+        self.document = CurrentSequenceDocument(self)
+        self.history = SequenceHistory(self)
         self.loader_saver = JsonSequenceLoaderSaver(self)
         self.updater = JsonSequenceUpdater(self)
         self.start_position_handler = JsonStartPositionHandler(self)
@@ -20,8 +20,8 @@ if TYPE_CHECKING:
 
 
 class JsonOriCalculator:
-    def __init__(self, json_manager: "JsonManager"):
-        self.main_widget = json_manager.main_widget
+    def __init__(self, json_manager: "JsonManager" = None):
+        self.main_widget = json_manager.main_widget if json_manager else None
         self.handpath_calculator = HandpathCalculator()
 
     def calculate_end_orientation(self, pictograph_dict, color: str):
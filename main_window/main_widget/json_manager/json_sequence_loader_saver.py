@@ -1,6 +1,5 @@
-import json
+from copy import deepcopy
 from typing import TYPE_CHECKING, List, Dict
-from utilities.path_helpers import get_user_editable_resource_path
 from utilities.word_simplifier import WordSimplifier
 
 if TYPE_CHECKING:
@@ -10,25 +9,12 @@ if TYPE_CHECKING:
 class JsonSequenceLoaderSaver:
     def __init__(self, json_manager: "JsonManager") -> None:
         self.json_manager = json_manager
-        self.current_sequence_json = get_user_editable_resource_path(
-            "current_sequence.json"
-        )
+        self.document = json_manager.document
+        self.current_sequence_json = self.document.file_path
 
     def load_current_sequence_json(self) -> List[Dict]:
-        try:
-            with open(self.current_sequence_json, "r", encoding="utf-8") as file:
-                content = file.read().strip()
-                if not content:
-                    return self.get_default_sequence()
-
-                sequence = json.loads(content)
-                if not sequence or not isinstance(sequence, list):
-                    return self.get_default_sequence()
-
-            return sequence
-
-        except (FileNotFoundError, json.JSONDecodeError):
-            return self.get_default_sequence()
+        """Return a private copy of the current sequence."""
+        return deepcopy(self.document.sequence)
 
     def get_default_sequence(self) -> List[Dict]:
         """Return a default sequence if JSON is missing, empty, or invalid."""
@@ -53,6 +39,22 @@ class JsonSequenceLoaderSaver:
         if not sequence:
             sequence = self.get_default_sequence()
         else:
+            self.update_sequence_metadata(sequence)
+
+        # Add beat numbers to each beat at the beginning
+        beat_number = 0
+        for index, beat in enumerate(sequence):
+            if "letter" in beat or "sequence_start_position" in beat:
+                beat_dict_with_beat_number = {"beat": beat_number}
+                beat_dict_with_beat_number.update(beat)
+                sequence[index] = beat_dict_with_beat_number
+                beat_number += 1
+
+        self.document.set_sequence(deepcopy(sequence))
+
+    def update_sequence_metadata(self, sequence: List[Dict]) -> None:
+        """Fill in the word and any missing header fields of the sequence."""
+        if sequence:
             sequence[0]["word"] = WordSimplifier.simplify_repeated_word(
                 self.json_manager.main_widget.sequence_properties_manager.calculate_word(
                     sequence
@@ -79,49 +81,33 @@ class JsonSequenceLoaderSaver:
             if "is_permutable" not in sequence[0]:
                 sequence[0]["is_permutable"] = False
 
-        # Add beat numbers to each beat at the beginning
-        beat_number = 0
-        for beat in sequence:
-            if "letter" in beat or "sequence_start_position" in beat:
-                beat_dict_with_beat_number = {"beat": beat_number}
-                beat_dict_with_beat_number.update(beat)
-                sequence[sequence.index(beat)] = beat_dict_with_beat_number
-                beat_number += 1
-
-        with open(self.current_sequence_json, "w", encoding="utf-8") as file:
-            json.dump(sequence, file, indent=4, ensure_ascii=False)
-
     def clear_current_sequence_file(self):
         self.save_current_sequence([])
 
     def get_prop_rot_dir_from_json(self, index: int, color: str) -> int:
-        sequence = self.load_current_sequence_json()
-        if sequence:
-            return sequence[index][f"{color}_attributes"].get("prop_rot_dir", 0)
+        if self.document.sequence:
+            return self.document.get_attribute(index, color, "prop_rot_dir", 0)
         return 0
 
     def get_motion_type_from_json_at_index(self, index: int, color: str) -> int:
-        sequence = self.load_current_sequence_json()
-        if sequence:
-            return sequence[index][f"{color}_attributes"].get("motion_type", 0)
+        if self.document.sequence:
+            return self.document.get_attribute(index, color, "motion_type", 0)
         return 0
 
     def get_prefloat_prop_rot_dir_from_json(self, index: int, color: str) -> int:
-        sequence = self.load_current_sequence_json()
-        if sequence:
-            return sequence[index][f"{color}_attributes"].get(
-                "prefloat_prop_rot_dir", ""
+        if self.document.sequence:
+            return self.document.get_attribute(
+                index, color, "prefloat_prop_rot_dir", ""
             )
         return 0
 
     def get_prefloat_motion_type_from_json_at_index(
         self, index: int, color: str
     ) -> int:
-        sequence = self.load_current_sequence_json()
-        if sequence:
-            return sequence[index][f"{color}_attributes"].get(
-                "prefloat_motion_type",
-                sequence[index][f"{color}_attributes"].get("motion_type", 0),
+        if self.document.sequence:
+            attributes = self.document.get_attributes(index, color)
+            return attributes.get(
+                "prefloat_motion_type", attributes.get("motion_type", 0)
             )
         return 0
 
@@ -12,6 +12,7 @@ class JsonLetterUpdater:
         self.json_manager = json_updater.json_manager
 
     def update_letter_in_json_at_index(self, index: int, letter: str) -> None:
-        sequence = self.json_manager.loader_saver.load_current_sequence_json()
+        sequence = self.json_manager.document.sequence
         sequence[index]["letter"] = letter
-        self.json_manager.loader_saver.save_current_sequence(sequence)
+        self.json_manager.loader_saver.update_sequence_metadata(sequence)
+        self.json_manager.document.mark_modified(0, index)
@@ -18,16 +18,14 @@ class JsonMotionTypeUpdater:
     def update_motion_type_in_json_at_index(
         self, index: int, color: str, motion_type: str
     ) -> None:
-        sequence = self.json_manager.loader_saver.load_current_sequence_json()
-        sequence[index][f"{color}_attributes"]["motion_type"] = motion_type
-        if sequence[index][f"{color}_attributes"]["turns"] != "fl":
-            if "prefloat_motion_type" in sequence[index][f"{color}_attributes"]:
-                del sequence[index][f"{color}_attributes"]["prefloat_motion_type"]
-        self.json_manager.loader_saver.save_current_sequence(sequence)
+        document = self.json_manager.document
+        document.set_attribute(index, color, "motion_type", motion_type)
+        if document.get_attribute(index, color, "turns") != "fl":
+            document.remove_attribute(index, color, "prefloat_motion_type")
 
     def update_prefloat_motion_type_in_json(
         self, index: int, color: str, motion_type: str
     ) -> None:
-        sequence = self.json_manager.loader_saver.load_current_sequence_json()
-        sequence[index][f"{color}_attributes"]["prefloat_motion_type"] = motion_type
-        self.json_manager.loader_saver.save_current_sequence(sequence)
+        self.json_manager.document.set_attribute(
+            index, color, "prefloat_motion_type", motion_type
+        )
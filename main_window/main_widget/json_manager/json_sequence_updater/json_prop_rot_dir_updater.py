@@ -14,16 +14,14 @@ class JsonPropRotDirUpdater:
     def update_prefloat_prop_rot_dir_in_json(
         self, index: int, color: str, prop_rot_dir: str
     ) -> None:
-        sequence = self.json_manager.loader_saver.load_current_sequence_json()
-        sequence[index][f"{color}_attributes"]["prefloat_prop_rot_dir"] = prop_rot_dir
-        self.json_manager.loader_saver.save_current_sequence(sequence)
+        self.json_manager.document.set_attribute(
+            index, color, "prefloat_prop_rot_dir", prop_rot_dir
+        )
 
     def update_prop_rot_dir_in_json_at_index(
         self, index: int, color: str, prop_rot_dir: str
     ) -> None:
-        sequence = self.json_manager.loader_saver.load_current_sequence_json()
-        sequence[index][f"{color}_attributes"]["prop_rot_dir"] = prop_rot_dir
-        if sequence[index][f"{color}_attributes"]["turns"] != "fl":
-            if "prefloat_prop_rot_dir" in sequence[index][f"{color}_attributes"]:
-                del sequence[index][f"{color}_attributes"]["prefloat_prop_rot_dir"]
-        self.json_manager.loader_saver.save_current_sequence(sequence)
+        document = self.json_manager.document
+        document.set_attribute(index, color, "prop_rot_dir", prop_rot_dir)
+        if document.get_attribute(index, color, "turns") != "fl":
+            document.remove_attribute(index, color, "prefloat_prop_rot_dir")
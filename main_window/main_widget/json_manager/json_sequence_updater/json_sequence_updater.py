@@ -1,3 +1,4 @@
+from copy import deepcopy
 from typing import TYPE_CHECKING
 from Enums.PropTypes import PropType
 from .json_duration_updater import JsonDurationUpdater
@@ -26,32 +27,30 @@ class JsonSequenceUpdater:
         self.duration_updater = JsonDurationUpdater(self)
 
     def update_current_sequence_file_with_beat(self, beat_view: BeatView):
-        sequence_data = self.json_manager.loader_saver.load_current_sequence_json()
-        sequence_metadata = sequence_data[0] if "word" in sequence_data[0] else {}
-        sequence_beats = sequence_data[1:]
+        """Append the beat (and placeholders for its extra counts) to the sequence."""
+        document = self.json_manager.document
+        sequence = document.sequence
 
-        beat_data = beat_view.beat.pictograph_dict.copy()
+        beat_data = deepcopy(beat_view.beat.pictograph_dict)
         beat_data["duration"] = beat_view.beat.duration
-        number = self.get_next_beat_number(sequence_beats)
+        number = self.get_next_beat_number(sequence[1:])
         beat_view.number = number
         beat_data["beat"] = number
 
-        sequence_beats.append(beat_data)
-
+        new_entries = [{"beat": number, **beat_data}]
         for beat_num in range(
             beat_view.number + 1, beat_view.number + beat_view.beat.duration
         ):
-            placeholder_entry = {
-                "beat": beat_num,
-                "is_placeholder": True,
-                "parent_beat": beat_view.number,
-            }
-            sequence_beats.append(placeholder_entry)
-
-        sequence_beats.sort(key=lambda entry: entry.get("beat", float("inf")))
-        sequence_data = [sequence_metadata] + sequence_beats
+            new_entries.append(
+                {
+                    "beat": beat_num,
+                    "is_placeholder": True,
+                    "parent_beat": beat_view.number,
+                }
+            )
 
-        self.json_manager.loader_saver.save_current_sequence(sequence_data)
+        document.append_entries(new_entries)
+        self._update_sequence_metadata()
 
     def get_next_beat_number(self, sequence_beats):
         if not sequence_beats:
@@ -77,7 +76,21 @@ class JsonSequenceUpdater:
 
         self.json_manager.loader_saver.save_current_sequence(sequence_data)
 
+    def delete_beats_from(self, beat_index: int) -> None:
+        """Remove the beat at this beat frame index and every entry after it."""
+        document = self.json_manager.document
+        remaining_beats = beat_index
+        for index, entry in enumerate(document.sequence):
+            if index < 2 or entry.get("is_placeholder"):
+                continue
+            if remaining_beats == 0:
+                document.delete_from(index)
+                self._update_sequence_metadata()
+                return
+            remaining_beats -= 1
+
     def clear_and_repopulate_the_current_sequence(self):
+        """Rebuild the current sequence from the beats shown in the beat frame."""
         self.json_manager.loader_saver.clear_current_sequence_file()
         beat_frame = (
             self.json_manager.main_widget.top_builder_widget.sequence_widget.beat_frame
@@ -89,4 +102,8 @@ class JsonSequenceUpdater:
         for beat_view in beat_views:
             if beat_view.is_filled:
                 self.update_current_sequence_file_with_beat(beat_view)
-        self.json_manager.main_widget.main_window.settings_manager.save_settings()  # Save state on change
+
+    def _update_sequence_metadata(self) -> None:
+        document = self.json_manager.document
+        self.json_manager.loader_saver.update_sequence_metadata(document.sequence)
+        document.mark_modified(0)
@@ -21,7 +21,7 @@ class JsonTurnsUpdater:
     def update_turns_in_json_at_index(
         self, index: int, color: str, turns: Union[int, float]
     ) -> None:
-        sequence = self.json_manager.loader_saver.load_current_sequence_json()
+        sequence = self.json_manager.document.sequence
         sequence[index][f"{color}_attributes"]["turns"] = turns
         end_ori = self.json_manager.ori_calculator.calculate_end_orientation(
             sequence[index], color
@@ -51,7 +51,7 @@ class JsonTurnsUpdater:
                 prop_rot_dir = NO_ROT
                 sequence[index][f"{color}_attributes"]["prop_rot_dir"] = prop_rot_dir
 
-        self.json_manager.loader_saver.save_current_sequence(sequence)
+        self.json_manager.document.mark_modified(index)
         self.main_widget.sequence_properties_manager.update_sequence_properties()
 
     def set_turns_from_num_to_num_in_json(self, motion: "Motion", new_turns):
@@ -74,7 +74,7 @@ class JsonTurnsUpdater:
         )
 
     def get_number_of_placeholders_before_current_beat(self, current_beat_number):
-        sequence = self.json_manager.loader_saver.load_current_sequence_json()
+        sequence = self.json_manager.document.sequence
         number_of_placeholders = 0
         for beat in sequence[2:]:
             if beat["beat"] < current_beat_number and beat.get("is_placeholder"):
@@ -24,12 +24,15 @@ class JsonSpecialPlacementHandler:
 
     def write_json_data(self, data, file_path) -> None:
         """Write JSON data to a file with specific formatting."""
+        formatted_json_str = json.dumps(data, indent=2, ensure_ascii=False)
+        formatted_json_str = re.sub(
+            r"\[\s+(-?\d+),\s+(-?\d+)\s+\]", r"[\1, \2]", formatted_json_str
+        )
+        temp_path = f"{file_path}.tmp"
         try:
-            with open(file_path, "w", encoding="utf-8") as file:
-                formatted_json_str = json.dumps(data, indent=2, ensure_ascii=False)
-                formatted_json_str = re.sub(
-                    r"\[\s+(-?\d+),\s+(-?\d+)\s+\]", r"[\1, \2]", formatted_json_str
-                )
+            os.makedirs(os.path.dirname(file_path) or ".", exist_ok=True)
+            with open(temp_path, "w", encoding="utf-8") as file:
                 file.write(formatted_json_str)
+            os.replace(temp_path, file_path)
         except IOError as e:
             logging.error(f"Failed to write to {file_path}: {e}")
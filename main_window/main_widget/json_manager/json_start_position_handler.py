@@ -56,11 +56,10 @@ class JsonStartPositionHandler:
         self.manager.loader_saver.save_current_sequence(sequence)
 
     def update_start_pos_ori(self, color: str, ori: int) -> None:
-        sequence = self.manager.loader_saver.load_current_sequence_json()
-        if sequence:
-            sequence[1][f"{color}_attributes"]["end_ori"] = ori
-            sequence[1][f"{color}_attributes"]["start_ori"] = ori
-            self.manager.loader_saver.save_current_sequence(sequence)
+        document = self.manager.document
+        if document.sequence:
+            document.set_attribute(1, color, "end_ori", ori)
+            document.set_attribute(1, color, "start_ori", ori)
 
     def get_sequence_start_position(self, start_pos_pictograph: BasePictograph) -> str:
         return start_pos_pictograph.end_pos.rstrip("0123456789")
@@ -0,0 +1,152 @@
+import json
+from collections import deque
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterable, NamedTuple, Optional
+from PyQt6.QtCore import QTimer
+
+if TYPE_CHECKING:
+    from main_window.main_widget.json_manager.json_manager import JsonManager
+
+
+class HistoryChange(NamedTuple):
+    changed_indices: list[int]
+    previous_length: int
+
+
+class SequenceHistory:
+    """
+    Undo/redo stack for the current sequence.
+
+    A snapshot is a tuple holding every entry frozen as a compact JSON
+    string. A new snapshot re-freezes only the entries that changed and
+    reuses the previous string for everything else, so hundreds of steps on
+    a long sequence cost roughly one entry per edit. Edits made during one
+    pass of the event loop (a turns change touches turns, motion type, prop
+    rotation and the header) are folded into a single step.
+    """
+
+    MAX_STEPS = 300
+
+    def __init__(self, json_manager: "JsonManager") -> None:
+        self.json_manager = json_manager
+        self.undo_stack: deque[tuple[str, ...]] = deque(maxlen=self.MAX_STEPS)
+        self.redo_stack: list[tuple[str, ...]] = []
+        self.current: Optional[tuple[str, ...]] = None
+        self.changed_indices: set[int] = set()
+        self.full_change = False
+        self.paused = False
+        self.checkpoint_timer = QTimer()
+        self.checkpoint_timer.setSingleShot(True)
+        self.checkpoint_timer.timeout.connect(self.checkpoint)
+
+    def reset(self) -> None:
+        """Forget every step and take the document as the new baseline."""
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+        self.current = None
+        self.sync()
+
+    def sync(self) -> None:
+        """Take the document as the current state without adding a step."""
+        self.checkpoint_timer.stop()
+        self.full_change = True
+        self.current = self._build_snapshot(self.current or ())
+        self.changed_indices.clear()
+        self.full_change = False
+
+    def note_change(self, indices: Optional[Iterable[int]]) -> None:
+        """Called by the document; None means the whole sequence may have changed."""
+        if self.paused or self.current is None:
+            return
+        if indices is None:
+            self.full_change = True
+        else:
+            self.changed_indices.update(indices)
+        if not self.checkpoint_timer.isActive():
+            self.checkpoint_timer.start(0)
+
+    def checkpoint(self) -> None:
+        self.checkpoint_timer.stop()
+        if self.current is None:
+            return
+        snapshot = self._build_snapshot(self.current)
+        self.changed_indices.clear()
+        self.full_change = False
+        if snapshot != self.current:
+            self.undo_stack.append(self.current)
+            self.redo_stack.clear()
+            self.current = snapshot
+
+    def can_undo(self) -> bool:
+        self.checkpoint()
+        return bool(self.undo_stack)
+
+    def can_redo(self) -> bool:
+        self.checkpoint()
+        return bool(self.redo_stack)
+
+    def undo(self) -> Optional[HistoryChange]:
+        if not self.can_undo():
+            return None
+        self.redo_stack.append(self.current)
+        return self._restore(self.undo_stack.pop())
+
+    def redo(self) -> Optional[HistoryChange]:
+        if not self.can_redo():
+            return None
+        self.undo_stack.append(self.current)
+        return self._restore(self.redo_stack.pop())
+
+    @contextmanager
+    def pause(self):
+        """Ignore document edits made inside the block, e.g. while re-rendering."""
+        self.paused = True
+        try:
+            yield
+        finally:
+            self.paused = False
+
+    def _restore(self, target: tuple[str, ...]) -> HistoryChange:
+        previous = self.current
+        document = self.json_manager.document
+        live_sequence = document.sequence
+        changed_indices = [
+            index
+            for index, frozen_entry in enumerate(target)
+            if index >= len(previous)
+            or (frozen_entry is not previous[index] and frozen_entry != previous[index])
+        ]
+        changed = set(changed_indices)
+        # Unchanged entries are equal to the live ones, so they are kept as is
+        restored_sequence = [
+            json.loads(frozen_entry) if index in changed else live_sequence[index]
+            for index, frozen_entry in enumerate(target)
+        ]
+        with self.pause():
+            document.set_sequence(restored_sequence)
+        self.current = target
+        self.changed_indices.clear()
+        self.full_change = False
+        return HistoryChange(changed_indices, len(previous))
+
+    def _build_snapshot(self, previous: tuple[str, ...]) -> tuple[str, ...]:
+        sequence = self.json_manager.document.sequence
+        length = len(sequence)
+        if self.full_change:
+            indices = range(length)
+        else:
+            indices = {index for index in self.changed_indices if index < length}
+            indices.update(range(len(previous), length))
+
+        entries = list(previous[:length])
+        entries.extend([None] * (length - len(entries)))
+        for index in indices:
+            frozen_entry = self._freeze(sequence[index])
+            if index < len(previous) and previous[index] == frozen_entry:
+                frozen_entry = previous[index]
+            entries[index] = frozen_entry
+        return tuple(entries)
+
+    @staticmethod
+    def _freeze(entry: dict) -> str:
+        return json.dumps(entry, ensure_ascii=False, separators=(",", ":"))
@@ -43,15 +43,15 @@ class BaseQuestionWidget(QWidget):
 
     def load_pictograph(self, pictograph_dict) -> None:
         """Load and display the pictograph."""
-        self.pictograph: BasePictograph = BasePictograph(
-            self.main_widget, scroll_area=None
+        self.pictograph: BasePictograph = self.main_widget.pictograph_pool.acquire(
+            pictograph_dict
         )
         self.pictograph.disable_gold_overlay = True
-        self.pictograph.updater.update_pictograph(pictograph_dict)
         self.pictograph.quiz_mode = True
         self.layout.addWidget(
             self.pictograph.view, alignment=Qt.AlignmentFlag.AlignCenter
         )
+        self.pictograph.view.show()
 
     def _resize_question_label(self) -> None:
         question_label_font_size = self.main_widget.width() // 65
@@ -59,7 +59,7 @@ class Lesson1QuestionWidget(BaseQuestionWidget):
         """Remove the current pictograph view."""
         if self.pictograph:
             self.layout.removeWidget(self.pictograph.view)
-            self.pictograph.view.deleteLater()
+            self.main_widget.pictograph_pool.release(self.pictograph)
             self.pictograph = None
 
     def _resize_question_widget(self) -> None:
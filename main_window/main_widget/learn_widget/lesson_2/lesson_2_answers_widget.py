@@ -38,9 +38,7 @@ class Lesson2AnswersWidget(BaseAnswersWidget):
                     pictograph_dict
                 )
             )
-            pictograph = BasePictograph(self.main_widget, scroll_area=None)
-            pictograph.disable_gold_overlay = False
-            pictograph.updater.update_pictograph(pictograph_dict)
+            pictograph = self.main_widget.pictograph_pool.acquire(pictograph_dict)
             self.pictographs[pictograph_key] = pictograph
             pictograph.view.setCursor(Qt.CursorShape.PointingHandCursor)
             pictograph.quiz_mode = True
@@ -50,11 +48,13 @@ class Lesson2AnswersWidget(BaseAnswersWidget):
                     opt, correct_pictograph
                 )
             )
+            pictograph.image_renderer.enable_raster()
 
             self.pictograph_views.append(pictograph.view)
 
         for view in self.pictograph_views:
             self.layout.addWidget(view)
+            view.show()
 
     def disable_answer(self, answer):
         """Disable a specific pictograph answer."""
@@ -69,7 +69,9 @@ class Lesson2AnswersWidget(BaseAnswersWidget):
         """Clear all the displayed pictographs."""
         for view in self.pictograph_views:
             self.layout.removeWidget(view)
-            view.deleteLater()
+        self.main_widget.pictograph_pool.release_all(
+            [view.pictograph for view in self.pictograph_views]
+        )
         self.pictograph_views.clear()
         self.pictographs.clear()
 
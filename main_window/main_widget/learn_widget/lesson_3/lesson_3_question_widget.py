@@ -40,7 +40,7 @@ class Lesson3QuestionWidget(BaseQuestionWidget):
         """Clear the current pictograph."""
         if self.pictograph:
             self.layout.removeWidget(self.pictograph.view)
-            self.pictograph.view.deleteLater()
+            self.main_widget.pictograph_pool.release(self.pictograph)
             self.pictograph = None
 
     def _resize_question_widget(self) -> None:
@@ -1,4 +1,3 @@
-import json
 
 from PyQt6.QtGui import QKeyEvent, QCursor, QCloseEvent
 from PyQt6.QtCore import Qt
@@ -19,21 +18,27 @@ from .top_builder_widget.top_builder_widget import TopBuilderWidget
 from objects.graphical_object.svg_manager.graphical_object_svg_manager import SvgManager
 from .sequence_level_evaluator import SequenceLevelEvaluator
 from .thumbnail_finder import ThumbnailFinder
-from utilities.path_helpers import get_images_and_data_path
+from .thumbnail_cache.thumbnail_cache import ThumbnailCache
+from .thumbnail_cache.thumbnail_loader import ThumbnailLoader
 from styles.main_widget_tab_bar_styler import MainWidgetTabBarStyler
 from .dictionary_widget.dictionary_widget import DictionaryWidget
 from .metadata_extractor import MetaDataExtractor
+from .dictionary_index.dictionary_search_engine import DictionarySearchEngine
 from .json_manager.json_manager import JsonManager
 from .turns_tuple_generator.turns_tuple_generator import TurnsTupleGenerator
 from base_widgets.base_pictograph.base_pictograph import BasePictograph
 from .pictograph_key_generator import PictographKeyGenerator
 from ..main_widget.special_placement_loader import SpecialPlacementLoader
+from .special_placement_editing_session import SpecialPlacementEditingSession
+from placement_managers.placement_data_store import PlacementDataStore
+from placement_managers.placement_solver.placement_solver import PlacementSolver
+from .pictograph_pool import PictographPool
+from .pictograph_raster_cache import PictographRasterCache
 
 if TYPE_CHECKING:
     from splash_screen import SplashScreen
     from main_window.main_window import MainWindow
 
-from utilities.path_helpers import get_images_and_data_path
 from PyQt6.QtCore import QTimer
 
 
@@ -48,6 +53,7 @@ class MainWidget(QTabWidget):
         self.settings_manager = main_window.settings_manager
         self.initialized = False
         self.splash_screen = splash_screen
+        self.startup_profiler = main_window.startup_profiler
 
         self._setup_pictograph_cache()
         self._set_prop_type()
@@ -56,39 +62,54 @@ class MainWidget(QTabWidget):
         self._initialize_managers()
 
         self._setup_ui_components()
-        self.apply_background()
+        with self.startup_profiler.phase("background", "Applying background..."):
+            self.apply_background()
         self.main_window.settings_manager.background_changed.connect(
             self.update_background
         )
+        self.settings_manager.setting_changed.connect(self._on_setting_changed)
 
         self.currentChanged.connect(self.on_tab_changed)
         self.tabBar().setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self.splash_screen.update_progress(100, "Initialization complete!")
         QTimer.singleShot(0, self.load_state)
 
     def _initialize_managers(self):
         """Setup all the managers and helper components."""
-        self.splash_screen.update_progress(20, "Loading JSON Manager...")
-        self.json_manager = JsonManager(self)
-
-        self.splash_screen.update_progress(30, "Loading SVG Manager...")
-        self.svg_manager = SvgManager(self)
-
-        self.splash_screen.update_progress(40, "Loading key generators...")
-        self.turns_tuple_generator = TurnsTupleGenerator()
-        self.pictograph_key_generator = PictographKeyGenerator(self)
-
-        self.splash_screen.update_progress(50, "Loading special placements...")
-        self.special_placement_loader = SpecialPlacementLoader(self)
-        self._setup_special_placements()
-
-        self.splash_screen.update_progress(60, "Loading Metadata Extractor...")
-        self.metadata_extractor = MetaDataExtractor(self)
-        self.tab_bar_styler = MainWidgetTabBarStyler(self)
-        self.sequence_level_evaluator = SequenceLevelEvaluator()
-        self.sequence_properties_manager = SequencePropertiesManager(self)
-        self.thumbnail_finder = ThumbnailFinder(self)
-        self.grid_mode_checker = GridModeChecker()
+        with self.startup_profiler.phase("json_manager", "Loading JSON Manager..."):
+            self.json_manager = JsonManager(self)
+
+        with self.startup_profiler.phase("svg_manager", "Loading SVG Manager..."):
+            self.svg_manager = SvgManager(self)
+
+        with self.startup_profiler.phase(
+            "key_generators", "Loading key generators..."
+        ):
+            self.turns_tuple_generator = TurnsTupleGenerator()
+            self.pictograph_key_generator = PictographKeyGenerator(self)
+
+        with self.startup_profiler.phase(
+            "special_placements", "Loading special placements..."
+        ):
+            self.placement_data_store = PlacementDataStore()
+            self.special_placement_loader = SpecialPlacementLoader(self)
+            self.special_placement_editing_session = SpecialPlacementEditingSession(
+                self
+            )
+            self.placement_solver = PlacementSolver(self)
+            self.pictograph_pool = PictographPool(self)
+            self.pictograph_raster_cache = PictographRasterCache(self)
+            self._setup_special_placements()
+
+        with self.startup_profiler.phase("managers", "Loading Metadata Extractor..."):
+            self.metadata_extractor = MetaDataExtractor(self)
+            self.tab_bar_styler = MainWidgetTabBarStyler(self)
+            self.sequence_level_evaluator = SequenceLevelEvaluator()
+            self.sequence_properties_manager = SequencePropertiesManager(self)
+            self.thumbnail_finder = ThumbnailFinder(self)
+            self.thumbnail_cache = ThumbnailCache()
+            self.thumbnail_loader = ThumbnailLoader(self.thumbnail_cache)
+            self.dictionary_search_engine = DictionarySearchEngine(self)
+            self.grid_mode_checker = GridModeChecker()
 
     def on_tab_changed(self, index):
         if index == self.builder_tab_index:
@@ -115,19 +136,21 @@ class MainWidget(QTabWidget):
             self.pictograph_cache[letter] = {}
 
     def _set_prop_type(self) -> None:
-        settings_path = get_images_and_data_path("settings.json")
-        with open(settings_path, "r", encoding="utf-8") as file:
-            settings: dict[str, dict[str, str | bool]] = json.load(file)
-        prop_type_value = settings.get("global", {}).get("prop_type", "staff")
-        self.prop_type = PropType.get_prop_type(prop_type_value)
+        self.prop_type: PropType = (
+            self.main_window.settings_manager.global_settings.get_prop_type()
+        )
+
+    def _on_setting_changed(self, section: str, key: str, value) -> None:
+        if (section, key) == ("global", "prop_type"):
+            self._set_prop_type()
 
     def _setup_ui_components(self):
-        self.splash_screen.update_progress(70, "Setting up build tab...")
-        self.top_builder_widget = TopBuilderWidget(self)
-        self.splash_screen.update_progress(80, "Setting up browse tab...")
-        self.dictionary_widget = DictionaryWidget(self)
-        self.splash_screen.update_progress(90, "Setting up learn tab...")
-        self.learn_widget = LearnWidget(self)
+        with self.startup_profiler.phase("build_tab", "Setting up build tab..."):
+            self.top_builder_widget = TopBuilderWidget(self)
+        with self.startup_profiler.phase("browse_tab", "Setting up browse tab..."):
+            self.dictionary_widget = DictionaryWidget(self)
+        with self.startup_profiler.phase("learn_tab", "Setting up learn tab..."):
+            self.learn_widget = LearnWidget(self)
 
         self.addTab(self.top_builder_widget, "Build")
         self.addTab(self.dictionary_widget, "Browse")
@@ -154,10 +177,7 @@ class MainWidget(QTabWidget):
 
     def set_grid_mode(self, grid_mode: str) -> None:
         self.main_window.settings_manager.global_settings.set_grid_mode(grid_mode)
-
-        self.main_window.settings_manager.save_settings()
         self.special_placement_loader.refresh_placements()
-        self.pictograph_dicts = self.pictograph_dict_loader.load_all_pictograph_dicts()
 
         start_pos_manager = (
             self.top_builder_widget.sequence_builder.manual_builder.start_pos_picker.start_pos_manager
@@ -176,10 +196,15 @@ class MainWidget(QTabWidget):
         self._setup_special_placements()
 
     def _setup_letters(self) -> None:
-        self.splash_screen.update_progress(10, "Loading pictograph dictionaries...")
-        self.pictograph_dict_loader = PictographDictLoader(self)
+        with self.startup_profiler.phase(
+            "pictograph_dicts", "Loading pictograph dictionaries..."
+        ):
+            self.pictograph_dict_loader = PictographDictLoader(self)
+            self.pictograph_dataset = (
+                self.pictograph_dict_loader.load_pictograph_dataset()
+            )
         self.pictograph_dicts: dict[Letter, list[dict]] = (
-            self.pictograph_dict_loader.load_all_pictograph_dicts()
+            self.pictograph_dataset.pictograph_dicts
         )
         self.letter_determiner = LetterDeterminer(self)
 
@@ -232,10 +257,18 @@ class MainWidget(QTabWidget):
         self.json_manager.loader_saver.save_current_sequence(
             self.json_manager.loader_saver.load_current_sequence_json()
         )
-        self.main_window.settings_manager.save_settings()
+        self.main_window.settings_manager.flush_settings()
+
+    def shutdown(self) -> None:
+        """Finish pending writes and stop background work before the app exits."""
+        self.json_manager.document.flush()
+        self.special_placement_editing_session.flush()
+        self.metadata_extractor.save_index()
+        self.thumbnail_loader.shutdown()
+        self.thumbnail_cache.shutdown()
+        self.pictograph_raster_cache.shutdown()
 
     def load_state(self):
-        self.main_window.settings_manager.load_settings()
         current_sequence = self.json_manager.loader_saver.load_current_sequence_json()
         if len(current_sequence) > 1:
             self.top_builder_widget.sequence_builder.manual_builder.transition_to_sequence_building()
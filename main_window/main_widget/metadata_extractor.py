@@ -1,35 +1,52 @@
 import os
-from typing import TYPE_CHECKING
+from copy import deepcopy
+from typing import TYPE_CHECKING, Callable, Optional
 from PIL import Image, PngImagePlugin
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QMessageBox
 import json
 
 from utilities.path_helpers import get_images_and_data_path
+from .dictionary_index.dictionary_metadata_index import DictionaryMetadataIndex
 
 if TYPE_CHECKING:
     from main_window.main_widget.main_widget import MainWidget
 
 
 class MetaDataExtractor:
+    INDEX_SAVE_DELAY_MS = 2000
+
     def __init__(self, main_widget: "MainWidget"):
         self.main_widget = main_widget
+        self.index = DictionaryMetadataIndex()
+        # Called with the changed path whenever the app changes a dictionary
+        # file, or with None when anything may have changed
+        self.change_listeners: list[Callable[[Optional[str]], None]] = []
+        self.index_save_timer = QTimer()
+        self.index_save_timer.setSingleShot(True)
+        self.index_save_timer.timeout.connect(self.save_index)
 
     def extract_metadata_from_file(self, file_path):
+        """Return a private copy of the thumbnail's metadata."""
+        return deepcopy(self._get_indexed_metadata(file_path))
+
+    def _get_indexed_metadata(self, file_path):
+        """Return the indexed metadata without copying; callers must not mutate it."""
         # Check if a file exists at the path we're passing as "file_path"
         if not file_path:
             return None
 
         try:
-            with Image.open(file_path) as img:
-                metadata = img.info.get("metadata")
-                if metadata:
-                    return json.loads(metadata)
-                else:
-                    QMessageBox.warning(
-                        self.main_widget,
-                        "Error",
-                        "No sequence metadata found in the thumbnail.",
-                    )
+            metadata = self.index.get_metadata(file_path)
+            self._schedule_index_save()
+            if metadata:
+                return metadata
+            else:
+                QMessageBox.warning(
+                    self.main_widget,
+                    "Error",
+                    "No sequence metadata found in the thumbnail.",
+                )
         except Exception as e:
             QMessageBox.critical(
                 self.main_widget,
@@ -38,8 +55,58 @@ class MetaDataExtractor:
             )
         return None
 
+    def get_metadata_quietly(self, file_path: str) -> Optional[dict]:
+        """Indexed metadata for bulk scans: no copy and no error dialogs."""
+        try:
+            metadata = self.index.get_metadata(file_path)
+        except Exception as e:
+            print(f"Error reading metadata from {file_path}: {e}")
+            return None
+        self._schedule_index_save()
+        return metadata
+
+    def get_fingerprints_quietly(self, file_path: str) -> Optional[dict[str, str]]:
+        """Structural and turn pattern fingerprints, without error dialogs."""
+        try:
+            fingerprints = self.index.get_fingerprints(file_path)
+        except Exception as e:
+            print(f"Error reading metadata from {file_path}: {e}")
+            return None
+        self._schedule_index_save()
+        return fingerprints
+
+    def add_change_listener(self, listener: Callable[[Optional[str]], None]) -> None:
+        self.change_listeners.append(listener)
+
+    def _notify_change(self, path: Optional[str]) -> None:
+        for listener in self.change_listeners:
+            listener(path)
+
+    def _schedule_index_save(self) -> None:
+        if self.index.dirty and not self.index_save_timer.isActive():
+            self.index_save_timer.start(self.INDEX_SAVE_DELAY_MS)
+
+    def save_index(self) -> None:
+        self.index_save_timer.stop()
+        self.index.save()
+
+    def invalidate_file(self, file_path: str) -> None:
+        self.index.invalidate(file_path)
+        self._notify_change(file_path)
+        self._schedule_index_save()
+
+    def invalidate_directory(self, directory: str) -> None:
+        self.index.invalidate_directory(directory)
+        self._notify_change(directory)
+        self._schedule_index_save()
+
+    def prune_index(self) -> None:
+        for stale_path in self.index.prune():
+            self._notify_change(stale_path)
+        self._schedule_index_save()
+
     def get_favorite_status(self, file_path: str) -> bool:
-        metadata = self.extract_metadata_from_file(file_path)
+        metadata = self._get_indexed_metadata(file_path)
         if metadata:
             return metadata.get("is_favorite", False)
         return False
@@ -59,6 +126,9 @@ class MetaDataExtractor:
                 pnginfo = PngImagePlugin.PngInfo()
                 pnginfo.add_text("metadata", json.dumps(metadata_dict))
                 img.save(file_path, pnginfo=pnginfo)
+            self.index.update(file_path, metadata_dict)
+            self._notify_change(file_path)
+            self._schedule_index_save()
         except Exception as e:
             QMessageBox.critical(
                 self.main_widget,
@@ -67,25 +137,31 @@ class MetaDataExtractor:
             )
 
     def get_sequence_author(self, file_path):
-        metadata = self.extract_metadata_from_file(file_path)
+        metadata = self._get_indexed_metadata(file_path)
         if metadata and "sequence" in metadata:
             return metadata["sequence"][0]["author"]
         return
 
     def get_sequence_level(self, file_path):
-        metadata = self.extract_metadata_from_file(file_path)
+        metadata = self._get_indexed_metadata(file_path)
         if metadata and "sequence" in metadata:
             return metadata["sequence"][0]["level"]
         return
 
     def get_sequence_length(self, file_path):
-        metadata = self.extract_metadata_from_file(file_path)
+        metadata = self._get_indexed_metadata(file_path)
         if metadata and "sequence" in metadata:
             return len(metadata["sequence"]) - 2
         return 0  # Default to 0 if no valid sequence length is found
 
+    def get_date_added(self, file_path):
+        metadata = self._get_indexed_metadata(file_path)
+        if metadata:
+            return metadata.get("date_added")
+        return
+
     def get_sequence_start_position(self, file_path):
-        metadata = self.extract_metadata_from_file(file_path)
+        metadata = self._get_indexed_metadata(file_path)
         if metadata and "sequence" in metadata:
             return metadata["sequence"][1]["sequence_start_position"]
         return
@@ -109,7 +185,7 @@ class MetaDataExtractor:
         return metadata_and_thumbnail_dict
 
     def get_sequence_grid_mode(self, file_path):
-        metadata = self.extract_metadata_from_file(file_path)
+        metadata = self._get_indexed_metadata(file_path)
         if metadata and "sequence" in metadata:
             return metadata["sequence"][0]["grid_mode"]
         return
\ No newline at end of file
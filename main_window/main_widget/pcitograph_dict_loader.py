@@ -1,106 +1,152 @@
-from typing import TYPE_CHECKING
-import pandas as pd
+import csv
+import hashlib
+import os
+import pickle
+from typing import TYPE_CHECKING, Optional
 from Enums.letters import Letter
-from data.constants import BOX, DIAMOND, END_POS, IN, LETTER, START_POS
-from utilities.path_helpers import get_images_and_data_path
+from data.constants import END_POS, IN, LETTER, START_POS
+from utilities.path_helpers import (
+    get_images_and_data_path,
+    get_user_editable_resource_path,
+)
+from .pictograph_dataset import PictographDataset
 
 if TYPE_CHECKING:
     from main_window.main_widget.main_widget import MainWidget
 
 
+CSV_FILES = [
+    "data/DiamondPictographDataframe.csv",
+    "data/BoxPictographDataframe.csv",
+]
+PRECOMPILED_CACHE_FILE = "data/pictograph_dicts.pickle"
+USER_CACHE_FILE = "pictograph_dicts.pickle"
+
+
 class PictographDictLoader:
+    """
+    Loads the pictograph dicts from a pickle compiled from the CSV files.
+
+    The cache stores a hash of each CSV, so an edited CSV is picked up by
+    parsing it again with the csv module and rewriting the user cache.
+    Run this module with `python -m` to precompile the cache shipped in data/.
+    """
+
+    CACHE_VERSION = 1
+
     def __init__(self, main_widget: "MainWidget") -> None:
         self.main_widget = main_widget
 
+    def load_pictograph_dataset(self) -> PictographDataset:
+        return PictographDataset(self.load_all_pictograph_dicts())
+
     def load_all_pictograph_dicts(self) -> dict[Letter, list[dict]]:
-        # Load both Box and Diamond CSV files
-        diamond_csv_path = get_images_and_data_path(
-            "data/DiamondPictographDataframe.csv"
-        )
-        box_csv_path = get_images_and_data_path("data/BoxPictographDataframe.csv")
-
-        # Read both CSVs and combine them
-        diamond_df = pd.read_csv(diamond_csv_path)
-        box_df = pd.read_csv(box_csv_path)
-
-        # Combine the dataframes, ensuring the columns are aligned
-        combined_df = pd.concat([diamond_df, box_df], ignore_index=True)
-        combined_df = combined_df.sort_values(by=[LETTER, START_POS, END_POS])
-
-        # Apply necessary transformations
-        combined_df = self.add_turns_and_ori_to_pictograph_dict(combined_df)
-        combined_df = self.restructure_dataframe_for_new_json_format(combined_df)
-
-        # Create the dictionary with letters as keys and records as values
-        letters = {
-            self.get_letter_enum_by_value(letter_str): combined_df[
-                combined_df[LETTER] == letter_str
-            ].to_dict(orient="records")
-            for letter_str in combined_df[LETTER].unique()
-        }
+        csv_hashes = self.get_csv_hashes()
+        for cache_path in [
+            get_images_and_data_path(PRECOMPILED_CACHE_FILE),
+            get_user_editable_resource_path(USER_CACHE_FILE),
+        ]:
+            letters = self._load_cache(cache_path, csv_hashes)
+            if letters is not None:
+                return letters
+
+        letters = self.parse_csv_files()
+        try:
+            self._save_cache(
+                get_user_editable_resource_path(USER_CACHE_FILE), csv_hashes, letters
+            )
+        except OSError as e:
+            print(f"Could not write pictograph cache: {e}")
+        return letters
+
+    @classmethod
+    def compile_cache(cls) -> str:
+        """Write the precompiled cache next to the CSV files and return its path."""
+        cache_path = get_images_and_data_path(PRECOMPILED_CACHE_FILE)
+        cls._save_cache(cache_path, cls.get_csv_hashes(), cls.parse_csv_files())
+        return cache_path
 
-        # Convert the turns to integers or floats in the dictionary
-        self._convert_turns_str_to_int_or_float(letters)
+    @staticmethod
+    def get_csv_hashes() -> list[str]:
+        hashes = []
+        for csv_file in CSV_FILES:
+            with open(get_images_and_data_path(csv_file), "rb") as file:
+                hashes.append(hashlib.sha256(file.read()).hexdigest())
+        return hashes
+
+    @classmethod
+    def _load_cache(
+        cls, cache_path: str, csv_hashes: list[str]
+    ) -> Optional[dict[Letter, list[dict]]]:
+        try:
+            with open(cache_path, "rb") as file:
+                cache = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return None
+        if (
+            cache.get("version") != cls.CACHE_VERSION
+            or cache.get("csv_hashes") != csv_hashes
+        ):
+            return None
+        return cache["letters"]
+
+    @classmethod
+    def _save_cache(
+        cls,
+        cache_path: str,
+        csv_hashes: list[str],
+        letters: dict[Letter, list[dict]],
+    ) -> None:
+        temp_path = f"{cache_path}.tmp"
+        with open(temp_path, "wb") as file:
+            pickle.dump(
+                {
+                    "version": cls.CACHE_VERSION,
+                    "csv_hashes": csv_hashes,
+                    "letters": letters,
+                },
+                file,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(temp_path, cache_path)
+
+    @classmethod
+    def parse_csv_files(cls) -> dict[Letter, list[dict]]:
+        rows: list[dict] = []
+        for csv_file in CSV_FILES:
+            with open(
+                get_images_and_data_path(csv_file), newline="", encoding="utf-8"
+            ) as file:
+                rows.extend(row for row in csv.DictReader(file) if row[LETTER])
+
+        rows.sort(key=lambda row: (row[LETTER], row[START_POS], row[END_POS]))
+
+        letters: dict[Letter, list[dict]] = {}
+        for row in rows:
+            letter = cls.get_letter_enum_by_value(row[LETTER])
+            letters.setdefault(letter, []).append(cls.restructure_row(row))
         return letters
 
-    def _convert_turns_str_to_int_or_float(self, letters):
-        for letter in letters:
-            for motion in letters[letter]:
-                motion["blue_attributes"]["turns"] = int(
-                    motion["blue_attributes"]["turns"]
-                )
-                motion["red_attributes"]["turns"] = int(
-                    motion["red_attributes"]["turns"]
-                )
-
-    def add_turns_and_ori_to_pictograph_dict(self, df: pd.DataFrame) -> pd.DataFrame:
-        # Example logic for assigning turns and orientations; adjust according to your specific needs
-        for index, row in df.iterrows():
-            # Placeholder logic for turns and orientation assignments; replace with your actual logic
-            df.at[index, "blue_turns"] = 0  # Assign turns as integer
-            df.at[index, "red_turns"] = 0  # Assign turns as integer
-            df.at[index, "blue_start_ori"] = IN  # Assuming IN is a predefined variable
-            df.at[index, "red_start_ori"] = IN  # Assuming IN is a predefined variable
-        return df
-
-    def restructure_dataframe_for_new_json_format(
-        self, df: pd.DataFrame
-    ) -> pd.DataFrame:
-        def nest_attributes(row, color_prefix):
+    @staticmethod
+    def restructure_row(row: dict[str, str]) -> dict:
+        def nest_attributes(color_prefix: str) -> dict:
             return {
                 "motion_type": row[f"{color_prefix}_motion_type"],
-                "start_ori": row[f"{color_prefix}_start_ori"],
+                "start_ori": IN,
                 "prop_rot_dir": row[f"{color_prefix}_prop_rot_dir"],
                 "start_loc": row[f"{color_prefix}_start_loc"],
                 "end_loc": row[f"{color_prefix}_end_loc"],
-                "turns": row[f"{color_prefix}_turns"],
+                "turns": 0,
             }
 
-        df["blue_attributes"] = df.apply(
-            lambda row: nest_attributes(row, "blue"), axis=1
-        )
-        df["red_attributes"] = df.apply(lambda row: nest_attributes(row, "red"), axis=1)
-
-        # Drop the old, now unnecessary columns
-        blue_columns = [
-            "blue_motion_type",
-            "blue_prop_rot_dir",
-            "blue_start_loc",
-            "blue_end_loc",
-            "blue_turns",
-            "blue_start_ori",
-        ]
-        red_columns = [
-            "red_motion_type",
-            "red_prop_rot_dir",
-            "red_start_loc",
-            "red_end_loc",
-            "red_turns",
-            "red_start_ori",
-        ]
-        df = df.drop(columns=blue_columns + red_columns)
-
-        return df
+        pictograph_dict = {
+            key: value
+            for key, value in row.items()
+            if not key.startswith(("blue_", "red_"))
+        }
+        pictograph_dict["blue_attributes"] = nest_attributes("blue")
+        pictograph_dict["red_attributes"] = nest_attributes("red")
+        return pictograph_dict
 
     @staticmethod
     def get_letter_enum_by_value(letter_value: str) -> Letter:
@@ -108,3 +154,7 @@ class PictographDictLoader:
             if letter.value == letter_value:
                 return letter
         raise ValueError(f"No matching Letters enum for value: {letter_value}")
+
+
+if __name__ == "__main__":
+    print(f"Compiled pictograph cache: {PictographDictLoader.compile_cache()}")
@@ -0,0 +1,73 @@
+from collections import defaultdict
+from Enums.letters import Letter, LetterType
+from data.constants import END_POS, LETTER, START_POS
+from .grid_mode_checker import GridModeChecker
+
+
+class PictographDataset:
+    """
+    The full set of pictograph dicts with lookup tables built once at load time.
+
+    Every index holds references to the same dicts as `pictograph_dicts`, in
+    the same order, so lookups return exactly what a linear scan would have.
+    The returned lists are shared and must not be modified by callers.
+    """
+
+    def __init__(self, pictograph_dicts: dict[Letter, list[dict]]) -> None:
+        self.pictograph_dicts = pictograph_dicts
+        self.grid_mode_checker = GridModeChecker()
+
+        self._by_start_pos: dict[str, list[dict]] = defaultdict(list)
+        self._by_start_and_end_pos: dict[tuple[str, str], list[dict]] = defaultdict(
+            list
+        )
+        self._by_letter_type: dict[LetterType, list[dict]] = defaultdict(list)
+        self._by_grid_mode: dict[str, dict[Letter, list[dict]]] = defaultdict(
+            lambda: {letter: [] for letter in self.pictograph_dicts}
+        )
+        self._by_motion_types: dict[tuple[str, str], list[dict]] = defaultdict(list)
+        self._build_indexes()
+
+    def _build_indexes(self) -> None:
+        for letter, pictograph_dicts in self.pictograph_dicts.items():
+            letter_type = LetterType.get_letter_type(letter)
+            for pictograph_dict in pictograph_dicts:
+                start_pos = pictograph_dict[START_POS]
+                end_pos = pictograph_dict[END_POS]
+                self._by_start_pos[start_pos].append(pictograph_dict)
+                self._by_start_and_end_pos[(start_pos, end_pos)].append(
+                    pictograph_dict
+                )
+                self._by_letter_type[letter_type].append(pictograph_dict)
+                grid_mode = self.grid_mode_checker.get_grid_mode(pictograph_dict)
+                self._by_grid_mode[grid_mode][letter].append(pictograph_dict)
+                motion_types = (
+                    pictograph_dict["blue_attributes"]["motion_type"],
+                    pictograph_dict["red_attributes"]["motion_type"],
+                )
+                self._by_motion_types[motion_types].append(pictograph_dict)
+
+    def get_by_start_pos(self, start_pos: str) -> list[dict]:
+        return self._by_start_pos.get(start_pos, [])
+
+    def get_by_start_and_end_pos(self, start_pos: str, end_pos: str) -> list[dict]:
+        return self._by_start_and_end_pos.get((start_pos, end_pos), [])
+
+    def get_by_letter(self, letter: Letter) -> list[dict]:
+        return self.pictograph_dicts.get(letter, [])
+
+    def get_by_letter_type(self, letter_type: LetterType) -> list[dict]:
+        return self._by_letter_type.get(letter_type, [])
+
+    def get_by_grid_mode(self, grid_mode: str) -> dict[Letter, list[dict]]:
+        """Return every letter mapped to its pictograph dicts in the given grid mode."""
+        return self._by_grid_mode[grid_mode]
+
+    def get_by_motion_types(
+        self, blue_motion_type: str, red_motion_type: str
+    ) -> list[dict]:
+        return self._by_motion_types.get((blue_motion_type, red_motion_type), [])
+
+    @staticmethod
+    def get_letter(pictograph_dict: dict) -> Letter:
+        return Letter(pictograph_dict[LETTER])
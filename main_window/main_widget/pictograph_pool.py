@@ -0,0 +1,80 @@
+from typing import TYPE_CHECKING
+
+from base_widgets.base_pictograph.base_pictograph import BasePictograph
+
+if TYPE_CHECKING:
+    from main_window.main_widget.main_widget import MainWidget
+
+
+class PictographPool:
+    """
+    Recycles the short-lived pictographs of the learn tab and start position
+    picker instead of building a BasePictograph for every question or refresh.
+
+    acquire() hands out a pictograph reset to its defaults, switched to the
+    current grid mode and filled from the given dict; release() hides and
+    detaches its view and keeps it for the next caller, who shows the view
+    again once it is in a layout.
+    At most MAX_IDLE released pictographs are kept, the rest are deleted.
+    high_water_mark is the most pictographs ever in use at once.
+    """
+
+    MAX_IDLE = 32
+
+    def __init__(self, main_widget: "MainWidget") -> None:
+        self.main_widget = main_widget
+        self.idle: list[BasePictograph] = []
+        self.in_use: set[BasePictograph] = set()
+        self.high_water_mark = 0
+
+    def acquire(self, pictograph_dict: dict = None) -> BasePictograph:
+        pictograph = self.idle.pop() if self.idle else BasePictograph(self.main_widget)
+        self.reset(pictograph)
+        pictograph.grid.set_grid_mode(
+            self.main_widget.settings_manager.global_settings.get_grid_mode()
+        )
+        self.in_use.add(pictograph)
+        self.high_water_mark = max(self.high_water_mark, len(self.in_use))
+        if pictograph_dict:
+            pictograph.updater.update_pictograph(pictograph_dict)
+        return pictograph
+
+    def release(self, pictograph: BasePictograph) -> None:
+        """Take the pictograph's view off screen and return it to the pool."""
+        if pictograph not in self.in_use:
+            return
+        self.in_use.discard(pictograph)
+        view = pictograph.view
+        view.hide()
+        view.setParent(None)
+        if len(self.idle) < self.MAX_IDLE:
+            self.idle.append(pictograph)
+        else:
+            view.deleteLater()
+            pictograph.deleteLater()
+
+    def release_all(self, pictographs: list[BasePictograph]) -> None:
+        for pictograph in pictographs:
+            self.release(pictograph)
+
+    @staticmethod
+    def reset(pictograph: BasePictograph) -> None:
+        """Undo what the learn tab and start position picker change on a pictograph."""
+        pictograph.quiz_mode = False
+        pictograph.disable_gold_overlay = False
+        pictograph.selected_arrow = None
+        pictograph.tka_glyph.setVisible(True)
+        pictograph.start_to_end_pos_glyph.show()
+        pictograph.image_renderer.disable_raster()
+
+        view = pictograph.view
+        view.__dict__.pop("mousePressEvent", None)
+        view.clear_overlays()
+        view.setEnabled(True)
+        view.set_enabled(True)
+        view.setGraphicsEffect(None)
+        view.unsetCursor()
+
+    @property
+    def size(self) -> int:
+        return len(self.idle) + len(self.in_use)
@@ -0,0 +1,236 @@
+import hashlib
+import json
+import os
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap
+
+from utilities.path_helpers import get_user_editable_resource_path
+
+if TYPE_CHECKING:
+    from base_widgets.base_pictograph.base_pictograph import BasePictograph
+    from main_window.main_widget.main_widget import MainWidget
+
+
+class PictographRasterCache(QObject):
+    """
+    Pre-rendered images of pictographs for views that only display them.
+
+    Images are keyed by pictograph key, turns and orientations, the types of
+    the props in the scene, grid mode, what is visible in the pictograph and
+    a digest of the letter's special placements, so a placement edit or a
+    settings change gives new keys instead of stale images. Pixmaps are kept
+    in memory up to MAX_PIXMAPS and written to disk as PNGs; loading a PNG
+    touches it, and at startup and after invalidate() the least recently
+    used ones beyond MAX_DISK_FILES are deleted. Disk work runs on worker
+    threads; scenes can only be painted on the GUI thread, so missing images
+    are rendered one per event loop pass from a queue.
+    """
+
+    RENDER_VERSION = 1
+    RASTER_SIZE = 400
+    MAX_PIXMAPS = 256
+    MAX_DISK_FILES = 4000
+
+    image_loaded = pyqtSignal(str, QImage)
+
+    def __init__(
+        self, main_widget: "MainWidget", cache_dir: str = None, max_workers: int = None
+    ) -> None:
+        super().__init__()
+        self.main_widget = main_widget
+        self.cache_dir = cache_dir or get_user_editable_resource_path(
+            "pictograph_raster_cache"
+        )
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.pixmaps: OrderedDict[str, QPixmap] = OrderedDict()
+        self.waiting: dict[str, list["BasePictograph"]] = {}
+        self.render_queue: deque[str] = deque()
+        self.placement_digests: dict[tuple[str, str], str] = {}
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or min(2, os.cpu_count() or 1),
+            thread_name_prefix="pictograph_raster_cache",
+        )
+        self.render_timer = QTimer(self)
+        self.render_timer.setInterval(0)
+        self.render_timer.timeout.connect(self._render_next)
+        self.image_loaded.connect(self._on_image_loaded)
+        self.executor.submit(self._prune)
+
+    def get_cache_key(self, pictograph: "BasePictograph") -> str:
+        # The mode the pictograph is drawn in, which is what ends up in the image
+        grid_mode = pictograph.grid.grid_mode
+        pictograph_key = self.main_widget.pictograph_key_generator.generate_pictograph_key(
+            pictograph.pictograph_dict
+        )
+        motions = ",".join(
+            f"{motion.turns}:{motion.start_ori}"
+            for motion in (pictograph.blue_motion, pictograph.red_motion)
+        )
+        visible_items = "".join(
+            str(int(item.isVisible()))
+            for item in (
+                pictograph.tka_glyph,
+                pictograph.vtg_glyph,
+                pictograph.elemental_glyph,
+                pictograph.start_to_end_pos_glyph,
+                pictograph.grid.nonradial_layer,
+            )
+        )
+        return "_".join(
+            [
+                pictograph_key,
+                motions,
+                ",".join(
+                    str(prop.prop_type)
+                    for prop in (pictograph.blue_prop, pictograph.red_prop)
+                ),
+                grid_mode,
+                visible_items,
+                self._get_placement_digest(grid_mode, pictograph.letter.value),
+            ]
+        )
+
+    def request(self, pictograph: "BasePictograph", key: str) -> Optional[QPixmap]:
+        """
+        Return the pixmap for the key if it is in memory. Otherwise load or
+        render it and hand it to the pictograph's renderer once it is ready.
+        """
+        pixmap = self.pixmaps.get(key)
+        if pixmap is not None:
+            self.pixmaps.move_to_end(key)
+            return pixmap
+
+        waiting = self.waiting.get(key)
+        if waiting is not None:
+            if pictograph not in waiting:
+                waiting.append(pictograph)
+            return None
+        self.waiting[key] = [pictograph]
+
+        file_path = self.get_file_path(key)
+        if os.path.isfile(file_path):
+            self.executor.submit(self._load, key, file_path)
+        else:
+            self._queue_render(key)
+        return None
+
+    def invalidate(self, letter_value: str = None) -> None:
+        """Forget the images of one letter, or of every letter."""
+        if letter_value is None:
+            self.placement_digests.clear()
+            self.pixmaps.clear()
+        else:
+            for digest_key in [
+                key for key in self.placement_digests if key[1] == letter_value
+            ]:
+                del self.placement_digests[digest_key]
+            for key in [key for key in self.pixmaps if key.split("_")[0] == letter_value]:
+                del self.pixmaps[key]
+        # The old images stay on disk under keys that are no longer asked for
+        self.executor.submit(self._prune)
+
+    def shutdown(self) -> None:
+        """Drop queued work and wait for running disk writes."""
+        self.render_timer.stop()
+        self.render_queue.clear()
+        self.waiting.clear()
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def get_file_path(self, key: str) -> str:
+        digest = hashlib.sha1(
+            f"{self.RENDER_VERSION}_{self.RASTER_SIZE}_{key}".encode("utf-8")
+        ).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.png")
+
+    def _get_placement_digest(self, grid_mode: str, letter_value: str) -> str:
+        digest = self.placement_digests.get((grid_mode, letter_value))
+        if digest is None:
+            special_placements = (
+                self.main_widget.placement_data_store.get_special_placements(grid_mode)
+            )
+            letter_placements = {
+                ori_key: placements.get(letter_value, {})
+                for ori_key, placements in special_placements.items()
+            }
+            digest = hashlib.sha1(
+                json.dumps(letter_placements, sort_keys=True).encode("utf-8")
+            ).hexdigest()[:12]
+            self.placement_digests[(grid_mode, letter_value)] = digest
+        return digest
+
+    def _queue_render(self, key: str) -> None:
+        self.render_queue.append(key)
+        if not self.render_timer.isActive():
+            self.render_timer.start()
+
+    def _render_next(self) -> None:
+        while self.render_queue:
+            key = self.render_queue.popleft()
+            pictograph = next(
+                (
+                    pictograph
+                    for pictograph in self.waiting.get(key, [])
+                    if pictograph.image_renderer.raster_key == key
+                ),
+                None,
+            )
+            if pictograph is None:
+                self.waiting.pop(key, None)
+                continue
+            image = pictograph.image_renderer.render_image(self.RASTER_SIZE)
+            self.executor.submit(self._save, image, self.get_file_path(key))
+            self._deliver(key, QPixmap.fromImage(image))
+            return
+        self.render_timer.stop()
+
+    def _on_image_loaded(self, key: str, image: QImage) -> None:
+        if key not in self.waiting:
+            return
+        if image.isNull():
+            self._queue_render(key)
+        else:
+            self._deliver(key, QPixmap.fromImage(image))
+
+    def _deliver(self, key: str, pixmap: QPixmap) -> None:
+        self.pixmaps[key] = pixmap
+        while len(self.pixmaps) > self.MAX_PIXMAPS:
+            self.pixmaps.popitem(last=False)
+        for pictograph in self.waiting.pop(key, []):
+            if pictograph.image_renderer.raster_key == key:
+                pictograph.image_renderer.show_raster(pixmap)
+
+    def _load(self, key: str, file_path: str) -> None:
+        try:
+            os.utime(file_path)
+        except OSError:
+            pass
+        self.image_loaded.emit(key, QImage(file_path))
+
+    def _prune(self) -> None:
+        """Delete the least recently used PNGs beyond MAX_DISK_FILES."""
+        try:
+            entries = [
+                (entry.stat().st_mtime, entry.path)
+                for entry in os.scandir(self.cache_dir)
+                if entry.name.endswith(".png")
+            ]
+        except OSError as e:
+            print(f"Failed to prune the pictograph raster cache: {e}")
+            return
+        if len(entries) <= self.MAX_DISK_FILES:
+            return
+        entries.sort()
+        for _, file_path in entries[: len(entries) - self.MAX_DISK_FILES]:
+            try:
+                os.remove(file_path)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _save(image: QImage, file_path: str) -> None:
+        temp_path = f"{file_path}.tmp"
+        if image.save(temp_path, "PNG"):
+            os.replace(temp_path, file_path)
@@ -0,0 +1,69 @@
+import hashlib
+import json
+import os
+
+
+class SequenceCardExportManifest:
+    """
+    Remembers the source metadata hash each sequence card was exported from.
+
+    The manifest lives next to the exported cards. A card only needs to be
+    rendered again when its source metadata hash changes or the exported
+    file is missing.
+    """
+
+    MANIFEST_VERSION = 1
+    FILENAME = "sequence_card_export_manifest.json"
+
+    def __init__(self, export_path: str) -> None:
+        self.export_path = export_path
+        self.manifest_path = os.path.join(export_path, self.FILENAME)
+        self.hashes: dict[str, str] = {}
+        self.dirty = False
+        self.load()
+
+    def load(self) -> None:
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if data.get("version") == self.MANIFEST_VERSION:
+            self.hashes = data.get("hashes", {})
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        temp_path = f"{self.manifest_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(
+                {"version": self.MANIFEST_VERSION, "hashes": self.hashes},
+                file,
+                ensure_ascii=False,
+                indent=2,
+            )
+        os.replace(temp_path, self.manifest_path)
+        self.dirty = False
+
+    def is_current(self, image_filename: str, source_hash: str) -> bool:
+        return self.hashes.get(image_filename) == source_hash and os.path.exists(
+            os.path.join(self.export_path, image_filename)
+        )
+
+    def record(self, image_filename: str, source_hash: str) -> None:
+        self.hashes[image_filename] = source_hash
+        self.dirty = True
+
+    def clear(self) -> None:
+        self.hashes.clear()
+        self.dirty = True
+
+    @staticmethod
+    def hash_metadata(metadata: dict, options: dict) -> str:
+        """Hash the source metadata together with the export options."""
+        payload = json.dumps(
+            {"metadata": metadata, "options": options},
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -39,10 +39,11 @@ class SequenceCardImageDisplayer:
 
         self.current_page_index = -1
 
+        thumbnail_cache = self.main_widget.thumbnail_cache
         for image_path in sorted_images:
-            pixmap = QPixmap(image_path)
-
             max_image_width = self.page_width // 2 - self.image_card_margin
+            pixmap = QPixmap(thumbnail_cache.get_path(image_path, max_image_width))
+
             scale_factor = max_image_width / pixmap.width()
             scaled_height = int(pixmap.height() * scale_factor)
 
@@ -1,10 +1,11 @@
 from datetime import datetime
-import json
 import os
+import time
 from PyQt6.QtGui import QImage
-from typing import TYPE_CHECKING
-from PIL import Image, PngImagePlugin
-import numpy as np
+from typing import TYPE_CHECKING, Optional
+from main_window.main_widget.dictionary_index.dictionary_metadata_index import (
+    DictionaryMetadataIndex,
+)
 from main_window.main_widget.dictionary_widget.temp_beat_frame.temp_beat_frame import (
     TempBeatFrame,
 )
@@ -16,15 +17,26 @@ from utilities.path_helpers import (
     get_dictionary_path,
     get_sequence_card_image_exporter_path,
 )
+from .sequence_card_export_manifest import SequenceCardExportManifest
+from .sequence_card_image_writer import SequenceCardImageWriter
 
 if TYPE_CHECKING:
+    from main_window.main_widget.dictionary_widget.dictionary_widget import (
+        DictionaryWidget,
+    )
     from main_window.main_widget.sequence_card_tab.sequence_card_tab import (
         SequenceCardTab,
     )
 
 
 class SequenceCardImageExporter:
-    def __init__(self, sequence_card_tab: "SequenceCardTab"):
+    EXPORT_OPTIONS = {
+        "add_word": True,
+        "add_info": True,
+        "add_difficulty_level": True,
+    }
+
+    def __init__(self, sequence_card_tab: "SequenceCardTab | DictionaryWidget"):
         self.main_widget = sequence_card_tab.main_widget
         self.temp_beat_frame = TempBeatFrame(sequence_card_tab)
         self.export_manager = ImageExportManager(
@@ -32,44 +44,87 @@ class SequenceCardImageExporter:
         )
         # self.export_all_images()
 
-    def export_all_images(self):
-        """Exports all images with headers and footers to a temporary directory."""
-        dictionary_path = get_dictionary_path()
+    def export_all_images(self, force: bool = False) -> None:
+        """
+        Exports all images with headers and footers to the sequence card directory.
+
+        Cards whose source metadata is unchanged since the last export are
+        skipped; PNG encoding runs on the writer stage while the next card
+        renders. export_sequence_cards.py runs the same export across processes.
+        """
         export_path = get_sequence_card_image_exporter_path()
+        manifest = SequenceCardExportManifest(export_path)
+        if force:
+            manifest.clear()
 
-        # Create the export directory if it doesn't exist
-        if not os.path.exists(export_path):
-            os.makedirs(export_path)
+        start_time = time.perf_counter()
+        tasks, skipped = self.collect_export_tasks(
+            self.get_all_images(get_dictionary_path()),
+            self.main_widget.metadata_extractor.index,
+            manifest,
+        )
+        self.main_widget.metadata_extractor.save_index()
 
-        images = self.get_all_images(dictionary_path)
-        for image_path in images:
-            # Extract metadata and create a temporary beat frame
-            metadata = self.main_widget.metadata_extractor.extract_metadata_from_file(
-                image_path
+        writer = SequenceCardImageWriter(export_path, manifest)
+        for image_filename, metadata, source_hash in tasks:
+            rgba_data, width, height = self.render_card(metadata["sequence"])
+            writer.submit(
+                image_filename,
+                rgba_data,
+                width,
+                height,
+                self.stamp_export_date(metadata),
+                source_hash,
             )
-            if metadata and "sequence" in metadata:
-                sequence = metadata["sequence"]
-                options = {
-                    "add_word": True,
-                    "add_info": True,
-                    "add_difficulty_level": True,
-                }
-                self.temp_beat_frame.populate_beat_frame_from_json(sequence)
-                qimage = self.export_manager.image_creator.create_sequence_image(
-                    sequence, include_start_pos=False, options=options
-                )
+        writer.finish()
+        print(writer.summary(skipped, time.perf_counter() - start_time))
 
-                pil_image = self.qimage_to_pil(qimage)
-                metadata["date_added"] = datetime.now().isoformat()
-                info = self._create_png_info(metadata)
+    @staticmethod
+    def collect_export_tasks(
+        image_paths: list[str],
+        metadata_index: DictionaryMetadataIndex,
+        manifest: SequenceCardExportManifest,
+    ) -> tuple[list[tuple[str, dict, str]], int]:
+        """Return (filename, metadata, source hash) for every card that needs exporting."""
+        tasks = []
+        skipped = 0
+        for image_path in image_paths:
+            metadata = SequenceCardImageExporter._read_metadata(
+                image_path, metadata_index
+            )
+            if not metadata or "sequence" not in metadata:
+                continue
+            image_filename = os.path.basename(image_path)
+            source_hash = manifest.hash_metadata(
+                metadata, SequenceCardImageExporter.EXPORT_OPTIONS
+            )
+            if manifest.is_current(image_filename, source_hash):
+                skipped += 1
+                continue
+            tasks.append((image_filename, metadata, source_hash))
+        return tasks, skipped
+
+    def render_card(self, sequence: list[dict]) -> tuple[bytes, int, int]:
+        """Render one card and return its pixels as RGBA bytes with the size."""
+        self.temp_beat_frame.populate_beat_frame_from_json(sequence)
+        qimage = self.export_manager.image_creator.create_sequence_image(
+            sequence, include_start_pos=False, options=self.EXPORT_OPTIONS
+        )
+        return self.qimage_to_rgba(qimage)
 
-                image_filename = os.path.basename(image_path)
-                pil_image.save(
-                    os.path.join(export_path, image_filename), "PNG", pnginfo=info
-                )
-                print(f"Exported: {image_filename}")
+    @staticmethod
+    def stamp_export_date(metadata: dict) -> dict:
+        return {**metadata, "date_added": datetime.now().isoformat()}
 
-    def get_all_images(self, path: str) -> list[str]:
+    @staticmethod
+    def qimage_to_rgba(qimage: QImage) -> tuple[bytes, int, int]:
+        qimage = qimage.convertToFormat(QImage.Format.Format_RGBA8888)
+        bits = qimage.constBits()
+        bits.setsize(qimage.sizeInBytes())
+        return bytes(bits), qimage.width(), qimage.height()
+
+    @staticmethod
+    def get_all_images(path: str) -> list[str]:
         images = []
         for root, _, files in os.walk(path):
             for file in files:
@@ -77,16 +132,12 @@ class SequenceCardImageExporter:
                     images.append(os.path.join(root, file))
         return images
 
-    def qimage_to_pil(self, qimage: QImage) -> Image.Image:
-        qimage = qimage.convertToFormat(QImage.Format.Format_ARGB32)
-        width, height = qimage.width(), qimage.height()
-        ptr = qimage.bits()
-        ptr.setsize(height * width * 4)
-        arr = np.array(ptr, copy=False).reshape((height, width, 4))
-        arr = arr[..., [2, 1, 0, 3]]  # Convert from ARGB to RGBA
-        return Image.fromarray(arr, "RGBA")
-
-    def _create_png_info(self, metadata: dict) -> PngImagePlugin.PngInfo:
-        info = PngImagePlugin.PngInfo()
-        info.add_text("metadata", json.dumps(metadata))
-        return info
+    @staticmethod
+    def _read_metadata(
+        image_path: str, metadata_index: DictionaryMetadataIndex
+    ) -> Optional[dict]:
+        try:
+            return metadata_index.get_metadata(image_path)
+        except Exception as e:
+            print(f"Error reading metadata from {image_path}: {e}")
+            return None
@@ -0,0 +1,96 @@
+import json
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from PIL import Image, PngImagePlugin
+
+from .sequence_card_export_manifest import SequenceCardExportManifest
+
+
+class SequenceCardImageWriter:
+    """
+    Writer stage of the sequence card export.
+
+    Rendered cards arrive as raw RGBA bytes and are PNG-encoded with their
+    metadata on a small thread pool, so the renderer can move on to the next
+    card. A card is recorded in the manifest only after its file is written.
+    """
+
+    MAX_PENDING = 8
+
+    def __init__(
+        self,
+        export_path: str,
+        manifest: SequenceCardExportManifest,
+        max_workers: int = None,
+    ) -> None:
+        self.export_path = export_path
+        self.manifest = manifest
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or min(4, os.cpu_count() or 1),
+            thread_name_prefix="sequence_card_writer",
+        )
+        self.pending: deque[tuple[Future, str, str]] = deque()
+        self.written = 0
+        self.failed = 0
+        self.bytes_written = 0
+
+    def submit(
+        self,
+        image_filename: str,
+        rgba_data: bytes,
+        width: int,
+        height: int,
+        metadata: dict,
+        source_hash: str,
+    ) -> None:
+        while len(self.pending) >= self.MAX_PENDING:
+            self._collect_oldest()
+        future = self.executor.submit(
+            self._write_png,
+            os.path.join(self.export_path, image_filename),
+            rgba_data,
+            width,
+            height,
+            metadata,
+        )
+        self.pending.append((future, image_filename, source_hash))
+
+    def finish(self) -> None:
+        """Wait for every queued card, then save the manifest."""
+        while self.pending:
+            self._collect_oldest()
+        self.executor.shutdown()
+        self.manifest.save()
+
+    def summary(self, skipped: int, elapsed: float) -> str:
+        rate = self.written / elapsed if elapsed else 0
+        return (
+            f"Exported {self.written} sequence cards in {elapsed:.1f}s "
+            f"({rate:.1f} cards/s, {self.bytes_written / 1_000_000:.1f} MB), "
+            f"skipped {skipped} unchanged, {self.failed} failed"
+        )
+
+    def _collect_oldest(self) -> None:
+        future, image_filename, source_hash = self.pending.popleft()
+        try:
+            self.bytes_written += future.result()
+        except Exception as e:
+            self.failed += 1
+            print(f"Failed to write {image_filename}: {e}")
+            return
+        self.written += 1
+        self.manifest.record(image_filename, source_hash)
+        print(f"Exported: {image_filename}")
+
+    @staticmethod
+    def _write_png(
+        output_path: str, rgba_data: bytes, width: int, height: int, metadata: dict
+    ) -> int:
+        image = Image.frombuffer("RGBA", (width, height), rgba_data, "raw", "RGBA", 0, 1)
+        info = PngImagePlugin.PngInfo()
+        info.add_text("metadata", json.dumps(metadata))
+        temp_path = f"{output_path}.tmp"
+        image.save(temp_path, "PNG", pnginfo=info)
+        os.replace(temp_path, output_path)
+        return os.path.getsize(output_path)
@@ -54,7 +54,7 @@ class SequencePropertiesManager:
         self.sequence = sequence[1:]
 
     def update_sequence_properties(self):
-        sequence = self.json_manager.loader_saver.load_current_sequence_json()
+        sequence = self.json_manager.document.sequence
         if len(sequence) <= 1:
             return
 
@@ -62,11 +62,12 @@ class SequencePropertiesManager:
         # properties = self.check_all_properties()
         # sequence[0].update(properties)
 
-        self.json_manager.loader_saver.save_current_sequence(sequence)
+        self.json_manager.loader_saver.update_sequence_metadata(sequence)
+        self.json_manager.document.mark_modified(0)
 
     def calculate_word(self, sequence):
         if sequence is None or not isinstance(sequence, list):
-            sequence = self.json_manager.loader_saver.load_current_sequence_json()
+            sequence = self.json_manager.document.sequence
 
         if len(sequence) < 2:
             return ""
@@ -107,9 +108,7 @@ class SequencePropertiesManager:
 
     def _gather_properties(self):
         return {
-            "word": self.calculate_word(
-                self.json_manager.loader_saver.load_current_sequence_json()
-            ),
+            "word": self.calculate_word(self.json_manager.document.sequence),
             "author": self.main_widget.main_window.settings_manager.users.user_manager.get_current_user(),
             "level": self.main_widget.sequence_level_evaluator.get_sequence_difficulty_level(
                 self.sequence
@@ -0,0 +1,101 @@
+import os
+from typing import TYPE_CHECKING
+from PyQt6.QtCore import QTimer
+
+from Enums.letters import Letter
+from utilities.path_helpers import get_images_and_data_path
+
+if TYPE_CHECKING:
+    from main_window.main_widget.main_widget import MainWidget
+    from objects.arrow.arrow import Arrow
+
+
+class SpecialPlacementEditingSession:
+    """
+    Collects special placement edits in memory and writes them in one batch.
+
+    Edits are applied straight to the shared special placements tree, so
+    pictographs see them at once; the letter files they touch are only marked
+    dirty and written once the edits pause for FLUSH_DELAY_MS, or when flush()
+    is called before the placements are reloaded or the app closes.
+    """
+
+    FLUSH_DELAY_MS = 1000
+
+    def __init__(self, main_widget: "MainWidget") -> None:
+        self.main_widget = main_widget
+        self.placement_data_store = main_widget.placement_data_store
+        self.dirty_entries: set[tuple[str, str, str]] = set()
+        self.flush_timer = QTimer()
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(self.FLUSH_DELAY_MS)
+        self.flush_timer.timeout.connect(self.flush)
+
+    def get_letter_data(self, ori_key: str, letter: Letter) -> dict:
+        """The live entry for a letter, created in the tree if it is missing."""
+        return self._get_special_placements()[ori_key].setdefault(letter.value, {})
+
+    def set_letter_data(self, ori_key: str, letter: Letter, letter_data: dict) -> None:
+        self._get_special_placements()[ori_key][letter.value] = letter_data
+        self.main_widget.placement_solver.invalidate(letter.value)
+        self.main_widget.pictograph_raster_cache.invalidate(letter.value)
+        self.mark_dirty(ori_key, letter)
+
+    def mark_dirty(self, ori_key: str, letter: Letter) -> None:
+        self.dirty_entries.add((self._get_grid_mode(), ori_key, letter.value))
+        self.flush_timer.start()
+
+    def flush(self) -> None:
+        self.flush_timer.stop()
+        json_handler = self.main_widget.json_manager.special_placement_handler
+        dirty_entries, self.dirty_entries = self.dirty_entries, set()
+        for grid_mode, ori_key, letter_value in sorted(dirty_entries):
+            special_placements = self.placement_data_store.special_placements.get(
+                grid_mode
+            )
+            if special_placements is None:
+                continue
+            file_path = self.get_file_path(grid_mode, ori_key, letter_value)
+            existing_data = json_handler.load_json_data(file_path)
+            existing_data[letter_value] = special_placements[ori_key].get(
+                letter_value, {}
+            )
+            json_handler.write_json_data(existing_data, file_path)
+
+    def update_matching_pictographs(
+        self, letter: Letter, turns_tuples: set[str]
+    ) -> None:
+        """Re-place the cached pictographs that read the edited entries."""
+        turns_tuple_generator = self.main_widget.turns_tuple_generator
+        for pictograph in self.main_widget.pictograph_cache.get(letter, {}).values():
+            if turns_tuple_generator.generate_turns_tuple(pictograph) in turns_tuples:
+                pictograph.arrow_placement_manager.update_arrow_placements()
+                pictograph.image_renderer.refresh()
+
+    def get_affected_turns_tuples(self, arrow: "Arrow") -> set[str]:
+        """The turns tuple of the arrow's pictograph and its mirrored tuple."""
+        turns_tuple_generator = self.main_widget.turns_tuple_generator
+        turns_tuples = {turns_tuple_generator.generate_turns_tuple(arrow.pictograph)}
+        mirrored_tuple = turns_tuple_generator.generate_mirrored_tuple(arrow)
+        if mirrored_tuple:
+            turns_tuples.add(mirrored_tuple)
+        return turns_tuples
+
+    @staticmethod
+    def get_file_path(grid_mode: str, ori_key: str, letter_value: str) -> str:
+        return get_images_and_data_path(
+            os.path.join(
+                "data",
+                "arrow_placement",
+                grid_mode,
+                "special",
+                ori_key,
+                f"{letter_value}_placements.json",
+            )
+        )
+
+    def _get_grid_mode(self) -> str:
+        return self.main_widget.settings_manager.global_settings.get_grid_mode()
+
+    def _get_special_placements(self) -> dict[str, dict[str, dict]]:
+        return self.placement_data_store.get_special_placements(self._get_grid_mode())
@@ -0,0 +1,221 @@
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Iterable, Optional
+from PIL import Image
+
+from utilities.path_helpers import get_user_editable_resource_path
+
+
+class ThumbnailCache:
+    """
+    Content-addressed disk cache of pre-scaled sequence images.
+
+    Each source image is hashed once and scaled to every bucket width narrower
+    than itself; the variants live under the hash, so renamed or duplicated
+    images share them and an edited image gets new ones. Hashing and scaling
+    happen on worker threads. get_path() only stats the source file, and it
+    returns the source itself until its variants are ready. The index is
+    saved INDEX_SAVE_DELAY_S after the last generated entry, and on shutdown.
+    """
+
+    INDEX_VERSION = 1
+    INDEX_SAVE_DELAY_S = 2.0
+    BUCKET_WIDTHS = (256, 512, 1024, 2048)
+    VARIANT_FORMAT = "png"
+
+    def __init__(self, cache_dir: str = None, max_workers: int = None) -> None:
+        self.cache_dir = cache_dir or get_user_editable_resource_path(
+            "thumbnail_cache"
+        )
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.index_path = os.path.join(self.cache_dir, "thumbnail_cache_index.json")
+        self.entries: dict[str, dict] = {}
+        self.pending: dict[str, Future] = {}
+        self.lock = threading.Lock()
+        self.save_lock = threading.Lock()
+        self.save_timer: Optional[threading.Timer] = None
+        self.dirty = False
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers or min(4, os.cpu_count() or 1),
+            thread_name_prefix="thumbnail_cache",
+        )
+        self.load()
+
+    def load(self) -> None:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if data.get("version") == self.INDEX_VERSION:
+            self.entries = data.get("entries", {})
+
+    def save(self) -> None:
+        with self.save_lock:
+            with self.lock:
+                if self.save_timer is not None:
+                    self.save_timer.cancel()
+                    self.save_timer = None
+                if not self.dirty:
+                    return
+                data = {"version": self.INDEX_VERSION, "entries": dict(self.entries)}
+                self.dirty = False
+            temp_path = f"{self.index_path}.tmp"
+            try:
+                with open(temp_path, "w", encoding="utf-8") as file:
+                    json.dump(data, file, ensure_ascii=False, separators=(",", ":"))
+                os.replace(temp_path, self.index_path)
+            except OSError as e:
+                print(f"Failed to save the thumbnail cache index: {e}")
+
+    def shutdown(self) -> None:
+        """Drop queued work, wait for running jobs and save the index."""
+        self.executor.shutdown(wait=True, cancel_futures=True)
+        self.save()
+
+    def cancel_prefetch(self) -> None:
+        """Drop queued generation jobs that have not started yet."""
+        with self.lock:
+            for key, future in list(self.pending.items()):
+                if future.cancel():
+                    del self.pending[key]
+
+    def get_image_size(self, source_path: str) -> Optional[tuple[int, int]]:
+        """Source size as last indexed, without touching the disk."""
+        with self.lock:
+            entry = self.entries.get(self._make_key(source_path))
+        if entry is None:
+            return None
+        return entry["width"], entry["height"]
+
+    def get_path(self, source_path: str, width: int) -> str:
+        """
+        Return the smallest cached variant at least `width` pixels wide.
+
+        Falls back to the source image when no bucket is wide enough or the
+        variants are not generated yet; in the latter case they are queued.
+        """
+        entry = self._get_current_entry(source_path)
+        if entry is None:
+            self.prefetch([source_path])
+            return source_path
+
+        bucket = self.get_bucket(width, entry["width"])
+        if bucket is None:
+            return source_path
+        variant_path = self.get_variant_path(entry["hash"], bucket)
+        if os.path.exists(variant_path):
+            return variant_path
+        self.prefetch([source_path], force=True)
+        return source_path
+
+    def prefetch(self, source_paths: Iterable[str], force: bool = False) -> None:
+        """Queue variant generation for images that are not cached yet."""
+        for source_path in source_paths:
+            key = self._make_key(source_path)
+            with self.lock:
+                if key in self.pending:
+                    continue
+                if not force and key in self.entries:
+                    continue
+                self.pending[key] = self.executor.submit(
+                    self._generate, source_path, key
+                )
+
+    def get_bucket(self, width: int, source_width: int) -> Optional[int]:
+        for bucket in self.BUCKET_WIDTHS:
+            if bucket >= source_width:
+                return None
+            if bucket >= width:
+                return bucket
+        return None
+
+    def get_variant_path(self, source_hash: str, bucket: int) -> str:
+        return os.path.join(
+            self.cache_dir,
+            source_hash[:2],
+            f"{source_hash}_{bucket}.{self.VARIANT_FORMAT}",
+        )
+
+    ### WORKER THREADS ###
+
+    def _generate(self, source_path: str, key: str) -> None:
+        try:
+            stat = os.stat(source_path)
+            source_hash = self._hash_file(source_path)
+            with Image.open(source_path) as image:
+                image.load()
+                source_width, source_height = image.size
+                for bucket in self.BUCKET_WIDTHS:
+                    if bucket >= source_width:
+                        break
+                    variant_path = self.get_variant_path(source_hash, bucket)
+                    if not os.path.exists(variant_path):
+                        self._write_variant(image, bucket, variant_path)
+        except Exception as e:
+            print(f"Failed to cache thumbnails for {source_path}: {e}")
+            with self.lock:
+                self.pending.pop(key, None)
+            return
+
+        with self.lock:
+            self.entries[key] = {
+                "mtime": stat.st_mtime,
+                "size": stat.st_size,
+                "hash": source_hash,
+                "width": source_width,
+                "height": source_height,
+            }
+            self.pending.pop(key, None)
+            self.dirty = True
+            self._schedule_save()
+
+    def _write_variant(self, image: Image.Image, bucket: int, variant_path: str) -> None:
+        height = max(1, round(image.height * bucket / image.width))
+        variant = image.resize((bucket, height), Image.Resampling.LANCZOS)
+        os.makedirs(os.path.dirname(variant_path), exist_ok=True)
+        temp_path = f"{variant_path}.{threading.get_ident()}.tmp"
+        variant.save(temp_path, self.VARIANT_FORMAT.upper(), compress_level=1)
+        os.replace(temp_path, variant_path)
+
+    @staticmethod
+    def _hash_file(file_path: str) -> str:
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    ### INDEX ###
+
+    def _schedule_save(self) -> None:
+        """Start the save timer unless one is running; call with the lock held."""
+        if self.save_timer is None:
+            self.save_timer = threading.Timer(self.INDEX_SAVE_DELAY_S, self.save)
+            self.save_timer.daemon = True
+            self.save_timer.start()
+
+    def _get_current_entry(self, source_path: str) -> Optional[dict]:
+        key = self._make_key(source_path)
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry is None:
+            return None
+        try:
+            stat = os.stat(source_path)
+        except OSError:
+            return None
+        if entry["mtime"] != stat.st_mtime or entry["size"] != stat.st_size:
+            with self.lock:
+                self.entries.pop(key, None)
+                self.dirty = True
+                self._schedule_save()
+            return None
+        return entry
+
+    @staticmethod
+    def _make_key(file_path: str) -> str:
+        return os.path.normcase(os.path.abspath(file_path))
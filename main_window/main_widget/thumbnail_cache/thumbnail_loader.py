@@ -0,0 +1,110 @@
+import os
+import threading
+from typing import TYPE_CHECKING, Callable
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt6.QtGui import QImage
+
+if TYPE_CHECKING:
+    from .thumbnail_cache import ThumbnailCache
+
+
+class ThumbnailLoader(QObject):
+    """
+    Decodes and scales thumbnails on a thread pool.
+
+    request() returns at once with a request id; the image is read from the
+    smallest cached variant that fits, scaled to the requested width off the
+    GUI thread and handed to the callback on the GUI thread. Higher priority
+    requests are started first, and cancelled requests are either dropped
+    from the queue or have their result discarded.
+    """
+
+    image_loaded = pyqtSignal(int, QImage)
+
+    def __init__(self, thumbnail_cache: "ThumbnailCache", max_threads: int = None):
+        super().__init__()
+        self.thumbnail_cache = thumbnail_cache
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(max_threads or min(4, os.cpu_count() or 1))
+        self.jobs: dict[int, "ThumbnailLoadJob"] = {}
+        self.callbacks: dict[int, Callable[[QImage], None]] = {}
+        self.lock = threading.Lock()
+        self.next_request_id = 0
+        self.image_loaded.connect(self._deliver)
+
+    def request(
+        self,
+        image_path: str,
+        width: int,
+        callback: Callable[[QImage], None],
+        priority: int = 0,
+    ) -> int:
+        self.next_request_id += 1
+        request_id = self.next_request_id
+        job = ThumbnailLoadJob(self, request_id, image_path, width)
+        with self.lock:
+            self.jobs[request_id] = job
+        self.callbacks[request_id] = callback
+        self.thread_pool.start(job, priority)
+        return request_id
+
+    def cancel(self, request_id: int) -> None:
+        self.callbacks.pop(request_id, None)
+        with self.lock:
+            job = self.jobs.pop(request_id, None)
+        if job is not None:
+            self.thread_pool.tryTake(job)
+
+    def cancel_all(self) -> None:
+        self.callbacks.clear()
+        with self.lock:
+            jobs = list(self.jobs.values())
+            self.jobs.clear()
+        for job in jobs:
+            self.thread_pool.tryTake(job)
+
+    def shutdown(self) -> None:
+        self.cancel_all()
+        self.thread_pool.waitForDone()
+
+    def is_active(self, request_id: int) -> bool:
+        with self.lock:
+            return request_id in self.jobs
+
+    def finish(self, request_id: int, image: QImage) -> None:
+        """Called on the worker thread once a job is done."""
+        with self.lock:
+            if self.jobs.pop(request_id, None) is None:
+                return
+        self.image_loaded.emit(request_id, image)
+
+    def _deliver(self, request_id: int, image: QImage) -> None:
+        callback = self.callbacks.pop(request_id, None)
+        if callback is not None and not image.isNull():
+            callback(image)
+
+
+class ThumbnailLoadJob(QRunnable):
+    def __init__(
+        self, loader: ThumbnailLoader, request_id: int, image_path: str, width: int
+    ) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self.loader = loader
+        self.request_id = request_id
+        self.image_path = image_path
+        self.width = width
+
+    def run(self) -> None:
+        if not self.loader.is_active(self.request_id):
+            return
+        cached_path = self.loader.thumbnail_cache.get_path(self.image_path, self.width)
+        image = QImage(cached_path)
+        if image.isNull() and cached_path != self.image_path:
+            # An unreadable variant falls back to the source image
+            image = QImage(self.image_path)
+        if not image.isNull() and self.width > 0 and image.width() != self.width:
+            image = image.scaledToWidth(
+                self.width, Qt.TransformationMode.SmoothTransformation
+            )
+        self.loader.finish(self.request_id, image)
@@ -1,9 +1,10 @@
 from typing import TYPE_CHECKING
 from .permutation_executor_base import PermutationExecutor
-from PyQt6.QtWidgets import QApplication
 
 if TYPE_CHECKING:
-    from ..circular_auto_builder import CircularAutoBuilder
+    from main_window.main_widget.json_manager.json_ori_calculator import (
+        JsonOriCalculator,
+    )
 
 vertical_mirror_map = {"s": "s", "e": "w", "w": "e", "n": "n"}
 horizontal_mirror_map = {"s": "n", "n": "s", "e": "e", "w": "w"}
@@ -12,16 +13,18 @@ horizontal_mirror_map = {"s": "n", "n": "s", "e": "e", "w": "w"}
 class MirroredPermutationExecutor(PermutationExecutor):
     def __init__(
         self,
-        circular_auto_builder: "CircularAutoBuilder",
+        ori_calculator: "JsonOriCalculator",
         color_swap_second_half: bool,
     ):
-        self.circular_auto_builder = circular_auto_builder
+        self.ori_calculator = ori_calculator
         self.color_swap_second_half = color_swap_second_half
-        self.validation_engine = circular_auto_builder.validation_engine
 
-    def create_permutations(self, sequence: list[dict], vertical_or_horizontal: str):
+    def create_permutations(
+        self, sequence: list[dict], vertical_or_horizontal: str
+    ) -> list[dict]:
+        """Append the mirrored entries to the sequence and return them."""
         if not self.can_perform_mirrored_permutation(sequence):
-            return
+            return []
         self.vertical_or_horizontal = vertical_or_horizontal
         sequence_length = len(sequence) - 2
         last_entry = sequence[-1]
@@ -44,16 +47,8 @@ class MirroredPermutationExecutor(PermutationExecutor):
             new_entries.append(next_pictograph)
             sequence.append(next_pictograph)
 
-            sequence_widget = (
-                self.circular_auto_builder.top_builder_widget.sequence_widget
-            )
-            sequence_widget.create_new_beat_and_add_to_sequence(
-                next_pictograph, override_grow_sequence=True, update_word=False
-            )
-            self.validation_engine.validate_last_pictograph()
-            QApplication.processEvents()
-
             last_entry = next_pictograph
+        return new_entries
 
     def determine_how_many_entries_to_add(self, sequence_length: int) -> int:
         return sequence_length
@@ -97,12 +92,12 @@ class MirroredPermutationExecutor(PermutationExecutor):
         }
 
         new_entry["blue_attributes"]["end_ori"] = (
-            self.circular_auto_builder.json_manager.ori_calculator.calculate_end_orientation(
+            self.ori_calculator.calculate_end_orientation(
                 new_entry, "blue"
             )
         )
         new_entry["red_attributes"]["end_ori"] = (
-            self.circular_auto_builder.json_manager.ori_calculator.calculate_end_orientation(
+            self.ori_calculator.calculate_end_orientation(
                 new_entry, "red"
             )
         )
@@ -0,0 +1,479 @@
+from copy import deepcopy
+import random
+from typing import TYPE_CHECKING, Optional
+from Enums.letters import Letter, LetterType
+from data.constants import (
+    ANTI,
+    BLUE,
+    BOX,
+    DIAMOND,
+    END_ORI,
+    END_POS,
+    FLOAT,
+    IN,
+    MOTION_TYPE,
+    PRO,
+    PROP_ROT_DIR,
+    RED,
+    DASH,
+    START_ORI,
+    STATIC,
+    NO_ROT,
+    CLOCKWISE,
+    COUNTER_CLOCKWISE,
+    TURNS,
+)
+from data.position_maps import (
+    half_position_map,
+    quarter_position_map_cw,
+    quarter_position_map_ccw,
+)
+from data.quartered_permutations import quartered_permutations
+from data.halved_permutations import halved_permutations
+from main_window.main_widget.json_manager.json_ori_calculator import JsonOriCalculator
+from main_window.main_widget.sequence_level_evaluator import SequenceLevelEvaluator
+from utilities.word_simplifier import WordSimplifier
+from .circular.permutation_executors.mirrored_permutation_executor import (
+    MirroredPermutationExecutor,
+)
+from .circular.permutation_executors.rotated_permutation_executor import (
+    RotatedPermutationExecuter,
+)
+from .turn_intensity_manager import TurnIntensityManager
+
+if TYPE_CHECKING:
+    from main_window.main_widget.pictograph_dataset import PictographDataset
+
+
+START_POSITION_KEYS = {
+    DIAMOND: ["alpha1_alpha1", "beta5_beta5", "gamma11_gamma11"],
+    BOX: ["alpha2_alpha2", "beta4_beta4", "gamma12_gamma12"],
+}
+
+
+class SequenceGenerator:
+    """
+    Builds sequences as plain dicts, without touching any widget or file.
+
+    The auto builders use it to pick each new beat. The headless CLI
+    (generate_sequences.py) uses it to build whole sequences. Randomness
+    comes from the `random` module, so seeding it makes the output repeatable.
+    """
+
+    def __init__(
+        self,
+        pictograph_dataset: "PictographDataset",
+        ori_calculator: JsonOriCalculator = None,
+    ) -> None:
+        self.pictograph_dataset = pictograph_dataset
+        self.ori_calculator = ori_calculator or JsonOriCalculator()
+        self.rotated_executor = RotatedPermutationExecuter(self.ori_calculator)
+        self.mirrored_executor = MirroredPermutationExecutor(self.ori_calculator, False)
+        self.sequence_level_evaluator = SequenceLevelEvaluator()
+
+    ### WHOLE SEQUENCES ###
+
+    def generate_freeform_sequence(
+        self,
+        length: int,
+        level: int,
+        turn_intensity: float,
+        is_continuous_rot_dir: bool,
+        letter_types: Optional[list[LetterType]] = None,
+        grid_mode: str = DIAMOND,
+    ) -> list[dict]:
+        sequence = self.create_empty_sequence(grid_mode)
+        blue_rot_dir, red_rot_dir = self.choose_rot_dirs(is_continuous_rot_dir)
+        turn_manager = TurnIntensityManager(length, level, turn_intensity)
+        turns_blue, turns_red = turn_manager.allocate_turns_for_blue_and_red()
+
+        for i in range(length):
+            sequence.append(
+                self.generate_freeform_beat(
+                    sequence,
+                    level,
+                    turns_blue[i],
+                    turns_red[i],
+                    is_continuous_rot_dir,
+                    blue_rot_dir,
+                    red_rot_dir,
+                    letter_types,
+                )
+            )
+        self.update_sequence_header(sequence)
+        return sequence
+
+    def generate_circular_sequence(
+        self,
+        length: int,
+        level: int,
+        turn_intensity: float,
+        rotation_type: str,
+        permutation_type: str,
+        is_continuous_rot_dir: bool,
+        grid_mode: str = DIAMOND,
+    ) -> list[dict]:
+        sequence = self.create_empty_sequence(grid_mode)
+        blue_rot_dir, red_rot_dir = self.choose_rot_dirs(is_continuous_rot_dir)
+        word_length = self.get_word_length(length, rotation_type, permutation_type)
+        turn_manager = TurnIntensityManager(word_length, level, turn_intensity)
+        turns_blue, turns_red = turn_manager.allocate_turns_for_blue_and_red()
+
+        for i in range(word_length):
+            sequence.append(
+                self.generate_circular_beat(
+                    sequence,
+                    level,
+                    turns_blue[i],
+                    turns_red[i],
+                    i == word_length - 1,
+                    rotation_type,
+                    permutation_type,
+                    is_continuous_rot_dir,
+                    blue_rot_dir,
+                    red_rot_dir,
+                )
+            )
+        self.apply_permutations(sequence, permutation_type, rotation_type)
+        self.update_sequence_header(sequence)
+        return sequence
+
+    def create_empty_sequence(self, grid_mode: str) -> list[dict]:
+        """A header plus a random start position in the given grid mode."""
+        position_key = random.choice(START_POSITION_KEYS[grid_mode])
+        return [
+            {"word": "", "level": 0, "grid_mode": grid_mode, "is_circular": False},
+            self.create_start_position_entry(position_key),
+        ]
+
+    def create_start_position_entry(self, position_key: str) -> dict:
+        start_pos, end_pos = position_key.split("_")
+        pictograph_dict = deepcopy(
+            self.pictograph_dataset.get_by_start_and_end_pos(start_pos, end_pos)[0]
+        )
+        self.set_start_pos_to_in_orientation(pictograph_dict)
+        start_position_entry = {
+            "beat": 0,
+            "sequence_start_position": end_pos.rstrip("0123456789"),
+            "letter": Letter(pictograph_dict["letter"]).name,
+            END_POS: end_pos,
+        }
+        for color in [BLUE, RED]:
+            attributes = pictograph_dict[f"{color}_attributes"]
+            start_position_entry[f"{color}_attributes"] = {
+                "start_loc": attributes["start_loc"],
+                "end_loc": attributes["end_loc"],
+                START_ORI: attributes[START_ORI],
+                END_ORI: attributes[END_ORI],
+                PROP_ROT_DIR: NO_ROT,
+                TURNS: 0,
+                MOTION_TYPE: attributes[MOTION_TYPE],
+            }
+        return start_position_entry
+
+    def update_sequence_header(self, sequence: list[dict]) -> None:
+        word = "".join(entry["letter"] for entry in sequence[2:])
+        sequence[0]["word"] = WordSimplifier.simplify_repeated_word(word)
+        sequence[0]["level"] = (
+            self.sequence_level_evaluator.get_sequence_difficulty_level(sequence)
+        )
+        sequence[0]["is_circular"] = sequence[1][END_POS] == sequence[-1][END_POS]
+
+    @staticmethod
+    def choose_rot_dirs(is_continuous_rot_dir: bool) -> tuple[str, str]:
+        if is_continuous_rot_dir:
+            blue_rot_dir = random.choice([CLOCKWISE, COUNTER_CLOCKWISE])
+            red_rot_dir = random.choice([CLOCKWISE, COUNTER_CLOCKWISE])
+            return blue_rot_dir, red_rot_dir
+        return None, None
+
+    @staticmethod
+    def get_word_length(length: int, rotation_type: str, permutation_type: str) -> int:
+        """The number of beats to generate before the permutation fills in the rest."""
+        if permutation_type == "rotated" and rotation_type == "quartered":
+            return length // 4
+        return length // 2
+
+    ### SINGLE BEATS ###
+
+    def generate_freeform_beat(
+        self,
+        sequence: list[dict],
+        level: int,
+        turn_blue: float,
+        turn_red: float,
+        is_continuous_rot_dir: bool,
+        blue_rot_dir: str,
+        red_rot_dir: str,
+        letter_types: Optional[list[LetterType]] = None,
+    ) -> dict:
+        options = self.get_next_options(sequence)
+        if letter_types is not None:
+            options = self.filter_options_by_letter_type(options, letter_types)
+        if is_continuous_rot_dir:
+            options = self.filter_options_by_rotation(
+                options, blue_rot_dir, red_rot_dir
+            )
+
+        next_beat = self.copy_pictograph_dict(random.choice(options))
+        return self.finish_beat(
+            next_beat,
+            sequence,
+            level,
+            turn_blue,
+            turn_red,
+            is_continuous_rot_dir,
+            blue_rot_dir,
+            red_rot_dir,
+        )
+
+    def generate_circular_beat(
+        self,
+        sequence: list[dict],
+        level: int,
+        turn_blue: float,
+        turn_red: float,
+        is_last_in_word: bool,
+        rotation_type: str,
+        permutation_type: str,
+        is_continuous_rot_dir: bool,
+        blue_rot_dir: str,
+        red_rot_dir: str,
+    ) -> dict:
+        options = self.get_next_options(sequence)
+        if is_continuous_rot_dir:
+            options = self.filter_options_by_rotation(
+                options, blue_rot_dir, red_rot_dir
+            )
+
+        if is_last_in_word:
+            if permutation_type == "rotated":
+                expected_end_pos = self.determine_rotated_end_pos(
+                    sequence, rotation_type
+                )
+            else:
+                expected_end_pos = sequence[1][END_POS]
+            next_beat = self.select_pictograph_with_end_pos(options, expected_end_pos)
+        else:
+            next_beat = random.choice(options)
+        next_beat = self.copy_pictograph_dict(next_beat)
+
+        return self.finish_beat(
+            next_beat,
+            sequence,
+            level,
+            turn_blue,
+            turn_red,
+            is_continuous_rot_dir,
+            blue_rot_dir,
+            red_rot_dir,
+        )
+
+    def finish_beat(
+        self,
+        next_beat: dict,
+        sequence: list[dict],
+        level: int,
+        turn_blue: float,
+        turn_red: float,
+        is_continuous_rot_dir: bool,
+        blue_rot_dir: str,
+        red_rot_dir: str,
+    ) -> dict:
+        """Apply turns, orientations and rotation directions to a chosen option."""
+        if level == 2 or level == 3:
+            next_beat = self.set_turns(next_beat, turn_blue, turn_red)
+
+        self.update_start_oris(next_beat, sequence[-1])
+        self.update_end_oris(next_beat)
+        self.update_dash_static_prop_rot_dirs(
+            next_beat,
+            is_continuous_rot_dir,
+            blue_rot_dir,
+            red_rot_dir,
+        )
+        next_beat["beat"] = len(sequence) - 1
+        return next_beat
+
+    ### OPTIONS ###
+
+    def get_next_options(self, sequence: list[dict]) -> list[dict]:
+        """
+        Every pictograph that starts where the sequence ends.
+
+        The dicts are shared with the dataset; copy the chosen one before editing it.
+        """
+        last_pictograph_dict = (
+            sequence[-1]
+            if sequence[-1].get("is_placeholder", "") != True
+            else sequence[-2]
+        )
+        start_pos = last_pictograph_dict[END_POS]
+        if not start_pos:
+            return []
+        return self.pictograph_dataset.get_by_start_pos(start_pos)
+
+    @staticmethod
+    def copy_pictograph_dict(pictograph_dict: dict) -> dict:
+        """Copy a dataset entry; only the attribute dicts are nested."""
+        pictograph_dict = dict(pictograph_dict)
+        for color in [BLUE, RED]:
+            key = f"{color}_attributes"
+            pictograph_dict[key] = dict(pictograph_dict[key])
+        return pictograph_dict
+
+    @staticmethod
+    def filter_options_by_letter_type(
+        options: list[dict], letter_types: list[LetterType]
+    ) -> list[dict]:
+        selected_letters = set()
+        for letter_type in letter_types:
+            selected_letters.update(letter_type.letters)
+
+        return [option for option in options if option["letter"] in selected_letters]
+
+    @staticmethod
+    def filter_options_by_rotation(
+        options: list[dict], blue_rot_dir, red_rot_dir
+    ) -> list[dict]:
+        """Filter options to match the rotation direction for both hands."""
+        filtered_options = [
+            option
+            for option in options
+            if option["blue_attributes"][PROP_ROT_DIR] in [blue_rot_dir, NO_ROT]
+            and option["red_attributes"][PROP_ROT_DIR] in [red_rot_dir, NO_ROT]
+        ]
+        return filtered_options if filtered_options else options
+
+    @staticmethod
+    def select_pictograph_with_end_pos(
+        options: list[dict], expected_end_pos: str
+    ) -> dict:
+        """Select a pictograph from options that has the desired end position."""
+        valid_options = [
+            option for option in options if option[END_POS] == expected_end_pos
+        ]
+        if not valid_options:
+            raise ValueError(
+                f"No valid pictograph found with end position {expected_end_pos}."
+            )
+        return random.choice(valid_options)
+
+    ### PERMUTATIONS ###
+
+    @staticmethod
+    def determine_rotated_end_pos(sequence: list[dict], rotation_type: str) -> str:
+        """Determine the expected end position based on rotation type and current sequence."""
+        start_pos = sequence[1][END_POS]
+
+        if rotation_type == "quartered":
+            if random.choice([True, False]):
+                return quarter_position_map_cw[start_pos]
+            else:
+                return quarter_position_map_ccw[start_pos]
+        elif rotation_type == "halved":
+            return half_position_map[start_pos]
+        else:
+            print("Invalid rotation type - expected 'quartered' or 'halved'")
+            return None
+
+    @staticmethod
+    def can_perform_rotated_permutation(
+        sequence: list[dict], rotation_type: str
+    ) -> bool:
+        start_pos = sequence[1][END_POS]
+        end_pos = sequence[-1][END_POS]
+        if rotation_type == "quartered":
+            return (start_pos, end_pos) in quartered_permutations
+        elif rotation_type == "halved":
+            return (start_pos, end_pos) in halved_permutations
+        return False
+
+    def apply_permutations(
+        self, sequence: list[dict], permutation_type: str, rotation_type: str
+    ) -> list[dict]:
+        """Complete a circular sequence in place and return the added beats."""
+        if permutation_type == "rotated":
+            if self.can_perform_rotated_permutation(sequence, rotation_type):
+                return self.rotated_executor.create_permutations(sequence)
+        elif permutation_type == "mirrored":
+            if self.mirrored_executor.can_perform_mirrored_permutation(sequence):
+                return self.mirrored_executor.create_permutations(sequence, "vertical")
+        return []
+
+    ### ATTRIBUTES ###
+
+    @staticmethod
+    def set_start_pos_to_in_orientation(pictograph_dict: dict) -> None:
+        """Set the start position pictograph to the in orientation."""
+        pictograph_dict["blue_attributes"][START_ORI] = IN
+        pictograph_dict["red_attributes"][START_ORI] = IN
+        pictograph_dict["blue_attributes"][END_ORI] = IN
+        pictograph_dict["red_attributes"][END_ORI] = IN
+
+    @staticmethod
+    def update_start_oris(next_pictograph_dict: dict, last_pictograph_dict: dict):
+        next_pictograph_dict["blue_attributes"][START_ORI] = last_pictograph_dict[
+            "blue_attributes"
+        ][END_ORI]
+        next_pictograph_dict["red_attributes"][START_ORI] = last_pictograph_dict[
+            "red_attributes"
+        ][END_ORI]
+
+    def update_end_oris(self, next_pictograph_dict: dict):
+        next_pictograph_dict["blue_attributes"][END_ORI] = (
+            self.ori_calculator.calculate_end_orientation(next_pictograph_dict, BLUE)
+        )
+        next_pictograph_dict["red_attributes"][END_ORI] = (
+            self.ori_calculator.calculate_end_orientation(next_pictograph_dict, RED)
+        )
+
+    def update_dash_static_prop_rot_dirs(
+        self,
+        next_beat: dict,
+        is_continuous_rot_dir: bool,
+        blue_rot_dir: str,
+        red_rot_dir: str,
+    ):
+        def update_prop_rot_dir(color, rot_dir):
+            attributes = next_beat[f"{color}_attributes"]
+            if attributes[MOTION_TYPE] in [DASH, STATIC]:
+                if is_continuous_rot_dir:
+                    if attributes[TURNS] > 0:
+                        attributes[PROP_ROT_DIR] = rot_dir
+                    else:
+                        attributes[PROP_ROT_DIR] = NO_ROT
+                else:
+                    if attributes[TURNS] > 0:
+                        self.set_random_prop_rot_dir(next_beat, color)
+                    else:
+                        attributes[PROP_ROT_DIR] = NO_ROT
+
+        update_prop_rot_dir(BLUE, blue_rot_dir)
+        update_prop_rot_dir(RED, red_rot_dir)
+
+    @staticmethod
+    def set_random_prop_rot_dir(next_pictograph_dict: dict, color: str) -> None:
+        """Set a random prop rotation direction for the given color."""
+        next_pictograph_dict[f"{color}_attributes"][PROP_ROT_DIR] = random.choice(
+            [CLOCKWISE, COUNTER_CLOCKWISE]
+        )
+
+    @staticmethod
+    def set_turns(next_beat: dict, turn_blue: float, turn_red: float) -> dict:
+        """Set the turns for blue and red attributes, adjusting motion types if necessary."""
+        for color, turns in [(BLUE, turn_blue), (RED, turn_red)]:
+            attributes = next_beat[f"{color}_attributes"]
+            if turns == "fl":
+                if attributes[MOTION_TYPE] in [PRO, ANTI]:
+                    attributes[TURNS] = "fl"
+                    attributes["prefloat_motion_type"] = attributes[MOTION_TYPE]
+                    attributes["prefloat_prop_rot_dir"] = attributes[PROP_ROT_DIR]
+                    attributes[MOTION_TYPE] = FLOAT
+                    attributes[PROP_ROT_DIR] = NO_ROT
+                else:
+                    attributes[TURNS] = 0
+            else:
+                attributes[TURNS] = turns
+
+        return next_beat
@@ -2,7 +2,7 @@ from copy import deepcopy
 from functools import partial
 from PyQt6.QtCore import QObject, pyqtSignal
 from Enums.letters import Letter
-from data.constants import BOX, DIAMOND, END_POS, START_POS
+from data.constants import BOX, DIAMOND
 from ....sequence_widget.beat_frame.start_pos_beat import StartPositionBeat
 from base_widgets.base_pictograph.base_pictograph import BasePictograph
 
@@ -33,9 +33,20 @@ class StartPosManager(QObject):
         )
 
     def clear_start_positions(self) -> None:
-        """Clears the start positions."""
-        for start_position_pictograph in self.start_options.values():
-            start_position_pictograph.view.hide()
+        """Returns the start position pictographs to the pictograph pool."""
+        for letter, start_position_pictograph in self.start_options.items():
+            self.start_pos_frame.pictographs_layout.removeWidget(
+                start_position_pictograph.view
+            )
+            self.start_pos_frame.start_positions.pop(letter, None)
+            self.start_pos_picker.start_pos_cache.pop(letter, None)
+            key = (
+                f"{letter}_{start_position_pictograph.start_pos}_"
+                f"{start_position_pictograph.end_pos}"
+            )
+            self.main_widget.pictograph_cache[letter].pop(key, None)
+            self.main_widget.pictograph_pool.release(start_position_pictograph)
+        self.start_options.clear()
 
     def setup_start_positions(self) -> None:
         """Shows options for the starting position."""
@@ -50,32 +61,24 @@ class StartPosManager(QObject):
     def _add_start_position_option_to_start_pos_frame(self, position_key: str) -> None:
         """Adds an option for the specified start position."""
         start_pos, end_pos = position_key.split("_")
-        for (
-            letter,
-            pictograph_dicts,
-        ) in self.manual_builder.main_widget.pictograph_dicts.items():
-            for pictograph_dict in pictograph_dicts:
-                if (
-                    pictograph_dict[START_POS] == start_pos
-                    and pictograph_dict[END_POS] == end_pos
-                ):
-                    start_position_pictograph = BasePictograph(
-                        self.start_pos_picker.main_widget,
-                    )
-                    self.start_options[letter] = start_position_pictograph
-                    start_position_pictograph.letter = letter
-                    start_position_pictograph.start_pos = start_pos
-                    start_position_pictograph.end_pos = end_pos
-                    self.start_pos_frame._add_start_pos_to_layout(
-                        start_position_pictograph
-                    )
-                    start_position_pictograph.updater.update_pictograph(pictograph_dict)
-
-                    start_position_pictograph.view.mousePressEvent = partial(
-                        self.add_start_pos_to_sequence,
-                        start_position_pictograph,
-                    )
-                    start_position_pictograph.start_to_end_pos_glyph.hide()
+        dataset = self.manual_builder.main_widget.pictograph_dataset
+        for pictograph_dict in dataset.get_by_start_and_end_pos(start_pos, end_pos):
+            letter = dataset.get_letter(pictograph_dict)
+            start_position_pictograph = self.main_widget.pictograph_pool.acquire()
+            self.start_options[letter] = start_position_pictograph
+            start_position_pictograph.letter = letter
+            start_position_pictograph.start_pos = start_pos
+            start_position_pictograph.end_pos = end_pos
+            self.start_pos_frame._add_start_pos_to_layout(start_position_pictograph)
+            start_position_pictograph.updater.update_pictograph(pictograph_dict)
+            start_position_pictograph.view.show()
+
+            start_position_pictograph.view.mousePressEvent = partial(
+                self.add_start_pos_to_sequence,
+                start_position_pictograph,
+            )
+            start_position_pictograph.start_to_end_pos_glyph.hide()
+            start_position_pictograph.image_renderer.enable_raster()
 
     def add_start_pos_to_sequence(
         self, clicked_start_option: BasePictograph, event: QWidget = None
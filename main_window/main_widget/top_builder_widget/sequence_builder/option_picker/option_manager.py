@@ -1,5 +1,5 @@
 from PyQt6.QtCore import QObject, pyqtSignal
-from data.constants import END_POS, START_POS
+from data.constants import END_POS
 from typing import TYPE_CHECKING
 
 from base_widgets.base_pictograph.base_pictograph import BasePictograph
@@ -31,9 +31,8 @@ class OptionGetter(QObject):
         start_pos = last_pictograph_dict[END_POS]
 
         if start_pos:
-            for dict_list in self.main_widget.pictograph_dicts.values():
-                for dict in dict_list:
-                    if dict[START_POS] == start_pos:
-                        next_options.append(dict)
+            next_options = list(
+                self.main_widget.pictograph_dataset.get_by_start_pos(start_pos)
+            )
 
         return next_options
@@ -45,7 +45,7 @@ class OptionPicker(QWidget):
         if self.disabled:
             return
         if not sequence:
-            sequence = self.json_manager.loader_saver.load_current_sequence_json()
+            sequence = self.json_manager.document.sequence
 
         if len(sequence) > 1:
             next_options: dict = self.option_getter.get_next_options(sequence)
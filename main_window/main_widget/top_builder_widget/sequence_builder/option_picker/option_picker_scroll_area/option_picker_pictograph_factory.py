@@ -66,4 +66,5 @@ class OptionPickerPictographFactory:
             self.scroll_area.main_widget,
             self.scroll_area,
         )
+        pictograph.image_renderer.enable_raster()
         return pictograph
@@ -72,7 +72,7 @@ class OptionPickerScrollArea(BasePickerScrollArea):
             QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
         valid_next_options = []
 
-        sequence = self.json_manager.loader_saver.load_current_sequence_json()
+        sequence = self.json_manager.document.sequence
         for pictograph_dict in next_options:
             valid_next_options.append(pictograph_dict)
 
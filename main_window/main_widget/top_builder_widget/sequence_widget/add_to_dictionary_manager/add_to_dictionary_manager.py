@@ -69,9 +69,10 @@ class AddToDictionaryManager:
         """Save the new variation in the root directory for the word."""
         base_path = os.path.join(self.dictionary_dir, base_word)
 
-        self.thumbnail_generator.generate_and_save_thumbnail(
+        image_path = self.thumbnail_generator.generate_and_save_thumbnail(
             sequence, variation_number, base_path
         )
+        self.sequence_widget.main_widget.metadata_extractor.invalidate_file(image_path)
 
         self.display_message(
             f"Saved new variation for '{base_word}' as version {variation_number}."
@@ -30,7 +30,7 @@ class BeatDeletionManager:
             return
 
         self._delete_beat_based_on_type(selected_beat)
-        self._post_deletion_updates()
+        self._post_deletion_updates(selected_beat)
 
     def _initialize_manual_builder(self) -> None:
         """Initialize the manual builder if not already initialized."""
@@ -62,9 +62,13 @@ class BeatDeletionManager:
         else:
             self._delete_non_first_beat(selected_beat)
 
-    def _post_deletion_updates(self) -> None:
+    def _post_deletion_updates(self, selected_beat: BeatView) -> None:
         """Perform updates after deletion."""
-        self.json_manager.updater.clear_and_repopulate_the_current_sequence()
+        if selected_beat.__class__ != StartPositionBeatView:
+            # The start position path already cleared the whole sequence
+            self.json_manager.updater.delete_beats_from(
+                self.beats.index(selected_beat)
+            )
         if self.settings_manager.global_settings.get_grow_sequence():
             self.beat_frame.layout_manager.adjust_layout_to_sequence_length()
         self.beat_frame.sequence_widget.update_current_word_from_beats()
@@ -0,0 +1,103 @@
+from copy import deepcopy
+from typing import TYPE_CHECKING, Optional
+
+from main_window.main_widget.json_manager.sequence_history import HistoryChange
+from .beat import Beat
+
+if TYPE_CHECKING:
+    from .sequence_widget_beat_frame import SequenceWidgetBeatFrame
+
+
+class BeatFrameHistoryHandler:
+    """
+    Applies undo/redo steps to the beat frame.
+
+    Only the beats whose entries differ between the two snapshots are
+    updated. Changes to the start position or to multi-count beats fall back
+    to repopulating the whole beat frame.
+    """
+
+    def __init__(self, beat_frame: "SequenceWidgetBeatFrame") -> None:
+        self.beat_frame = beat_frame
+        self.main_widget = beat_frame.main_widget
+        self.json_manager = beat_frame.json_manager
+        self.history = self.json_manager.history
+
+    def undo(self) -> None:
+        self._apply(self.history.undo(), "Nothing to undo.")
+
+    def redo(self) -> None:
+        self._apply(self.history.redo(), "Nothing to redo.")
+
+    def _apply(self, change: Optional[HistoryChange], empty_message: str) -> None:
+        sequence_widget = self.beat_frame.sequence_widget
+        if change is None:
+            sequence_widget.indicator_label.show_message(empty_message)
+            return
+
+        sequence = self.json_manager.document.sequence
+        with self.history.pause():
+            if self._needs_full_repopulate(sequence, change):
+                self._repopulate(sequence)
+            else:
+                self._update_changed_beats(sequence, change)
+        self.history.sync()
+
+    def _needs_full_repopulate(self, sequence: list[dict], change: HistoryChange) -> bool:
+        if 1 in change.changed_indices or len(sequence) < 2:
+            return True
+        if len(sequence) == 2 or change.previous_length <= 2:
+            return True  # the start position picker and option picker swap places
+        return any(entry.get("is_placeholder") for entry in sequence[2:]) or any(
+            beat_view.is_filled and beat_view.beat.duration > 1
+            for beat_view in self.beat_frame.beats
+        )
+
+    def _repopulate(self, sequence: list[dict]) -> None:
+        if len(sequence) < 2:
+            self.beat_frame.sequence_widget.sequence_clearer.clear_sequence(
+                show_indicator=False
+            )
+            return
+        self.beat_frame.populator.populate_beat_frame_from_json(
+            deepcopy(sequence), is_dictionary_entry=True
+        )
+
+    def _update_changed_beats(
+        self, sequence: list[dict], change: HistoryChange
+    ) -> None:
+        beats = self.beat_frame.beats
+        for index in change.changed_indices:
+            if index < 2:
+                continue
+            beat_view = beats[index - 2]
+            pictograph_dict = deepcopy(sequence[index])
+            if beat_view.is_filled and beat_view.beat:
+                beat_view.beat.updater.update_pictograph(pictograph_dict)
+            else:
+                beat = Beat(self.beat_frame)
+                beat.updater.update_pictograph(pictograph_dict)
+                beat_view.set_beat(beat, pictograph_dict.get("beat", index - 1))
+
+        for beat_view in beats[len(sequence) - 2 :]:
+            if beat_view.is_filled:
+                self.beat_frame.beat_deletion_manager.delete_beat(beat_view)
+
+        self._refresh_sequence_widgets()
+
+    def _refresh_sequence_widgets(self) -> None:
+        sequence_widget = self.beat_frame.sequence_widget
+        manual_builder = (
+            self.main_widget.top_builder_widget.sequence_builder.manual_builder
+        )
+        if self.beat_frame.settings_manager.global_settings.get_grow_sequence():
+            self.beat_frame.layout_manager.adjust_layout_to_sequence_length()
+        sequence_widget.update_current_word_from_beats()
+        sequence_widget.update_difficulty_label()
+
+        last_beat_view = self.beat_frame.get.last_filled_beat()
+        manual_builder.last_beat = last_beat_view.beat
+        selection_overlay = self.beat_frame.selection_overlay
+        selection_overlay.deselect_beat()
+        selection_overlay.select_beat(last_beat_view)
+        manual_builder.option_picker.update_option_picker()
@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QKeyEvent
+from PyQt6.QtGui import QKeyEvent, QKeySequence
 from PyQt6.QtWidgets import QWidget  # Import QWidget
 
 if TYPE_CHECKING:
@@ -14,9 +14,14 @@ class BeatFrameKeyEventHandler(QWidget):
         super().__init__(beat_frame)
         self.beat_frame = beat_frame
         self.beat_deletion_manager = beat_frame.beat_deletion_manager
+        self.history_handler = beat_frame.history_handler
 
     def keyPressEvent(self, event: "QKeyEvent") -> None: 
         if event.key() == Qt.Key.Key_Delete or event.key() == Qt.Key.Key_Backspace:
             self.beat_deletion_manager.delete_selected_beat()
+        elif event.matches(QKeySequence.StandardKey.Undo):
+            self.history_handler.undo()
+        elif event.matches(QKeySequence.StandardKey.Redo):
+            self.history_handler.redo()
         else:
             super().keyPressEvent(event)  
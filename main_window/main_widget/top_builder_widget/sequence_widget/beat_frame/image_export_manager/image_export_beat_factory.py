@@ -1,9 +1,9 @@
 from typing import TYPE_CHECKING, Union
 
 from main_window.main_widget.top_builder_widget.sequence_widget.beat_frame.beat import (
-    Beat,
     BeatView,
 )
+from .image_export_beat_pool import ImageExportBeatPool
 
 
 if TYPE_CHECKING:
@@ -24,45 +24,53 @@ class ImageExportBeatFactory:
     ):
         self.export_manager = export_manager
         self.beat_frame_class = beat_frame_class
+        self.beat_pool: ImageExportBeatPool = None
 
     def process_sequence_to_beats(self, sequence: list[dict]) -> list[BeatView]:
-        if self.beat_frame_class.__name__ == "SequenceWidgetBeatFrame":
-            temp_beat_frame = self.beat_frame_class(
-                self.export_manager.main_widget.top_builder_widget.sequence_widget
-            )
-        elif self.beat_frame_class.__name__ == "TempBeatFrame":
-            temp_beat_frame = self.beat_frame_class(
-                self.export_manager.main_widget.dictionary_widget
-            )
+        """
+        Return populated beat views for the sequence.
+
+        The views come from a pool shared by every export of this manager and
+        are repopulated on the next call. A grid mode change replaces the pool.
+        """
+        beats = [
+            beat_data
+            for beat_data in sequence[2:]  # Skip the metadata and start position
+            if not beat_data.get("is_placeholder")
+        ]
+        beat_views = self._get_beat_pool().acquire(len(beats))
 
         filled_beats = []
         current_beat_number = 1  # Start beat numbering from 1
 
-        for beat_data in sequence[2:]:  # Skip the metadata (first entry)
-            if beat_data.get("is_placeholder"):
-                continue  # Skip placeholder beats
-
-            # Determine beat duration
-            duration = beat_data.get("duration", 1)
-
-            # Create the beat view and assign it the correct beat range
-            beat_view = self.create_beat_view_from_data(
-                beat_data, current_beat_number, temp_beat_frame
+        for beat_view, beat_data in zip(beat_views, beats):
+            filled_beats.append(
+                self.beat_pool.populate(beat_view, beat_data, current_beat_number)
             )
-
-            filled_beats.append(beat_view)
-
             # Increment beat number by the duration of the current beat
-            current_beat_number += duration
+            current_beat_number += beat_data.get("duration", 1)
 
         return filled_beats
 
-    def create_beat_view_from_data(self, beat_data, number, temp_beat_frame):
-        new_beat_view = BeatView(temp_beat_frame)
-        beat = Beat(temp_beat_frame)
-        beat.pictograph_dict = beat_data
-        beat.updater.update_pictograph(beat_data)
+    def _get_beat_pool(self) -> ImageExportBeatPool:
+        grid_mode = (
+            self.export_manager.main_widget.settings_manager.global_settings.get_grid_mode()
+        )
+        if self.beat_pool is not None and self.beat_pool.grid_mode != grid_mode:
+            self.beat_pool.clear()
+            self.beat_pool = None
+        if self.beat_pool is None:
+            self.beat_pool = ImageExportBeatPool(
+                self._create_export_beat_frame(), grid_mode
+            )
+        return self.beat_pool
 
-        # Set the beat with the actual number, not the display text
-        new_beat_view.set_beat(beat, number)
-        return new_beat_view
+    def _create_export_beat_frame(self):
+        if self.beat_frame_class.__name__ == "SequenceWidgetBeatFrame":
+            return self.beat_frame_class(
+                self.export_manager.main_widget.top_builder_widget.sequence_widget
+            )
+        elif self.beat_frame_class.__name__ == "TempBeatFrame":
+            return self.beat_frame_class(
+                self.export_manager.main_widget.dictionary_widget
+            )
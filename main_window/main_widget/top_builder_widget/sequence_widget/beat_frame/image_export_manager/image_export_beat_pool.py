@@ -0,0 +1,77 @@
+from typing import TYPE_CHECKING, Union
+
+from main_window.main_widget.top_builder_widget.sequence_widget.beat_frame.beat import (
+    Beat,
+    BeatView,
+)
+
+if TYPE_CHECKING:
+    from main_window.main_widget.top_builder_widget.sequence_widget.beat_frame.sequence_widget_beat_frame import (
+        SequenceWidgetBeatFrame,
+    )
+    from main_window.main_widget.dictionary_widget.temp_beat_frame.temp_beat_frame import (
+        TempBeatFrame,
+    )
+
+
+class ImageExportBeatPool:
+    """
+    Reusable beat views for rendering exported images.
+
+    Every pooled view owns one Beat pictograph that is repopulated for each
+    export instead of being rebuilt. The pool grows to the longest sequence
+    exported so far and never shrinks, so views returned by acquire() are
+    only valid until the next call. Its beats keep the grid of grid_mode,
+    the mode the pool was built in.
+    """
+
+    def __init__(
+        self,
+        beat_frame: Union["SequenceWidgetBeatFrame", "TempBeatFrame"],
+        grid_mode: str,
+    ) -> None:
+        self.beat_frame = beat_frame
+        self.grid_mode = grid_mode
+        self.beat_views: list[BeatView] = []
+
+    def acquire(self, count: int) -> list[BeatView]:
+        while len(self.beat_views) < count:
+            self.beat_views.append(self._create_beat_view())
+        return self.beat_views[:count]
+
+    def populate(self, beat_view: BeatView, beat_data: dict, number: int) -> BeatView:
+        """Reset the view's pictograph and fill it with the beat's data."""
+        beat = beat_view.beat
+        self._reset(beat_view, beat)
+        beat.pictograph_dict = beat_data
+        beat.updater.update_pictograph(beat_data)
+        beat_view.set_beat(beat, number)
+        return beat_view
+
+    def clear(self) -> None:
+        """Delete the pooled views and their beat frame."""
+        for beat_view in self.beat_views:
+            beat_view.beat.deleteLater()
+            beat_view.deleteLater()
+        self.beat_views.clear()
+        self.beat_frame.deleteLater()
+
+    @property
+    def size(self) -> int:
+        return len(self.beat_views)
+
+    def _create_beat_view(self) -> BeatView:
+        beat_view = BeatView(self.beat_frame)
+        beat_view.beat = Beat(self.beat_frame)
+        return beat_view
+
+    @staticmethod
+    def _reset(beat_view: BeatView, beat: Beat) -> None:
+        if beat_view.beat_number_item and beat_view.beat_number_item.scene() is beat:
+            beat.removeItem(beat_view.beat_number_item)
+        beat_view.beat_number_item = None
+        beat_view.is_selected = False
+        beat.clearSelection()
+        beat.duration = 1
+        beat.is_placeholder = False
+        beat.parent_beat = None
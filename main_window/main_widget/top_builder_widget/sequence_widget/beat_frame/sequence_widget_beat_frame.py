@@ -3,6 +3,7 @@ from PyQt6.QtWidgets import QGridLayout
 from PyQt6.QtGui import QKeyEvent
 from .beat_adder import BeatAdder
 from .beat_duration_manager import BeatDurationManager
+from .beat_frame_history_handler import BeatFrameHistoryHandler
 from .beat_frame_key_event_handler import BeatFrameKeyEventHandler
 from .beat_frame_populator import BeatFramePopulator
 from .beat_frame_resizer import BeatFrameResizer
@@ -45,6 +46,7 @@ class SequenceWidgetBeatFrame(BaseBeatFrame):
         self.selection_overlay = BeatSelectionOverlay(self)
         self.layout_manager = BeatFrameLayoutManager(self)
         self.beat_deletion_manager = BeatDeletionManager(self)
+        self.history_handler = BeatFrameHistoryHandler(self)
         self.image_export_manager = ImageExportManager(self, SequenceWidgetBeatFrame)
         self.populator = BeatFramePopulator(self)
         self.beat_adder = BeatAdder(self)
@@ -8,7 +8,7 @@ from ...sequence_builder.auto_builder.circular.permutation_executors.rotated_per
 )
 from data.quartered_permutations import quartered_permutations
 from data.halved_permutations import halved_permutations
-from PyQt6.QtWidgets import QMessageBox
+from PyQt6.QtWidgets import QApplication, QMessageBox
 
 if TYPE_CHECKING:
     from main_window.main_widget.top_builder_widget.sequence_widget.sequence_widget import (
@@ -23,8 +23,11 @@ class SequenceAutoCompleter:
         self.json_manager = self.beat_frame.json_manager
         self.main_widget = sequence_widget.main_widget
         self.validation_engine = self.main_widget.json_manager.validation_engine
-        self.rotated_permutation_executor = RotatedPermutationExecuter(self)
-        self.mirrored_permutation_executor = MirroredPermutationExecutor(self, False)
+        ori_calculator = self.main_widget.json_manager.ori_calculator
+        self.rotated_permutation_executor = RotatedPermutationExecuter(ori_calculator)
+        self.mirrored_permutation_executor = MirroredPermutationExecutor(
+            ori_calculator, False
+        )
 
     def auto_complete_sequence(self):
         sequence = self.json_manager.loader_saver.load_current_sequence_json()
@@ -47,15 +50,36 @@ class SequenceAutoCompleter:
         dialog = PermutationDialog(valid_permutations)
         if dialog.exec():
             option = dialog.get_options()
+            new_entries = []
             if option == "rotation":
-                executor = RotatedPermutationExecuter(self)
-                executor.create_permutations(sequence)
+                new_entries = self.rotated_permutation_executor.create_permutations(
+                    sequence
+                )
             elif option == "vertical_mirror":
-                executor = MirroredPermutationExecutor(self, False)
-                executor.create_permutations(sequence, "vertical")
+                new_entries = self.mirrored_permutation_executor.create_permutations(
+                    sequence, "vertical"
+                )
             elif option == "horizontal_mirror":
-                executor = MirroredPermutationExecutor(self, False)
-                executor.create_permutations(sequence, "horizontal")
+                new_entries = self.mirrored_permutation_executor.create_permutations(
+                    sequence, "horizontal"
+                )
+            self._add_entries_to_sequence_widget(
+                new_entries, validate=option != "rotation"
+            )
+
+    def _add_entries_to_sequence_widget(
+        self, new_entries: list[dict], validate: bool
+    ) -> None:
+        # Mirrored entries are validated as they are added, rotated ones are not
+        for entry in new_entries:
+            self.sequence_widget.create_new_beat_and_add_to_sequence(
+                entry, override_grow_sequence=True, update_word=False
+            )
+            if validate:
+                self.validation_engine.validate_last_pictograph()
+            QApplication.processEvents()
+        if new_entries:
+            self.sequence_widget.update_current_word_from_beats()
 
     def get_valid_permutations(self, sequence: list[dict]) -> dict[str, bool]:
         start_pos = sequence[1]["end_pos"]
@@ -8,6 +8,7 @@ from .menu_bar_widget.menu_bar_widget import MenuBarWidget
 from .settings_manager.settings_manager import SettingsManager
 from .main_widget.main_widget import MainWidget
 from profiler import Profiler
+from startup_profiler import StartupProfiler
 from main_window.main_window_geometry_manager import MainWindowGeometryManager
 
 if TYPE_CHECKING:
@@ -16,18 +17,29 @@ if TYPE_CHECKING:
 
 # In main_window.py
 class MainWindow(QMainWindow):
-    def __init__(self, profiler: Profiler, splash_screen: "SplashScreen") -> None:
+    def __init__(
+        self,
+        profiler: Profiler,
+        splash_screen: "SplashScreen",
+        startup_profiler: StartupProfiler = None,
+    ) -> None:
         super().__init__()
         self.profiler = profiler
+        if startup_profiler is None:
+            startup_profiler = StartupProfiler()
+            startup_profiler.splash_screen = splash_screen
+        self.startup_profiler = startup_profiler
         self.main_widget = None  # Initialize main_widget to None
-        self.settings_manager = SettingsManager(self)
-        self.geometry_manager = MainWindowGeometryManager(self)
+        with self.startup_profiler.phase("main_window", "Loading settings..."):
+            self.settings_manager = SettingsManager(self)
+            self.geometry_manager = MainWindowGeometryManager(self)
         self.main_widget = MainWidget(self, splash_screen)  # Set main_widget here
         self.setAttribute(Qt.WidgetAttribute.WA_AcceptTouchEvents, True)
         self.setCentralWidget(self.main_widget)
         self.setWindowTitle("The Kinetic Constructor")
-        self.menu_bar_widget = MenuBarWidget(self)
-        self.setMenuWidget(self.menu_bar_widget)
+        with self.startup_profiler.phase("menu_bar", "Setting up menu bar..."):
+            self.menu_bar_widget = MenuBarWidget(self)
+            self.setMenuWidget(self.menu_bar_widget)
 
     def exec(self, app: QApplication) -> int:
         self.profiler.enable()
@@ -37,6 +49,7 @@ class MainWindow(QMainWindow):
         return result
 
     def closeEvent(self, event):
-        self.settings_manager.save_settings()
+        self.main_widget.shutdown()
+        self.settings_manager.flush_settings()
         super().closeEvent(event)
         QApplication.instance().installEventFilter(self)
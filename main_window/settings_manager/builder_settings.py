@@ -1,3 +1,4 @@
+from copy import deepcopy
 from typing import TYPE_CHECKING
 from main_window.settings_manager.autobuilder_settings import AutoBuilderSettings
 
@@ -39,15 +40,13 @@ class BuilderSettings:
         # self.manual_builder_settings = ManualBuilderSettings(self.settings_manager)
 
     def _load_builder_settings(self):
-        return self.settings_manager.settings.get("builder", self.DEFAULT_SETTINGS)
+        return self.settings_manager.settings.setdefault(
+            "builder", deepcopy(self.DEFAULT_SETTINGS)
+        )
 
     def get_last_used_builder(self) -> str:
         return self.settings.get("last_used_builder", "manual")
 
     def set_last_used_builder(self, builder_type: str):
         """Save the last used builder ('manual' or 'auto')."""
-        self.settings["last_used_builder"] = builder_type
-        self._save_builder_settings()
-
-    def _save_builder_settings(self):
-        self.settings_manager.save_builder_settings(self.settings)
+        self.settings_manager.set_setting("builder", "last_used_builder", builder_type)
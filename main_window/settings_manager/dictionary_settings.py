@@ -1,3 +1,4 @@
+from copy import deepcopy
 from typing import TYPE_CHECKING
 
 
@@ -14,27 +15,24 @@ class DictionarySettings:
 
     def __init__(self, settings_manager: "SettingsManager") -> None:
         self.settings_manager = settings_manager
-        self.settings = self.settings_manager.settings.get(
-            "dictionary", self.DEFAULT_DICTIONARY_SETTINGS
+        self.settings = self.settings_manager.settings.setdefault(
+            "dictionary", deepcopy(self.DEFAULT_DICTIONARY_SETTINGS)
         )
 
     def get_sort_method(self) -> str:
         return self.settings.get("sort_method", "sequence_length")
 
     def set_sort_method(self, sort_method: str) -> None:
-        self.settings["sort_method"] = sort_method
-        self.settings_manager.save_dictionary_settings(self.settings)
+        self.settings_manager.set_setting("dictionary", "sort_method", sort_method)
 
     def get_current_filter(self) -> dict:
         return self.settings.get("current_filter", {})
 
     def set_current_filter(self, current_filter: dict) -> None:
-        self.settings["current_filter"] = current_filter
-        self.settings_manager.save_dictionary_settings(self.settings)
+        self.settings_manager.set_setting("dictionary", "current_filter", current_filter)
 
     def get_current_section(self) -> str:
         return self.settings.get("current_section", "starting_letter")
     
     def set_current_section(self, section: str) -> None:
-        self.settings["current_section"] = section
-        self.settings_manager.save_dictionary_settings(self.settings)
\ No newline at end of file
+        self.settings_manager.set_setting("dictionary", "current_section", section)
\ No newline at end of file
@@ -1,3 +1,4 @@
+from copy import deepcopy
 from typing import TYPE_CHECKING, Optional
 from Enums.PropTypes import PropType
 from main_window.menu_bar_widget.background_selector.background_managers.aurora.aurora_background_manager import (
@@ -41,8 +42,8 @@ class GlobalSettings:
 
     def __init__(self, settings_manager: "SettingsManager") -> None:
         self.settings_manager = settings_manager
-        self.settings: dict = self.settings_manager.settings.get(
-            "global", self.DEFAULT_GLOBAL_SETTINGS
+        self.settings: dict = self.settings_manager.settings.setdefault(
+            "global", deepcopy(self.DEFAULT_GLOBAL_SETTINGS)
         )
         self.prop_type_changer = PropTypeChanger(self.settings_manager)
         self.font_color_updater = FontColorUpdater()
@@ -52,8 +53,7 @@ class GlobalSettings:
         return self.settings.get("grow_sequence", False)
 
     def set_grow_sequence(self, grow_sequence: bool) -> None:
-        self.settings["grow_sequence"] = grow_sequence
-        self.settings_manager.save_settings()
+        self.settings_manager.set_setting("global", "grow_sequence", grow_sequence)
 
     def get_prop_type(self) -> PropType:
         # Ensure the key is in the correct case
@@ -61,15 +61,13 @@ class GlobalSettings:
         return PropType[prop_type_key]
 
     def set_prop_type(self, prop_type: PropType) -> None:
-        self.settings["prop_type"] = prop_type.name
-        self.settings_manager.save_settings()
+        self.settings_manager.set_setting("global", "prop_type", prop_type.name)
 
     def get_background_type(self) -> str:
         return self.settings.get("background_type", "Aurora")
 
     def set_background_type(self, background_type: str) -> None:
-        self.settings["background_type"] = background_type
-        self.settings_manager.save_settings()
+        self.settings_manager.set_setting("global", "background_type", background_type)
         self.settings_manager.background_changed.emit(background_type)
 
     def setup_background_manager(
@@ -115,8 +113,7 @@ class GlobalSettings:
         return self.font_color_updater.get_font_color(self.get_background_type())
 
     def set_current_tab(self, tab: str) -> None:
-        self.settings["current_tab"] = tab
-        self.settings_manager.save_global_settings(self.settings)
+        self.settings_manager.set_setting("global", "current_tab", tab)
 
     def get_current_tab(self) -> str:
         return self.settings.get("current_tab")
@@ -126,12 +123,12 @@ class GlobalSettings:
 
     def set_grid_mode(self, grid_mode: str) -> None:
         self.main_widget = self.settings_manager.main_window.main_widget
-        self.settings["grid_mode"] = grid_mode
-        self.settings_manager.save_global_settings(self.settings)
+        self.settings_manager.set_setting("global", "grid_mode", grid_mode)
 
     def get_show_welcome_screen(self) -> bool:
         return self.settings.get("show_welcome_screen", True)
 
     def set_show_welcome_screen(self, show_welcome_screen: bool) -> None:
-        self.settings["show_welcome_screen"] = show_welcome_screen
-        self.settings_manager.save_global_settings(self.settings)
+        self.settings_manager.set_setting(
+            "global", "show_welcome_screen", show_welcome_screen
+        )
@@ -25,11 +25,12 @@ class PropTypeChanger:
             pictograph.props[color].updater.update_prop()
         pictograph.red_prop = pictograph.props[RED]
         pictograph.blue_prop = pictograph.props[BLUE]
+        pictograph.prop_type = new_prop_type
         pictograph.updater.update_pictograph()
 
     def apply_prop_type(self) -> None:
+        # main_widget.prop_type follows the setting through setting_changed
         prop_type = self.main_window.settings_manager.global_settings.get_prop_type()
-        self.main_window.main_widget.prop_type = prop_type
         self.update_props_to_type(prop_type)
 
     def update_props_to_type(self, new_prop_type) -> None:
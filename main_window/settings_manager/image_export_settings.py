@@ -1,3 +1,4 @@
+from copy import deepcopy
 from typing import TYPE_CHECKING
 
 
@@ -19,13 +20,12 @@ class ImageExportSettings:
 
     def __init__(self, settings_manager: "SettingsManager") -> None:
         self.settings_manager = settings_manager
-        self.settings = self.settings_manager.settings.get(
-            "image_export", self.DEFAULT_IMAGE_EXPORT_SETTINGS
+        self.settings = self.settings_manager.settings.setdefault(
+            "image_export", deepcopy(self.DEFAULT_IMAGE_EXPORT_SETTINGS)
         )
 
     def get_image_export_setting(self, key):
         return self.settings.get(key)
 
     def set_image_export_setting(self, key, value):
-        self.settings[key] = value
-        self.settings_manager.save_image_export_settings(self.settings)
\ No newline at end of file
+        self.settings_manager.set_setting("image_export", key, value)
\ No newline at end of file
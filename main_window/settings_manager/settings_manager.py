@@ -1,7 +1,8 @@
 import json
 import os
-from typing import TYPE_CHECKING
-from PyQt6.QtCore import QObject, pyqtSignal
+from copy import deepcopy
+from typing import TYPE_CHECKING, Any
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
 
 from main_window.settings_manager.builder_settings import BuilderSettings
 from main_window.settings_manager.sequence_sharing_settings import (
@@ -23,12 +24,31 @@ if TYPE_CHECKING:
 
 
 class SettingsManager(QObject):
+    """
+    In-memory settings store backed by settings.json.
+
+    Setters change the dict in place, emit setting_changed(section, key,
+    value) and call save_settings(), which only schedules a write; edits
+    made within SAVE_DELAY_MS are written together. The save_*_settings
+    helpers replace a whole section and emit setting_changed for each of
+    its keys.
+    The file is replaced atomically, and flush_settings() writes any pending
+    change right away (on close and when the state is saved).
+    """
+
+    SAVE_DELAY_MS = 1000
+
     background_changed: pyqtSignal = pyqtSignal(str)
+    setting_changed: pyqtSignal = pyqtSignal(str, str, object)
 
     def __init__(self, main_window: "MainWindow") -> None:
         super().__init__()
         self.settings_json = get_user_editable_resource_path("settings.json")
         self.main_window = main_window
+        self.dirty = False
+        self.save_timer = QTimer(self)
+        self.save_timer.setSingleShot(True)
+        self.save_timer.timeout.connect(self.flush_settings)
         self.settings = self.load_settings()
         self.global_settings = GlobalSettings(self)
         self.image_export = ImageExportSettings(self)
@@ -41,10 +61,10 @@ class SettingsManager(QObject):
 
     def load_settings(self) -> dict:
         if os.path.exists(self.settings_json):
-            with open(self.settings_json, "r") as file:
+            with open(self.settings_json, "r", encoding="utf-8") as file:
                 return json.load(file)
         else:
-            default_settings = {
+            default_settings = deepcopy({
                 "global": GlobalSettings.DEFAULT_GLOBAL_SETTINGS,
                 "image_export": ImageExportSettings.DEFAULT_IMAGE_EXPORT_SETTINGS,
                 "user_profile": UserProfileSettings.DEFAULT_USER_SETTINGS,
@@ -53,49 +73,77 @@ class SettingsManager(QObject):
                 "sequence_layout": SequenceLayoutSettings.DEFAULT_LAYOUT_SETTINGS,
                 "builder": BuilderSettings.DEFAULT_SETTINGS,
                 "sequence_sharing": SequenceSharingSettings.DEFAULT_SEQUENCE_SHARING_SETTINGS,
-            }
+            })
             self.save_settings(default_settings)
             return default_settings
 
+    def get_setting(self, section: str, key: str, default: Any = None) -> Any:
+        return self.settings.get(section, {}).get(key, default)
+
+    def set_setting(self, section: str, key: str, value: Any) -> None:
+        """Change one value, notify listeners and schedule a save."""
+        self.settings.setdefault(section, {})[key] = value
+        self.setting_changed.emit(section, key, value)
+        self.save_settings()
+
     def save_settings(self, settings=None) -> None:
-        if settings is None:
-            settings = self.settings
-        with open(self.settings_json, "w", encoding="utf-8") as file:
-            json.dump(settings, file, ensure_ascii=False, indent=4)
+        """Schedule a write of the current settings; explicit settings are written now."""
+        if settings is not None:
+            self._write_settings(settings)
+            return
+        self.dirty = True
+        self.save_timer.start(self.SAVE_DELAY_MS)
+
+    def flush_settings(self) -> None:
+        """Write any pending change immediately."""
+        self.save_timer.stop()
+        if not self.dirty:
+            return
+        self.dirty = False
+        self._write_settings(self.settings)
+
+    def _write_settings(self, settings: dict) -> None:
+        temp_path = f"{self.settings_json}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump(settings, file, ensure_ascii=False, indent=4)
+            os.replace(temp_path, self.settings_json)
+        except OSError as e:
+            print(f"Failed to save settings: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
 
     def save_image_export_settings(self, settings) -> None:
-        self.settings["image_export"] = settings
-        self.save_settings()
+        self._replace_section("image_export", settings)
 
     def save_user_profile_settings(self, settings) -> None:
-        self.settings["user_profile"] = settings
-        self.save_settings()
+        self._replace_section("user_profile", settings)
 
     def save_visibility_settings(self, settings) -> None:
-        self.settings["visibility"] = settings
-        self.save_settings()
+        self._replace_section("visibility", settings)
 
     def save_global_settings(self, settings) -> None:
-        self.settings["global"] = settings
-        self.save_settings()
+        self._replace_section("global", settings)
 
     def save_dictionary_settings(self, settings) -> None:
-        self.settings["dictionary"] = settings
-        self.save_settings()
+        self._replace_section("dictionary", settings)
 
     def save_layout_settings(self, settings) -> None:
-        self.settings["sequence_layout"] = settings
-        self.save_settings()
+        self._replace_section("sequence_layout", settings)
 
     def save_auto_builder_settings(self, settings, builder_type) -> None:
-        self.settings["builder"]["auto_builder"][builder_type] = settings
-        self.save_settings()
+        auto_builder_settings = self.settings["builder"]["auto_builder"]
+        auto_builder_settings[builder_type] = settings
+        self.set_setting("builder", "auto_builder", auto_builder_settings)
 
     def save_builder_settings(self, settings) -> None:
-        self.settings["builder"] = settings
-        self.save_settings()
+        self._replace_section("builder", settings)
 
     def save_sequence_sharing_settings(self, settings) -> None:
-        self.settings["sequence_sharing"] = settings
-        self.save_settings()
+        self._replace_section("sequence_sharing", settings)
 
+    def _replace_section(self, section: str, settings: dict) -> None:
+        self.settings[section] = settings
+        for key, value in settings.items():
+            self.setting_changed.emit(section, key, value)
+        self.save_settings()
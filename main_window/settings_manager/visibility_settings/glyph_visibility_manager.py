@@ -39,6 +39,7 @@ class GlyphVisibilityManager:
             )
             if pictograph.letter in [Letter.α, Letter.β, Letter.Γ]:
                 pictograph.start_to_end_pos_glyph.setVisible(False)
+        pictograph.image_renderer.refresh()
 
     def should_glyph_be_visible(self, glyph_type: str) -> bool:
         return self.get_glyph_visibility(glyph_type)
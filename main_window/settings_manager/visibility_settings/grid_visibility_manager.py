@@ -42,6 +42,7 @@ class GridVisibilityManager:
                     start_pos.grid.toggle_non_radial_points_visibility(
                         self.non_radial_visible
                     )
+                    start_pos.image_renderer.refresh()
         beat_frame = (
             self.settings_manager.main_window.main_widget.top_builder_widget.sequence_widget.beat_frame
         )
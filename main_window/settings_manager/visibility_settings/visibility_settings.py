@@ -1,4 +1,4 @@
-import json
+from copy import deepcopy
 from typing import TYPE_CHECKING
 
 from main_window.settings_manager.visibility_settings.glyph_visibility_manager import GlyphVisibilityManager
@@ -24,8 +24,8 @@ class VisibilitySettings:
 
     def __init__(self, settings_manager: "SettingsManager") -> None:
         self.settings_manager = settings_manager
-        self.settings = self.settings_manager.settings.get(
-            "visibility", self.DEFAULT_VISIBILITY_SETTINGS
+        self.settings = self.settings_manager.settings.setdefault(
+            "visibility", deepcopy(self.DEFAULT_VISIBILITY_SETTINGS)
         )
         self.glyph_visibility_manager = GlyphVisibilityManager(self)
         self.grid_visibility_manager = GridVisibilityManager(self)
@@ -41,18 +41,9 @@ class VisibilitySettings:
         )
 
     def set_glyph_visibility(self, glyph_type: str, visible: bool) -> None:
-        self.settings["glyph_visibility"][glyph_type] = visible
-        self.update_visibility_settings_in_json()
+        glyph_visibility = dict(self.get_glyph_visibility(), **{glyph_type: visible})
+        self.settings_manager.set_setting("visibility", "glyph_visibility", glyph_visibility)
 
     def set_grid_visibility(self, grid_element: str, visible: bool) -> None:
-        self.settings["grid_visibility"][grid_element] = visible
-        self.update_visibility_settings_in_json()
-
-    def update_visibility_settings_in_json(self):
-        # get the json file and properly update just the part of the settings file that has visibility settings
-        json_file = self.settings_manager.settings_json
-        with open(json_file, "r") as file:
-            settings = json.load(file)
-        settings["visibility"] = self.settings
-        with open(json_file, "w") as file:
-            json.dump(settings, file, indent=4)
+        grid_visibility = dict(self.get_grid_visibility(), **{grid_element: visible})
+        self.settings_manager.set_setting("visibility", "grid_visibility", grid_visibility)
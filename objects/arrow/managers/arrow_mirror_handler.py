@@ -11,10 +11,10 @@ class ArrowMirrorManager:
         self.arrow = arrow
 
     def update_mirror(self) -> None:
-        self._set_mirror_conditions()
+        self.set_mirror_conditions()
         self._set_svg_mirror(self.arrow)
 
-    def _set_mirror_conditions(self) -> None:
+    def set_mirror_conditions(self) -> None:
         mirror_conditions = {
             ANTI: {
                 CLOCKWISE: True,
@@ -30,3 +30,7 @@ class ArrowRotAngleManager:
         self.calculator_class = self._select_calculator_class()
         calculator: BaseRotAngleCalculator = self.calculator_class(self.arrow)
         calculator.apply_rotation()
+
+    def get_rotation_angle(self) -> int:
+        calculator: BaseRotAngleCalculator = self._select_calculator_class()(self.arrow)
+        return calculator.calculate_angle()
@@ -1,4 +1,8 @@
-from typing import TYPE_CHECKING
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
+from PyQt6.QtSvg import QSvgRenderer
+
+from Enums.PropTypes import PropType
 
 if TYPE_CHECKING:
     from objects.graphical_object.svg_manager.graphical_object_svg_manager import (
@@ -7,10 +11,61 @@ if TYPE_CHECKING:
 
 
 class SvgCacheManager:
-    def __init__(self, manager: "SvgManager"):
+    """
+    Hands out shared QSvgRenderers keyed by (svg path, color, prop type).
+
+    Renderers are built once, with the color already applied, and kept in
+    least-recently-used order. Items that were given a renderer keep it alive
+    after it is evicted, so eviction only costs a rebuild on the next request.
+    """
+
+    MAX_RENDERERS = 256
+
+    def __init__(self, manager: "SvgManager", max_renderers: int = MAX_RENDERERS):
         self.manager = manager
-        self.file_path_cache = {}
-        self.svg_content_cache = {}
+        self.max_renderers = max_renderers
+        self.renderer_cache: OrderedDict[tuple, QSvgRenderer] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get_renderer(
+        self,
+        svg_path: str,
+        color: Optional[str] = None,
+        prop_type: Optional[PropType] = None,
+    ) -> QSvgRenderer:
+        """Return a shared renderer, recoloring the SVG first when a color is given."""
+        key = (svg_path, color, prop_type)
+        renderer = self.renderer_cache.get(key)
+        if renderer is not None:
+            self.hits += 1
+            self.renderer_cache.move_to_end(key)
+            return renderer
+
+        self.misses += 1
+        renderer = self._create_renderer(svg_path, color)
+        self.renderer_cache[key] = renderer
+        if len(self.renderer_cache) > self.max_renderers:
+            self.renderer_cache.popitem(last=False)
+        return renderer
+
+    def _create_renderer(self, svg_path: str, color: Optional[str]) -> QSvgRenderer:
+        if color is None:
+            return QSvgRenderer(svg_path)
+        svg_data = self.manager.load_svg_file(svg_path)
+        colored_svg_data = self.manager.color_manager.apply_color_transformations(
+            svg_data, color
+        )
+        renderer = QSvgRenderer()
+        renderer.load(colored_svg_data.encode("utf-8"))
+        return renderer
+
+    def clear(self) -> None:
+        self.renderer_cache.clear()
 
-    def store_svg_data_in_cache(self, file_path: str, svg_data: str):
-        self.svg_content_cache[file_path] = svg_data
+    def get_stats(self) -> dict[str, int]:
+        return {
+            "size": len(self.renderer_cache),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
@@ -7,6 +7,10 @@ if TYPE_CHECKING:
         SvgManager,
     )
 
+COLOR_MAP = {RED: HEX_RED, BLUE: HEX_BLUE}
+CLASS_COLOR_PATTERN = re.compile(r"(\.st0\s*\{.*?fill:\s*)(#[a-fA-F0-9]{6})(.*?\})")
+FILL_PATTERN = re.compile(r'(fill=")(#[a-fA-F0-9]{6})(")')
+
 
 class SvgColorManager:
     def __init__(self, manager: "SvgManager"):
@@ -14,17 +18,11 @@ class SvgColorManager:
 
     @staticmethod
     def apply_color_transformations(svg_data: str, new_color: str) -> str:
-        COLOR_MAP = {RED: HEX_RED, BLUE: HEX_BLUE}
         new_hex_color = COLOR_MAP.get(new_color)
 
-        class_color_pattern = re.compile(
-            r"(\.st0\s*\{.*?fill:\s*)(#[a-fA-F0-9]{6})(.*?\})"
-        )
-        fill_pattern = re.compile(r'(fill=")(#[a-fA-F0-9]{6})(")')
-
         def replace_color(match):
             return match.group(1) + new_hex_color + match.group(3)
 
-        svg_data = class_color_pattern.sub(replace_color, svg_data)
-        svg_data = fill_pattern.sub(replace_color, svg_data)
+        svg_data = CLASS_COLOR_PATTERN.sub(replace_color, svg_data)
+        svg_data = FILL_PATTERN.sub(replace_color, svg_data)
         return svg_data
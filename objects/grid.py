@@ -1,10 +1,10 @@
 import json
 from typing import TYPE_CHECKING, NamedTuple, Union, Literal
 from PyQt6.QtCore import QPointF
+from PyQt6.QtSvg import QSvgRenderer
 from PyQt6.QtSvgWidgets import QGraphicsSvgItem
 from PyQt6.QtWidgets import QGraphicsSceneWheelEvent, QGraphicsSceneMouseEvent
 from PyQt6.QtCore import QPointF, QEvent
-from data.constants import BOX, DIAMOND
 from Enums.Enums import GridModes
 from Enums.PropTypes import strictly_placed_props
 from utilities.path_helpers import get_images_and_data_path
@@ -15,8 +15,9 @@ GRID_DIR = "images/grid/"
 
 
 class GridItem(QGraphicsSvgItem):
-    def __init__(self, path) -> None:
-        super().__init__(path)
+    def __init__(self, renderer: QSvgRenderer) -> None:
+        super().__init__()
+        self.setSharedRenderer(renderer)
         self.setFlag(QGraphicsSvgItem.GraphicsItemFlag.ItemIsSelectable, False)
         self.setFlag(QGraphicsSvgItem.GraphicsItemFlag.ItemIsMovable, False)
         self.setZValue(100)
@@ -48,9 +49,46 @@ class GridLayer:
                 self.points[name] = GridPoint(name, QPointF(x, y))
             else:
                 self.points[name] = GridPoint(name, None)
+        # Plain (x, y, point) entries so closest-point lookups avoid QPointF math
+        self.positioned_points: tuple[tuple[float, float, GridPoint], ...] = tuple(
+            (point.coordinates.x(), point.coordinates.y(), point)
+            for point in self.points.values()
+            if point.coordinates is not None
+        )
+
+    def get_closest_point(self, pos: QPointF) -> GridPoint:
+        x, y = pos.x(), pos.y()
+        min_distance = float("inf")
+        closest_point = None
+        for point_x, point_y, point in self.positioned_points:
+            distance = abs(x - point_x) + abs(y - point_y)
+            if distance < min_distance:
+                min_distance = distance
+                closest_point = point
+        return closest_point
 
 
 class GridData:
+    """
+    Parsed points of one grid mode from data/circle_coords.json.
+
+    Instances are shared by every pictograph through for_mode() and must be
+    treated as read-only.
+    """
+
+    _circle_coords: dict = None
+    _instances: dict[str, "GridData"] = {}
+
+    @classmethod
+    def for_mode(cls, grid_mode: str) -> "GridData":
+        if grid_mode not in cls._instances:
+            if cls._circle_coords is None:
+                json_path = get_images_and_data_path("data/circle_coords.json")
+                with open(json_path, "r") as file:
+                    cls._circle_coords = json.load(file)
+            cls._instances[grid_mode] = cls(cls._circle_coords, grid_mode)
+        return cls._instances[grid_mode]
+
     def __init__(
         self, data: dict[str, Union[str, dict[str, dict[str, str]]]], grid_mode: str
     ) -> None:
@@ -67,17 +105,7 @@ class GridData:
         self.center_point = GridPoint("center_point", QPointF(x, y))
 
     def get_point(self, layer: GridLayer, pos: QPointF) -> GridPoint:
-        min_distance = float("inf")
-        closest_point = None
-
-        for point in layer.points.values():
-            if point.coordinates is not None:
-                distance = (pos - point.coordinates).manhattanLength()
-                if distance < min_distance:
-                    min_distance = distance
-                    closest_point = point
-
-        return closest_point
+        return layer.get_closest_point(pos)
 
 
 class Grid:
@@ -85,8 +113,9 @@ class Grid:
         self.scene = scene
         self.items: dict[GridModes, GridItem] = {}
         self.layers: dict[str, GridItem] = {}
+        self.nonradial_layers: dict[str, QGraphicsSvgItem] = {}
         self.grid_mode = grid_mode  # Use grid_mode passed from MainWidget
-        self.grid_data = self._load_grid_data()
+        self.grid_data = GridData.for_mode(grid_mode)
         self._create_grid_items(scene)
         self.center = self.grid_data.center_point.coordinates
 
@@ -97,11 +126,28 @@ class Grid:
     def toggle_non_radial_points_visibility(self, visible: bool):
         self.nonradial_layer.setVisible(visible)
 
-    def _load_grid_data(self) -> GridData:
-        json_path = get_images_and_data_path("data/circle_coords.json")
-        with open(json_path, "r") as file:
-            data = json.load(file)
-        return GridData(data, self.grid_mode)
+    def set_grid_mode(self, grid_mode: str) -> None:
+        """
+        Switch a pictograph that outlives a grid mode change, such as a
+        pooled one, to another mode. The mode's items are built the first
+        time it is shown.
+        """
+        if grid_mode == self.grid_mode:
+            return
+        grid_visible = self.items[self.grid_mode].isVisible()
+        nonradial_visible = self.nonradial_layer.isVisible()
+        self.items[self.grid_mode].setVisible(False)
+        self.nonradial_layer.setVisible(False)
+
+        self.grid_mode = grid_mode
+        self.grid_data = GridData.for_mode(grid_mode)
+        self.center = self.grid_data.center_point.coordinates
+        if grid_mode not in self.items:
+            self._create_grid_items(self.scene)
+        self.nonradial_layer = self.nonradial_layers[grid_mode]
+        self.items[grid_mode].setVisible(grid_visible)
+        self.nonradial_layer.setVisible(nonradial_visible)
+        self.scene.locations = self.scene.initializer.init_quadrant_boundaries(self)
 
     def get_closest_hand_point(self, pos: QPointF) -> tuple[str, QPointF]:
         strict = self.scene.main_widget.prop_type in strictly_placed_props
@@ -119,31 +165,33 @@ class Grid:
         return closest_point.name, closest_point.coordinates
 
     def _create_grid_items(self, pictograph: "BasePictograph"):
-        # Define paths for your grid images or components
-        paths = {
-            DIAMOND: get_images_and_data_path(f"{GRID_DIR}diamond_grid.svg"),
-            BOX: get_images_and_data_path(f"{GRID_DIR}box_grid.svg"),
-        }
-        # Create grid items based on the mode and paths
-        for mode, path in paths.items():
-            grid_item = GridItem(path)
-            pictograph.addItem(grid_item)
-            grid_item.setVisible(mode == self.grid_mode)
-            self.items[mode] = grid_item
-
-        # Load non-radial points specific to the grid mode
-        non_radial_paths = {
-            DIAMOND: get_images_and_data_path(
-                f"{GRID_DIR}diamond_nonradial_points.svg"
-            ),
-            BOX: get_images_and_data_path(f"{GRID_DIR}box_nonradial_points.svg"),
-        }
-        non_radial_path = non_radial_paths.get(self.grid_mode)
-        if non_radial_path:
-            non_radial_item = QGraphicsSvgItem(non_radial_path)
-            non_radial_item.setVisible(False)  # Initially hidden
-            self.scene.addItem(non_radial_item)
-            self.nonradial_layer = non_radial_item
+        """
+        Add the grid and its non-radial points for the current mode only.
+
+        Items use shared renderers from the SVG cache. The other mode's items
+        are only built if set_grid_mode() switches to it.
+        """
+        cache_manager = pictograph.main_widget.svg_manager.cache_manager
+        grid_item = GridItem(
+            cache_manager.get_renderer(
+                get_images_and_data_path(f"{GRID_DIR}{self.grid_mode}_grid.svg")
+            )
+        )
+        pictograph.addItem(grid_item)
+        self.items[self.grid_mode] = grid_item
+
+        non_radial_item = QGraphicsSvgItem()
+        non_radial_item.setSharedRenderer(
+            cache_manager.get_renderer(
+                get_images_and_data_path(
+                    f"{GRID_DIR}{self.grid_mode}_nonradial_points.svg"
+                )
+            )
+        )
+        non_radial_item.setVisible(False)  # Initially hidden
+        self.scene.addItem(non_radial_item)
+        self.nonradial_layers[self.grid_mode] = non_radial_item
+        self.nonradial_layer = non_radial_item
 
     def set_layer_visibility(self, layer_id, visibility):
         if layer_id in self.layers:
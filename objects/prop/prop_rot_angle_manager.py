@@ -48,13 +48,16 @@ class PropRotAngleManager:
         rotation_angle = angle_map.get(key, {}).get(self.prop.loc, 0)
         return rotation_angle if self.prop.prop_type != PropType.Hand else 0
 
-    def update_prop_rot_angle(self) -> None:
+    def get_rotation_angle(self) -> int:
         grid_mode = (
             self.prop.pictograph.main_widget.settings_manager.global_settings.get_grid_mode()
         )
         if grid_mode == DIAMOND:
-            prop_rotation_angle = self.get_diamond_rotation_angle()
+            return self.get_diamond_rotation_angle()
         elif grid_mode == BOX:
-            prop_rotation_angle = self.get_box_rotation_angle()
+            return self.get_box_rotation_angle()
+
+    def update_prop_rot_angle(self) -> None:
+        prop_rotation_angle = self.get_rotation_angle()
         self.prop.setTransformOriginPoint(self.prop.boundingRect().center())
         self.prop.setRotation(prop_rotation_angle)
@@ -1,3 +1,4 @@
+from PyQt6.QtCore import QPointF
 from objects.arrow.arrow import Arrow
 from typing import TYPE_CHECKING
 from .components.arrow_adjustment_calculator import ArrowAdjustmentCalculator
@@ -31,8 +32,12 @@ class ArrowPlacementManager:
             self.update_arrow_position(arrow)
 
     def update_arrow_position(self, arrow: Arrow) -> None:
-        initial_pos = self.initial_pos_calculator.get_initial_coords(arrow)
-        adjustment = self.adjustment_calculator.get_adjustment(arrow)
-        new_pos = initial_pos + adjustment - arrow.boundingRect().center()
+        new_pos = self.get_arrow_center(arrow) - arrow.boundingRect().center()
         arrow.setPos(new_pos)
         arrow.rot_angle_manager.update_rotation()
+
+    def get_arrow_center(self, arrow: Arrow) -> QPointF:
+        """Scene point the centre of the arrow's bounding rect is placed on."""
+        initial_pos = self.initial_pos_calculator.get_initial_coords(arrow)
+        adjustment = self.adjustment_calculator.get_adjustment(arrow)
+        return initial_pos + adjustment
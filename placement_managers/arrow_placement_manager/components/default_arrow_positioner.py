@@ -1,82 +1,34 @@
-import json
 from Enums.letters import LetterConditions
 from data.constants import (
-    ANTI,
-    BLUE,
-    BOX,
-    DIAMOND,
-    FLOAT,
     NONRADIAL,
     CLOCK,
     COUNTER,
-    DASH,
     IN,
     OUT,
-    PRO,
     RADIAL,
-    RED,
-    STATIC,
 )
 from objects.arrow.arrow import Arrow
 from typing import TYPE_CHECKING
 from Enums.Enums import OrientationTypes
-from utilities.path_helpers import get_images_and_data_path
 
 if TYPE_CHECKING:
     from ..arrow_placement_manager import ArrowPlacementManager
-import codecs
 
 
 class DefaultArrowPositioner:
     def __init__(self, placement_manager: "ArrowPlacementManager") -> None:
         self.placement_manager = placement_manager
         self.pictograph = placement_manager.pictograph
-        self.diamond_placements_files = {
-            PRO: "default_diamond_pro_placements.json",
-            ANTI: "default_diamond_anti_placements.json",
-            FLOAT: "default_diamond_float_placements.json",
-            DASH: "default_diamond_dash_placements.json",
-            STATIC: "default_diamond_static_placements.json",
-        }
-        self.box_placement_files = {
-            PRO: "default_box_pro_placements.json",
-            ANTI: "default_box_anti_placements.json",
-            FLOAT: "default_box_float_placements.json",
-            DASH: "default_box_dash_placements.json",
-            STATIC: "default_box_static_placements.json",
-        }
-        self._load_all_default_placements()
+        self.placement_data_store = self.pictograph.main_widget.placement_data_store
 
-    def _load_all_default_placements(self):
-        self.default_placements = {}
-        motion_types = [PRO, ANTI, FLOAT, DASH, STATIC]
-        for motion_type in motion_types:
-            self.default_placements[motion_type] = (
-                self._load_default_placements_for_motion_type(motion_type)
-            )
-
-    def _load_default_placements_for_motion_type(
-        self, motion_type: str
-    ) -> dict[str, dict[str, list[int]]]:
+    @property
+    def default_placements(self) -> dict[str, dict[str, dict[str, list[int]]]]:
         grid_mode = (
-            self.placement_manager.pictograph.main_widget.settings_manager.global_settings.get_grid_mode()
+            self.pictograph.main_widget.settings_manager.global_settings.get_grid_mode()
         )
-        if grid_mode == DIAMOND:
-            json_filename = self.diamond_placements_files.get(motion_type)
-            json_path = get_images_and_data_path(
-                f"data/arrow_placement/diamond/default/{json_filename}"
-            )
-        elif grid_mode == BOX:
-            json_filename = self.box_placement_files.get(motion_type)
-            json_path = get_images_and_data_path(
-                f"data/arrow_placement/box/default/{json_filename}"
-            )
-        with codecs.open(json_path, "r", encoding="utf-8") as file:
-            return json.load(file)
+        return self.placement_data_store.get_all_default_placements(grid_mode)
 
     def _get_adjustment_key(self, arrow: Arrow, default_placements: dict) -> str:
-        self._load_all_default_placements()
-
         has_beta_props = arrow.pictograph.check.ends_with_beta()
         has_alpha_props = arrow.pictograph.check.ends_with_alpha()
         has_gamma_props = arrow.pictograph.check.ends_with_gamma()
@@ -140,10 +92,12 @@ class DefaultArrowPositioner:
             return arrow.motion.motion_type
 
     def get_default_adjustment(self, arrow: Arrow) -> tuple[int, int]:
-        if arrow.motion.motion_type in self.default_placements:
-            default_placements = self.default_placements[arrow.motion.motion_type]
-        else:
-            default_placements = {}
+        grid_mode = (
+            self.pictograph.main_widget.settings_manager.global_settings.get_grid_mode()
+        )
+        default_placements = self.placement_data_store.get_default_placements(
+            grid_mode, arrow.motion.motion_type
+        )
 
         adjustment_key = self._get_adjustment_key(arrow, default_placements)
 
@@ -5,7 +5,6 @@ from .standard_orientation_updater import StandardOrientationUpdater
 from data.constants import *
 from objects.arrow.arrow import Arrow
 from typing import TYPE_CHECKING
-from PyQt6.QtWidgets import QApplication
 
 if TYPE_CHECKING:
     from ..mirrored_entry_manager import MirroredEntryManager
@@ -37,7 +36,6 @@ class MirroredEntryUpdater:
 
         mirrored_entry_updater = self._get_mirrored_entry_updater(arrow)
         mirrored_entry_updater.update_entry(letter, original_turn_data)
-        QApplication.processEvents()
         self.manager.data_updater.update_specific_entry_in_json(
             letter, letter_data, ori_key
         )
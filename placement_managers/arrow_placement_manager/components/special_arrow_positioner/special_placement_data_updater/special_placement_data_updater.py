@@ -1,4 +1,3 @@
-import os
 import logging
 from typing import TYPE_CHECKING
 from .mirrored_entry_manager.mirrored_entry_manager import (
@@ -32,17 +31,14 @@ class SpecialPlacementDataUpdater:
         self.json_handler = (
             positioner.pictograph.main_widget.json_manager.special_placement_handler
         )
+        self.editing_session = (
+            positioner.pictograph.main_widget.special_placement_editing_session
+        )
         self.entry_remover = SpecialPlacementEntryRemover(self)
         self.mirrored_entry_manager = MirroredEntryManager(self)
 
     def _get_letter_data(self, letter: Letter, ori_key: str) -> dict:
-        letter_data = (
-            self.positioner.placement_manager.pictograph.main_widget.special_placements[
-                ori_key
-            ].get(letter.value, {})
-        )
-
-        return letter_data
+        return self.editing_session.get_letter_data(ori_key, letter)
 
     def _update_or_create_turn_data(
         self,
@@ -115,20 +111,7 @@ class SpecialPlacementDataUpdater:
     def _update_placement_json_data(
         self, letter: Letter, letter_data: dict, ori_key: str
     ) -> None:
-        grid_mode = (
-            self.positioner.placement_manager.pictograph.main_widget.settings_manager.global_settings.get_grid_mode()
-        )
-        file_path = os.path.join(
-            "data",
-            "arrow_placement",
-            grid_mode,
-            "special",
-            ori_key,
-            f"{letter.value}_placements.json",
-        )
-        existing_data = self.json_handler.load_json_data(file_path)
-        existing_data[letter.value] = letter_data
-        self.json_handler.write_json_data(existing_data, file_path)
+        self.editing_session.set_letter_data(ori_key, letter, letter_data)
 
     def update_arrow_adjustments_in_json(
         self, adjustment: tuple[int, int], arrow: Arrow
@@ -22,6 +22,7 @@ class SpecialPlacementEntryRemover:
         )
 
     def remove_special_placement_entry(self, letter: Letter, arrow: Arrow) -> None:
+        self.data_updater.editing_session.flush()
         ori_key = self.data_updater._generate_ori_key(arrow.motion)
         file_path = self._generate_file_path(ori_key, letter)
 
@@ -0,0 +1,96 @@
+import json
+import os
+from data.constants import ANTI, DASH, FLOAT, PRO, STATIC
+from utilities.path_helpers import get_images_and_data_path
+
+
+class PlacementDataStore:
+    """
+    Holds the default and special arrow placement tables read from data/arrow_placement.
+
+    Each table is read from disk the first time it is requested for a grid mode
+    and shared by every pictograph afterwards. The tables are only re-read after
+    invalidate(), which the F5/Q placement refresh calls.
+    """
+
+    MOTION_TYPES = [PRO, ANTI, FLOAT, DASH, STATIC]
+    SPECIAL_SUBFOLDERS = [
+        "from_layer1",
+        "from_layer2",
+        "from_layer3_blue2_red1",
+        "from_layer3_blue1_red2",
+    ]
+
+    def __init__(self) -> None:
+        self.default_placements: dict[tuple[str, str], dict] = {}
+        self.special_placements: dict[str, dict[str, dict]] = {}
+
+    def get_default_placements(
+        self, grid_mode: str, motion_type: str
+    ) -> dict[str, dict[str, list[int]]]:
+        key = (grid_mode, motion_type)
+        if key not in self.default_placements:
+            self.default_placements[key] = self._load_default_placements(
+                grid_mode, motion_type
+            )
+        return self.default_placements[key]
+
+    def get_all_default_placements(
+        self, grid_mode: str
+    ) -> dict[str, dict[str, dict[str, list[int]]]]:
+        return {
+            motion_type: self.get_default_placements(grid_mode, motion_type)
+            for motion_type in self.MOTION_TYPES
+        }
+
+    def get_special_placements(
+        self, grid_mode: str
+    ) -> dict[str, dict[str, dict[str, dict[str, int]]]]:
+        """
+        Return the special placements for a grid mode, keyed by ori subfolder.
+
+        The returned dict is the live copy; edits made to it are seen by every
+        pictograph until the next invalidate().
+        """
+        if grid_mode not in self.special_placements:
+            self.special_placements[grid_mode] = self._load_special_placements(
+                grid_mode
+            )
+        return self.special_placements[grid_mode]
+
+    def invalidate(self) -> None:
+        self.default_placements.clear()
+        self.special_placements.clear()
+
+    @staticmethod
+    def _load_default_placements(
+        grid_mode: str, motion_type: str
+    ) -> dict[str, dict[str, list[int]]]:
+        json_path = get_images_and_data_path(
+            f"data/arrow_placement/{grid_mode}/default/"
+            f"default_{grid_mode}_{motion_type}_placements.json"
+        )
+        try:
+            with open(json_path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    def _load_special_placements(
+        self, grid_mode: str
+    ) -> dict[str, dict[str, dict[str, dict[str, int]]]]:
+        special_placements = {}
+        for subfolder in self.SPECIAL_SUBFOLDERS:
+            special_placements[subfolder] = {}
+            directory = get_images_and_data_path(
+                f"data/arrow_placement/{grid_mode}/special/{subfolder}"
+            )
+            if not os.path.isdir(directory):
+                continue
+            for file_name in os.listdir(directory):
+                if file_name.endswith("_placements.json"):
+                    with open(
+                        os.path.join(directory, file_name), "r", encoding="utf-8"
+                    ) as file:
+                        special_placements[subfolder].update(json.load(file))
+        return special_placements
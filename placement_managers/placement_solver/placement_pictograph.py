@@ -0,0 +1,211 @@
+from typing import TYPE_CHECKING, NamedTuple, Optional
+from PyQt6.QtCore import QPointF
+
+from Enums.Enums import Letter, LetterType
+from Enums.PropTypes import PropType
+from base_widgets.base_pictograph.components.pictograph_checker import (
+    PictographChecker,
+)
+from base_widgets.base_pictograph.components.pictograph_getter import PictographGetter
+from base_widgets.base_pictograph.components.wasd_adjustment_manager.wasd_adjustment_manager import (
+    WASD_AdjustmentManager,
+)
+from data.constants import BLUE, LEADING, RED, TRAILING
+from objects.arrow.managers.arrow_mirror_handler import ArrowMirrorManager
+from objects.arrow.managers.location_manager.arrow_location_manager import (
+    ArrowLocationManager,
+)
+from objects.arrow.managers.rot_angle_manager.arrow_rot_angle_manager import (
+    ArrowRotAngleManager,
+)
+from objects.grid import GridData
+from objects.motion.managers.motion_checker import MotionChecker
+from objects.motion.managers.motion_ori_calculator import MotionOriCalculator
+from objects.prop.prop_checker import PropChecker
+from objects.prop.prop_rot_angle_manager import PropRotAngleManager
+from placement_managers.arrow_placement_manager.arrow_placement_manager import (
+    ArrowPlacementManager,
+)
+from placement_managers.prop_placement_manager.handlers.default_prop_positioner import (
+    DefaultPropPositioner,
+)
+from placement_managers.prop_placement_manager.prop_placement_manager import (
+    PropPlacementManager,
+)
+
+if TYPE_CHECKING:
+    from main_window.main_widget.main_widget import MainWidget
+
+
+MOTION_ATTRIBUTES = [
+    "motion_type",
+    "start_loc",
+    "end_loc",
+    "turns",
+    "start_ori",
+    "prop_rot_dir",
+    "prefloat_motion_type",
+    "prefloat_prop_rot_dir",
+]
+
+
+class PlacementGrid(NamedTuple):
+    grid_mode: str
+    grid_data: GridData
+
+
+class PlacementMotion:
+    def __init__(
+        self, pictograph: "PlacementPictograph", color: str, motion_dict: dict
+    ) -> None:
+        self.pictograph = pictograph
+        self.color = color
+        self.lead_state: Optional[str] = None
+        self.prefloat_motion_type: Optional[str] = None
+        self.prefloat_prop_rot_dir: Optional[str] = None
+        for attribute in MOTION_ATTRIBUTES:
+            setattr(self, attribute, motion_dict.get(attribute))
+        self.check = MotionChecker(self)
+        self.ori_calculator = MotionOriCalculator(self)
+        self.end_ori = self.ori_calculator.get_end_ori()
+
+
+class PlacementArrow:
+    def __init__(self, motion: PlacementMotion) -> None:
+        self.pictograph = motion.pictograph
+        self.motion = motion
+        self.color = motion.color
+        self.turns = motion.turns
+        self.loc: Optional[str] = None
+        self.is_svg_mirrored = False
+        motion.arrow = self
+
+
+class PlacementProp:
+    """
+    A prop reduced to its attributes and one point.
+
+    pos() is where the prop's SVG centre point sits in scene coordinates; the
+    beta positioners only ever add offsets to it, so the result can be applied
+    to a real prop with DefaultPropPositioner.place_prop_at_hand_point().
+    """
+
+    def __init__(self, motion: PlacementMotion, prop_type: PropType) -> None:
+        self.pictograph = motion.pictograph
+        self.motion = motion
+        self.color = motion.color
+        self.loc = motion.end_loc
+        self.ori = motion.end_ori
+        self.prop_type = prop_type
+        self.position = QPointF(0, 0)
+        self.check = PropChecker(self)
+        self.rot_angle_manager = PropRotAngleManager(self)
+        motion.prop = self
+
+    def pos(self) -> QPointF:
+        return self.position
+
+    def setPos(self, position: QPointF) -> None:
+        self.position = position
+
+
+class AnchorPropPositioner(DefaultPropPositioner):
+    def place_prop_at_hand_point(self, prop: PlacementProp, hand_point: QPointF) -> None:
+        prop.setPos(QPointF(hand_point))
+
+
+class PlacementPropPlacementManager(PropPlacementManager):
+    default_positioner_class = AnchorPropPositioner
+
+
+class PlacementPictograph:
+    """
+    Everything the placement managers read from a BasePictograph, without the
+    scene: motions, arrows and props are plain objects filled from a
+    pictograph dict, and the real placement managers run against them.
+    """
+
+    SCENE_SIZE = 950
+    selected_arrow = None
+
+    def __init__(
+        self,
+        main_widget: "MainWidget",
+        pictograph_dict: dict,
+        grid_mode: str,
+        prop_type: PropType,
+    ) -> None:
+        self.main_widget = main_widget
+        self.pictograph_dict = pictograph_dict
+        self.letter = Letter.get_letter(pictograph_dict["letter"])
+        self.letter_type = LetterType.get_letter_type(self.letter)
+        self.start_pos = pictograph_dict.get("start_pos")
+        self.end_pos = pictograph_dict.get("end_pos")
+        self.timing = pictograph_dict.get("timing")
+        self.direction = pictograph_dict.get("direction")
+        self.prop_type = prop_type
+        self.grid = PlacementGrid(grid_mode, GridData.for_mode(grid_mode))
+
+        self.motions = {
+            color: PlacementMotion(
+                self, color, self.get_motion_dict(pictograph_dict, color)
+            )
+            for color in (RED, BLUE)
+        }
+        self.arrows = {
+            color: PlacementArrow(motion) for color, motion in self.motions.items()
+        }
+        self.props = {
+            color: PlacementProp(motion, prop_type)
+            for color, motion in self.motions.items()
+        }
+        self.red_motion, self.blue_motion = self.motions[RED], self.motions[BLUE]
+        self.red_arrow, self.blue_arrow = self.arrows[RED], self.arrows[BLUE]
+        self.red_prop, self.blue_prop = self.props[RED], self.props[BLUE]
+
+        self.get = PictographGetter(self)
+        self.check = PictographChecker(self)
+        self.get.initiallize_getter()
+        self._set_lead_states()
+        self.turns_tuple = self.get.turns_tuple()
+
+        self.arrow_placement_manager = ArrowPlacementManager(self)
+        self.wasd_manager = WASD_AdjustmentManager(self)
+        self.prop_placement_manager = PlacementPropPlacementManager(self)
+
+    def width(self) -> int:
+        return self.SCENE_SIZE
+
+    def place_objects(self) -> None:
+        """Run the same placement steps PictographUpdater runs on a scene."""
+        for arrow in self._get_arrows_in_update_order():
+            ArrowMirrorManager(arrow).set_mirror_conditions()
+            ArrowLocationManager(arrow).update_location()
+        self.prop_placement_manager.update_prop_positions()
+
+    def get_arrow_center(self, arrow: PlacementArrow) -> QPointF:
+        return self.arrow_placement_manager.get_arrow_center(arrow)
+
+    def get_arrow_rotation_angle(self, arrow: PlacementArrow) -> int:
+        return ArrowRotAngleManager(arrow).get_rotation_angle()
+
+    @staticmethod
+    def get_motion_dict(pictograph_dict: dict, color: str) -> dict:
+        motion_dict = dict(pictograph_dict.get(f"{color}_attributes", {}))
+        turns_key = f"{motion_dict.get('motion_type')}_turns"
+        if turns_key in pictograph_dict:
+            motion_dict["turns"] = pictograph_dict[turns_key]
+        motion_dict.setdefault("prefloat_motion_type", motion_dict.get("motion_type"))
+        motion_dict.setdefault("prefloat_prop_rot_dir", motion_dict.get("prop_rot_dir"))
+        return motion_dict
+
+    def _get_arrows_in_update_order(self) -> list[PlacementArrow]:
+        # Type 3 dashes are located relative to the shift, so it goes first
+        if self.letter_type == LetterType.Type3:
+            return [self.get.shift().arrow, self.get.dash().arrow]
+        return [self.red_arrow, self.blue_arrow]
+
+    def _set_lead_states(self) -> None:
+        if self.letter.value in ["S", "T", "U", "V"]:
+            self.get.leading_motion().lead_state = LEADING
+            self.get.trailing_motion().lead_state = TRAILING
@@ -0,0 +1,113 @@
+from typing import TYPE_CHECKING, NamedTuple, Optional
+
+from Enums.PropTypes import PropType
+from data.constants import BLUE, RED
+from .placement_pictograph import MOTION_ATTRIBUTES, PlacementPictograph
+
+if TYPE_CHECKING:
+    from main_window.main_widget.main_widget import MainWidget
+
+
+class ArrowPlacement(NamedTuple):
+    loc: str
+    center: tuple[float, float]
+    rot_angle: int
+    is_mirrored: bool
+
+
+class PropPlacement(NamedTuple):
+    loc: str
+    ori: str
+    center: tuple[float, float]
+    rot_angle: int
+
+
+class PictographPlacement(NamedTuple):
+    arrows: dict[str, ArrowPlacement]
+    props: dict[str, PropPlacement]
+
+
+class PlacementSolver:
+    """
+    Computes where every arrow and prop of a pictograph goes, without a scene.
+
+    Results are plain tuples keyed by color and memoized by pictograph key,
+    the motion attributes placement depends on (turns and orientations
+    included), grid mode and prop type. Arrow centers are where the centre of the arrow's
+    bounding rect goes; prop centers are where the prop's SVG centre point goes.
+    The placement managers read the grid mode from the settings, so solve()
+    always works in the active grid mode. invalidate() must be called when the
+    placement data changes.
+    """
+
+    def __init__(self, main_widget: "MainWidget") -> None:
+        self.main_widget = main_widget
+        self.placements: dict[tuple, PictographPlacement] = {}
+
+    def solve(
+        self, pictograph_dict: dict, prop_type: Optional[PropType] = None
+    ) -> PictographPlacement:
+        grid_mode = self.main_widget.settings_manager.global_settings.get_grid_mode()
+        prop_type = prop_type or self.main_widget.prop_type
+        key = (
+            pictograph_dict["letter"],
+            self.main_widget.pictograph_key_generator.generate_pictograph_key(
+                pictograph_dict
+            ),
+            self._get_motions_key(pictograph_dict),
+            grid_mode,
+            prop_type,
+        )
+        placement = self.placements.get(key)
+        if placement is None:
+            placement = self._solve(pictograph_dict, grid_mode, prop_type)
+            self.placements[key] = placement
+        return placement
+
+    def invalidate(self, letter_value: str = None) -> None:
+        """Forget the placements of one letter, or of every letter."""
+        if letter_value is None:
+            self.placements.clear()
+            return
+        for key in [key for key in self.placements if key[0] == letter_value]:
+            del self.placements[key]
+
+    @staticmethod
+    def _get_motions_key(pictograph_dict: dict) -> tuple:
+        motion_dicts = [
+            PlacementPictograph.get_motion_dict(pictograph_dict, color)
+            for color in (BLUE, RED)
+        ]
+        return tuple(
+            str(motion_dict.get(attribute))
+            for motion_dict in motion_dicts
+            for attribute in MOTION_ATTRIBUTES
+        )
+
+    def _solve(
+        self, pictograph_dict: dict, grid_mode: str, prop_type: PropType
+    ) -> PictographPlacement:
+        pictograph = PlacementPictograph(
+            self.main_widget, pictograph_dict, grid_mode, prop_type
+        )
+        pictograph.place_objects()
+
+        arrows = {}
+        for color, arrow in pictograph.arrows.items():
+            center = pictograph.get_arrow_center(arrow)
+            arrows[color] = ArrowPlacement(
+                arrow.loc,
+                (center.x(), center.y()),
+                pictograph.get_arrow_rotation_angle(arrow),
+                arrow.is_svg_mirrored,
+            )
+        props = {}
+        for color, prop in pictograph.props.items():
+            center = prop.pos()
+            props[color] = PropPlacement(
+                prop.loc,
+                prop.ori,
+                (center.x(), center.y()),
+                prop.rot_angle_manager.get_rotation_angle(),
+            )
+        return PictographPlacement(arrows, props)
@@ -9,11 +9,13 @@ if TYPE_CHECKING:
 
 
 class PropPlacementManager:
+    default_positioner_class = DefaultPropPositioner
+
     def __init__(self, pictograph: "BasePictograph") -> None:
         self.pictograph = pictograph
 
         # Positioners
-        self.default_positioner = DefaultPropPositioner(self)
+        self.default_positioner = self.default_positioner_class(self)
         self.beta_positioner = BetaPropPositioner(self)
 
     def update_prop_positions(self) -> None:
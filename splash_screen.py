@@ -191,10 +191,11 @@ class SplashScreen(QWidget):
         self.background_manager.paint_background(self, painter)
 
     def update_progress(self, value, message=""):
-        """Update progress bar and message."""
+        """Update progress bar and message, painting them before returning."""
         self.progress_bar.setValue(value)
         if message:
             self.currently_loading_label.setText(message)
+        self.repaint()
 
     def finish(self):
         """Close the splash screen and show the main window."""
@@ -0,0 +1,284 @@
+import importlib.abc
+import importlib.machinery
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+from PyQt6.QtCore import QEvent, QObject, QTimer
+
+from profiler import Profiler
+from utilities.path_helpers import get_user_editable_resource_path
+
+if TYPE_CHECKING:
+    from PyQt6.QtWidgets import QWidget
+    from splash_screen import SplashScreen
+
+
+class ImportTimer(importlib.abc.MetaPathFinder):
+    """
+    Times how long each module takes to execute while it is installed.
+
+    It finds specs through the other finders and wraps the exec_module of
+    file loaders, which are created per module. Only imports on the thread
+    that installed it are timed.
+    """
+
+    FILE_LOADERS = (
+        importlib.machinery.SourceFileLoader,
+        importlib.machinery.SourcelessFileLoader,
+        importlib.machinery.ExtensionFileLoader,
+    )
+
+    def __init__(self) -> None:
+        self.cumulative: dict[str, float] = {}
+        self.self_times: dict[str, float] = {}
+        self.child_times: list[float] = []
+        self.thread_id = threading.get_ident()
+
+    def install(self) -> None:
+        sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        if threading.get_ident() != self.thread_id:
+            return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if isinstance(spec.loader, self.FILE_LOADERS):
+            spec.loader.exec_module = self._time_exec_module(
+                fullname, spec.loader.exec_module
+            )
+        return spec
+
+    def get_slowest(self, count: int) -> list[dict]:
+        slowest = sorted(self.cumulative.items(), key=lambda x: x[1], reverse=True)
+        return [
+            {
+                "module": module,
+                "cumulative_seconds": round(seconds, 6),
+                "self_seconds": round(self.self_times[module], 6),
+            }
+            for module, seconds in slowest[:count]
+        ]
+
+    def _time_exec_module(self, fullname: str, exec_module):
+        def timed_exec_module(module) -> None:
+            self.child_times.append(0.0)
+            start = time.perf_counter()
+            try:
+                exec_module(module)
+            finally:
+                elapsed = time.perf_counter() - start
+                children = self.child_times.pop()
+                if self.child_times:
+                    self.child_times[-1] += elapsed
+                self.cumulative[fullname] = elapsed
+                self.self_times[fullname] = elapsed - children
+
+        return timed_exec_module
+
+
+class FirstPaintWatcher(QObject):
+    def __init__(self, startup_profiler: "StartupProfiler", widget: "QWidget") -> None:
+        super().__init__(widget)
+        self.startup_profiler = startup_profiler
+        self.widget = widget
+        widget.installEventFilter(self)
+
+    def eventFilter(self, obj, event) -> bool:
+        if event.type() == QEvent.Type.Paint:
+            self.widget.removeEventFilter(self)
+            self.startup_profiler.end_phase("first_paint")
+            QTimer.singleShot(0, self.startup_profiler.finish)
+        return False
+
+
+class StartupProfiler:
+    """
+    Times the startup phases and reports progress to the splash screen.
+
+    Phase durations are always kept and saved to startup_timings.json, and the
+    splash screen shows how much of the last startup's time had passed at
+    the start of each phase. Until a startup has recorded every phase in
+    DEFAULT_PROGRESS, those fixed percentages are used instead. With
+    --profile-startup[=path] or the TKA_PROFILE_STARTUP environment variable
+    set to 1 or a path, import times and a cProfile of the whole startup are
+    recorded as well, and a JSON report is written when the main window
+    first paints.
+    """
+
+    ENV_VAR = "TKA_PROFILE_STARTUP"
+    CLI_FLAG = "--profile-startup"
+    DEFAULT_REPORT_PATH = "startup_profile.json"
+    TIMINGS_VERSION = 1
+    SLOWEST_IMPORTS = 50
+    # Phases that run while no splash screen is shown, or after it closes
+    UNTRACKED_PHASES = ("settings", "splash_screen", "first_paint")
+    DEFAULT_PROGRESS = {
+        "imports": 0,
+        "main_window": 5,
+        "pictograph_dicts": 10,
+        "json_manager": 20,
+        "svg_manager": 30,
+        "key_generators": 40,
+        "special_placements": 50,
+        "managers": 60,
+        "build_tab": 70,
+        "browse_tab": 80,
+        "learn_tab": 90,
+        "background": 93,
+        "menu_bar": 95,
+    }
+
+    def __init__(self, report_path: Optional[str] = None) -> None:
+        self.enabled = report_path is not None
+        self.report_path = report_path
+        self.timings_path = get_user_editable_resource_path("startup_timings.json")
+        self.splash_screen: Optional["SplashScreen"] = None
+        self.profiler = Profiler()
+        self.import_timer = ImportTimer() if self.enabled else None
+        self.phases: dict[str, float] = {}
+        self.phase_starts: dict[str, float] = {}
+        self.start_time = time.perf_counter()
+        self.finished = False
+        self.first_paint_watcher: Optional[FirstPaintWatcher] = None
+        self.last_phases = self._load_last_phases()
+
+    @classmethod
+    def from_argv(cls, argv: list[str]) -> "StartupProfiler":
+        """Create the profiler, removing the CLI flag from argv if it is there."""
+        report_path = None
+        env_value = os.environ.get(cls.ENV_VAR, "").strip()
+        if env_value and env_value not in ("0", "false"):
+            report_path = cls.DEFAULT_REPORT_PATH if env_value == "1" else env_value
+        for arg in list(argv[1:]):
+            if arg == cls.CLI_FLAG:
+                report_path = report_path or cls.DEFAULT_REPORT_PATH
+                argv.remove(arg)
+            elif arg.startswith(f"{cls.CLI_FLAG}="):
+                report_path = arg.split("=", 1)[1] or cls.DEFAULT_REPORT_PATH
+                argv.remove(arg)
+        return cls(report_path)
+
+    def start(self) -> None:
+        self.start_time = time.perf_counter()
+        if self.enabled:
+            self.import_timer.install()
+            self.profiler.enable()
+
+    @contextmanager
+    def phase(self, name: str, message: str = ""):
+        self.begin_phase(name, message)
+        try:
+            yield
+        finally:
+            self.end_phase(name)
+
+    def begin_phase(self, name: str, message: str = "") -> None:
+        if self.splash_screen and name not in self.UNTRACKED_PHASES:
+            self.splash_screen.update_progress(self.get_progress(name), message)
+        self.phase_starts[name] = time.perf_counter()
+
+    def end_phase(self, name: str) -> None:
+        start = self.phase_starts.pop(name, None)
+        if start is not None:
+            self.phases[name] = self.phases.get(name, 0.0) + (
+                time.perf_counter() - start
+            )
+
+    def watch_first_paint(self, widget: "QWidget") -> None:
+        """Time from now until the widget is first painted, then finish."""
+        self.begin_phase("first_paint")
+        self.first_paint_watcher = FirstPaintWatcher(self, widget)
+
+    def get_progress(self, name: str) -> int:
+        """Percentage of the last startup's tracked time spent before this phase."""
+        tracked = [
+            (phase, seconds)
+            for phase, seconds in self.last_phases
+            if phase not in self.UNTRACKED_PHASES
+        ]
+        total = sum(seconds for _, seconds in tracked)
+        if total <= 0 or not set(self.DEFAULT_PROGRESS) <= set(dict(tracked)):
+            return self.DEFAULT_PROGRESS.get(name, 0)
+        elapsed = 0.0
+        for phase, seconds in tracked:
+            if phase == name:
+                break
+            elapsed += seconds
+        return int(elapsed / total * 100)
+
+    def finish(self) -> None:
+        if self.finished:
+            return
+        self.finished = True
+        total_seconds = time.perf_counter() - self.start_time
+        self._save_timings()
+        if not self.enabled:
+            return
+
+        self.profiler.disable()
+        self.import_timer.uninstall()
+        stats_path = f"{os.path.splitext(self.report_path)[0]}_stats.txt"
+        app_root = os.path.dirname(os.path.abspath(__file__))
+        self.profiler.write_profiling_stats_to_file(stats_path, app_root)
+
+        report = {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "frozen": getattr(sys, "frozen", False),
+            "total_seconds": round(total_seconds, 6),
+            "phases": [
+                {"name": name, "seconds": round(seconds, 6)}
+                for name, seconds in self.phases.items()
+            ],
+            "imported_modules": len(self.import_timer.cumulative),
+            "slowest_imports": self.import_timer.get_slowest(self.SLOWEST_IMPORTS),
+            "profiling_stats": os.path.abspath(stats_path),
+        }
+        self._write_json(self.report_path, report)
+        print(f"Startup profile written to {os.path.abspath(self.report_path)}")
+
+    def _load_last_phases(self) -> list[tuple[str, float]]:
+        try:
+            with open(self.timings_path, "r", encoding="utf-8") as file:
+                data = json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return []
+        if data.get("version") != self.TIMINGS_VERSION:
+            return []
+        return list(data.get("phases", {}).items())
+
+    def _save_timings(self) -> None:
+        data = {
+            "version": self.TIMINGS_VERSION,
+            "phases": {
+                name: round(seconds, 6) for name, seconds in self.phases.items()
+            },
+        }
+        try:
+            self._write_json(self.timings_path, data)
+        except OSError as e:
+            print(f"Failed to save startup timings: {e}")
+
+    @staticmethod
+    def _write_json(file_path: str, data: dict) -> None:
+        temp_path = f"{file_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file, indent=4)
+        os.replace(temp_path, file_path)
@@ -0,0 +1,74 @@
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("PyQt6")
+
+from main_window.main_widget.pictograph_key_generator import PictographKeyGenerator
+from placement_managers.placement_solver.placement_solver import PlacementSolver
+
+
+def make_pictograph_dict(blue_turns) -> dict:
+    return {
+        "letter": "A",
+        "start_pos": "alpha1",
+        "end_pos": "alpha3",
+        "timing": "split",
+        "direction": "same",
+        "blue_attributes": {
+            "motion_type": "pro",
+            "start_ori": "in",
+            "prop_rot_dir": "cw",
+            "start_loc": "s",
+            "end_loc": "w",
+            "turns": blue_turns,
+        },
+        "red_attributes": {
+            "motion_type": "pro",
+            "start_ori": "in",
+            "prop_rot_dir": "cw",
+            "start_loc": "n",
+            "end_loc": "e",
+            "turns": 0,
+        },
+    }
+
+
+@pytest.fixture
+def solver(monkeypatch) -> PlacementSolver:
+    main_widget = SimpleNamespace(
+        settings_manager=SimpleNamespace(
+            global_settings=SimpleNamespace(get_grid_mode=lambda: "diamond")
+        ),
+        prop_type="Staff",
+    )
+    main_widget.pictograph_key_generator = PictographKeyGenerator(main_widget)
+    solver = PlacementSolver(main_widget)
+    solved = []
+
+    def fake_solve(pictograph_dict, grid_mode, prop_type):
+        solved.append(pictograph_dict["blue_attributes"]["turns"])
+        return object()
+
+    monkeypatch.setattr(solver, "_solve", fake_solve)
+    solver.solved = solved
+    return solver
+
+
+def test_turns_are_part_of_the_memo_key(solver: PlacementSolver) -> None:
+    no_turns = solver.solve(make_pictograph_dict(0))
+    one_turn = solver.solve(make_pictograph_dict(1))
+
+    assert no_turns is not one_turn
+    assert solver.solved == [0, 1]
+    assert solver.solve(make_pictograph_dict(0)) is no_turns
+    assert solver.solved == [0, 1]
+
+
+def test_start_ori_is_part_of_the_memo_key(solver: PlacementSolver) -> None:
+    in_dict = make_pictograph_dict(0)
+    out_dict = make_pictograph_dict(0)
+    out_dict["blue_attributes"]["start_ori"] = "out"
+
+    assert solver.solve(in_dict) is not solver.solve(out_dict)
+    assert len(solver.solved) == 2